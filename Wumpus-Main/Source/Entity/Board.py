@@ -17,7 +17,10 @@ from Entity.Wall import Wall
 from Entity.Wumpus import Wumpus
 from Run.Action import Action
 from Run.HybridAgent import HybridAgent
+from Run.MapCache import load_map
 from Run.RandomAgentSimple import RandomAgentBaseline
+from Run.SolveCache import solve_cache
+from Run.WumpusMap import WumpusMap
 from constants import *
 
 DDX = [(0, 1), (0, -1), (-1, 0), (1, 0)]
@@ -63,21 +66,25 @@ class Board(object):
         self.Wumpus = []
         self.Agent = None
         self.Door = None
+        self.exit_pos = None  # Exit door (row, col) of the map being played
         self.Breezes = []
         self.Stenches = []
         self.Arrow = None
         # AGENT SELECTION: Change this to switch between agents
         use_random_agent = False  # Set to True for Random Agent, False for Hybrid Agent
-        
+        # filename may be an in-memory WumpusMap, handed to the agent and readMapInFile as is
+        map_source = filename if isinstance(filename, WumpusMap) else f'{ROOT_INPUT}{filename}'
+
         if use_random_agent:
             # Random Agent Baseline for comparison
-            self.action_list = RandomAgentBaseline(f'{ROOT_INPUT}{filename}',
+            self.action_list = RandomAgentBaseline(map_source,
                                         f'{ROOT_OUTPUT}{outputfile}').solve()
             print("🎲 Using Random Agent Baseline")
         else:
-            # Hybrid Intelligent Agent
-            self.action_list = HybridAgent(f'{ROOT_INPUT}{filename}',
-                                        f'{ROOT_OUTPUT}{outputfile}').solve()
+            # Hybrid Intelligent Agent; restarting or replaying the same map reuses its cached action list
+            wumpus_map = filename if isinstance(filename, WumpusMap) else load_map(map_source)
+            self.action_list = solve_cache().solve(
+                wumpus_map, 'hybrid', lambda: HybridAgent(map_source, f'{ROOT_OUTPUT}{outputfile}').solve())
 
         self.createBoardGame(filename)
 
@@ -121,9 +128,10 @@ class Board(object):
                 if STENCH in cell:
                     self.Stenches.append(Stench(row, col))
         
-        # Always create Door at bottom-left corner (N-1, 0)
-        from constants import EXIT_DOOR_ROW, EXIT_DOOR_COL
-        self.Door = Door(EXIT_DOOR_ROW, EXIT_DOOR_COL)
+        # Door at the map's own exit (default_exit(N), bottom-left, for map files), the one the agents solve for
+        wumpus_map = filename if isinstance(filename, WumpusMap) else load_map(f'{ROOT_INPUT}{filename}')
+        self.exit_pos = wumpus_map.exit
+        self.Door = Door(*self.exit_pos)
 
     def draw(self, screen: pygame):
         pygame.draw.rect(screen, PURPLE, pygame.Rect(self.width + MARGIN['LEFT'] - self.spacing, MARGIN['TOP'] +
@@ -274,8 +282,7 @@ class Board(object):
                     return False  # End game immediately
             
             # NEW: Check if agent reached exit door after moving
-            from constants import EXIT_DOOR_ROW, EXIT_DOOR_COL
-            if self.Agent.row == EXIT_DOOR_ROW and self.Agent.col == EXIT_DOOR_COL:
+            if (self.Agent.row, self.Agent.col) == self.exit_pos:
                 # Agent reached exit door - Award points before ending!
                 if self.Agent.has_gold:
                     # Only award 1000 bonus points for collecting gold and escaping
@@ -0,0 +1,294 @@
+"""
+Benchmark suite - every agent and inference backend over a fixed, seeded map corpus
+Reports latency/action/score/KB query percentiles as JSON and flags regressions against a baseline
+"""
+
+import json
+import math
+import os
+import time
+from typing import List
+
+from Experiment.Runner import AGENTS, BACKENDS, PLANNER_AGENTS, run_games
+from Run.PathPlanner import DEFAULT_PLANNER_MODE
+from Run.RandMap import GENERATOR_VERSION
+from constants import ROOT_OUTPUT
+
+DEFAULT_CORPUS = {
+    'sizes': [4, 8, 16, 32, 64, 128],
+    'num_wumpus': [1, 2, 4],
+    'pit_densities': [0.1, 0.2],
+    'maps_per_config': 2,
+    'seed': 2024
+}
+
+PERCENTILES = (50, 95, 99)
+
+# Solve time is only compared for groups with at least this many games in both reports,
+# and must grow by more than MIN_TIME_DELTA seconds: below that, millisecond games measure noise
+MIN_TIME_GAMES = 30
+MIN_TIME_DELTA = 0.005
+
+# Metric -> direction that counts as a regression ('up' = larger is worse)
+REGRESSION_METRICS = {
+    'time': 'up',
+    'actions': 'up',
+    'kb_queries': 'up',
+    'score': 'down'
+}
+
+
+def make_corpus(corpus: dict = None) -> List[dict]:
+    """
+    Map specs of the corpus; each spec's seed is fixed by its position, so the corpus is the same on every run
+
+    Returns:
+        List of dicts with map_id, grid_size, num_wumpus, pit_density and seed
+    """
+    corpus = {**DEFAULT_CORPUS, **(corpus or {})}
+    maps = []
+    for N in corpus['sizes']:
+        for K in corpus['num_wumpus']:
+            for p in corpus['pit_densities']:
+                for replica in range(corpus['maps_per_config']):
+                    maps.append({
+                        'map_id': len(maps),
+                        'grid_size': N,
+                        'num_wumpus': K,
+                        'pit_density': p,
+                        'seed': corpus['seed'] * 1000003 + len(maps)
+                    })
+    return maps
+
+
+def make_tasks(maps: List[dict], agents: List[str], backends: List[str], time_limit: float = None,
+               memory_limit: float = None, solve_cache: str = None, analyze: bool = True,
+               planner_modes: List[str] = (DEFAULT_PLANNER_MODE,)) -> List[dict]:
+    """
+    One Runner task per (map, agent, backend, planner mode); solve_cache is a Run.SolveCache directory or None
+
+    Agents without a path planner (not in Runner.PLANNER_AGENTS) only run with the first planner mode.
+
+    With analyze, only the first task of each map runs MapAnalysis (build_report shares its
+    difficulty with the map's other tasks), since analysis outweighs generation at large N.
+    """
+    tasks = []
+    for spec in maps:
+        for agent in agents:
+            for backend in backends:
+                for planner_mode in planner_modes if agent in PLANNER_AGENTS else planner_modes[:1]:
+                    tasks.append({
+                        'test': spec['map_id'],
+                        'role': agent,
+                        'agent': agent,
+                        'backend': backend,
+                        'planner_mode': planner_mode,
+                        'seed': spec['seed'],
+                        'grid_size': spec['grid_size'],
+                        'num_wumpus': spec['num_wumpus'],
+                        'pit_density': spec['pit_density'],
+                        'generator_version': GENERATOR_VERSION,
+                        'time_limit': time_limit,
+                        'memory_limit': memory_limit,
+                        'solve_cache': solve_cache,
+                        'analyze': (analyze and agent == agents[0] and backend == backends[0]
+                                    and planner_mode == planner_modes[0])
+                    })
+    return tasks
+
+
+def group_key(task: dict) -> str:
+    """Report group of a task: agent/backend, plus /planner_mode when not the default planner"""
+    key = f"{task['agent']}/{task['backend']}"
+    planner_mode = task.get('planner_mode', DEFAULT_PLANNER_MODE)
+    return key if planner_mode == DEFAULT_PLANNER_MODE else f"{key}/{planner_mode}"
+
+
+def percentile(values: list, q: float) -> float:
+    """Nearest-rank percentile (q in 0..100) of a non-empty list"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def describe(values: list) -> dict:
+    """Mean and p50/p95/p99 of a metric"""
+    if not values:
+        return {}
+    summary = {'mean': sum(values) / len(values)}
+    for q in PERCENTILES:
+        summary[f'p{q}'] = percentile(values, q)
+    return summary
+
+
+def median_interval(values: list) -> list:
+    """
+    Distribution-free ~95% confidence interval of the median: the order statistics at ranks
+    n/2 -/+ 1.96 * sqrt(n) / 2 (binomial approximation), clamped to the data
+    """
+    ordered = sorted(values)
+    n = len(ordered)
+    half_width = 1.96 * math.sqrt(n) / 2
+    low = max(1, math.floor(n / 2 - half_width))
+    high = min(n, math.ceil(n / 2 + half_width + 1))
+    return [ordered[low - 1], ordered[high - 1]]
+
+
+def summarize(games: List[dict]) -> dict:
+    """Outcome counts and metric percentiles for one group of games"""
+    outcomes = {}
+    for game in games:
+        outcomes[game['outcome']] = outcomes.get(game['outcome'], 0) + 1
+    summary = {
+        'games': len(games),
+        'win_rate': outcomes.get('WIN', 0) / len(games) if games else 0.0,
+        'outcomes': outcomes
+    }
+    for metric in REGRESSION_METRICS:
+        summary[metric] = describe([game[metric] for game in games])
+    if games:
+        summary['time']['p50_ci'] = median_interval([game['time'] for game in games])
+    return summary
+
+
+def build_report(corpus: dict, tasks: List[dict], results: List[dict], elapsed: float) -> dict:
+    """
+    Group results by agent/backend (see group_key), overall, per grid size and per map difficulty (see Run.MapAnalysis)
+
+    Returns:
+        {'corpus': ..., 'elapsed': ..., 'results': {'agent/backend': {'all': summary, 'by_size': {N: summary},
+                                                                      'by_difficulty': {difficulty: summary}}}}
+    """
+    difficulties = {result['test']: result['difficulty'] for result in results if result.get('difficulty') is not None}
+    groups = {}
+    for task, result in zip(tasks, results):
+        result = {**result, 'difficulty': difficulties.get(task['test'])}  # Analyzed in one task per map
+        key = group_key(task)
+        group = groups.setdefault(key, {'all': [], 'by_size': {}, 'by_difficulty': {}})
+        group['all'].append(result)
+        group['by_size'].setdefault(str(task['grid_size']), []).append(result)
+        group['by_difficulty'].setdefault(str(result.get('difficulty')), []).append(result)
+
+    return {
+        'corpus': {**corpus, 'generator_version': GENERATOR_VERSION},
+        'games': len(results),
+        'elapsed': elapsed,
+        'results': {
+            key: {
+                'all': summarize(group['all']),
+                'by_size': {size: summarize(games) for size, games in group['by_size'].items()},
+                'by_difficulty': {difficulty: summarize(games)
+                                  for difficulty, games in sorted(group['by_difficulty'].items())}
+            }
+            for key, group in sorted(groups.items())
+        }
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float = 0.1, time_tolerance: float = 0.5,
+            min_time_delta: float = MIN_TIME_DELTA, min_time_games: int = MIN_TIME_GAMES) -> List[str]:
+    """
+    Compare a report with a stored baseline report
+
+    A metric regresses when a percentile moves the wrong way by more than tolerance
+    (relative to the baseline). Action, score and KB counts are deterministic for a seeded
+    corpus; solve time is not, so only its median is checked, in groups with at least
+    min_time_games games on both sides, and it regresses only when its confidence interval
+    lies wholly above the baseline's and it grew by more than time_tolerance (relative) and
+    min_time_delta seconds. A drop in win rate is always flagged. A baseline
+    from another map generator version (or from before the version was recorded) describes
+    different maps for the same seeds and raises ValueError instead.
+
+    Returns:
+        One message per regression, empty when nothing regressed
+    """
+    version = report['corpus'].get('generator_version')
+    baseline_version = baseline.get('corpus', {}).get('generator_version')
+    if baseline_version != version:
+        raise ValueError(f"baseline maps come from generator version {baseline_version}, "
+                         f"this run's from {version}; record a new baseline")
+    regressions = []
+    for key, current in report['results'].items():
+        previous = baseline.get('results', {}).get(key)
+        if previous is None:
+            continue
+        scopes = [('all', current['all'], previous['all'])]
+        scopes += [(f"N={size}", summary, previous['by_size'][size])
+                   for size, summary in current['by_size'].items() if size in previous.get('by_size', {})]
+        scopes += [(difficulty, summary, previous['by_difficulty'][difficulty])
+                   for difficulty, summary in current.get('by_difficulty', {}).items()
+                   if difficulty in previous.get('by_difficulty', {})]
+
+        for scope, now, before in scopes:
+            if now['win_rate'] < before['win_rate'] - 1e-9:
+                regressions.append(f"{key} {scope}: win_rate {before['win_rate']:.2f} -> {now['win_rate']:.2f}")
+            if regressed_time(now, before, time_tolerance, min_time_delta, min_time_games):
+                regressions.append(f"{key} {scope}: time p50 {before['time']['p50']:.6g} -> "
+                                   f"{now['time']['p50']:.6g} (95% CI {now['time']['p50_ci'][0]:.6g}.."
+                                   f"{now['time']['p50_ci'][1]:.6g} vs {before['time']['p50_ci'][0]:.6g}.."
+                                   f"{before['time']['p50_ci'][1]:.6g})")
+            for metric, direction in REGRESSION_METRICS.items():
+                if metric == 'time':
+                    continue
+                for q in PERCENTILES:
+                    stat = f'p{q}'
+                    if stat not in now[metric] or stat not in before[metric]:
+                        continue
+                    old, new = before[metric][stat], now[metric][stat]
+                    delta = new - old if direction == 'up' else old - new
+                    if delta > abs(old) * tolerance and delta > 0:
+                        regressions.append(f"{key} {scope}: {metric} {stat} {old:.6g} -> {new:.6g}")
+    return regressions
+
+
+def regressed_time(now: dict, before: dict, time_tolerance: float, min_time_delta: float,
+                   min_time_games: int) -> bool:
+    """Whether a group's median solve time grew beyond noise (see compare)"""
+    if min(now['games'], before['games']) < min_time_games:
+        return False
+    if 'p50_ci' not in now['time'] or 'p50_ci' not in before['time']:
+        return False  # Baseline recorded before confidence intervals were stored
+    old, new = before['time']['p50'], now['time']['p50']
+    if now['time']['p50_ci'][0] <= before['time']['p50_ci'][1]:
+        return False
+    return new - old > max(abs(old) * time_tolerance, min_time_delta)
+
+
+def run_benchmark(corpus: dict = None, agents: List[str] = None, backends: List[str] = None,
+                  workers: int = None, time_limit: float = 30.0, memory_limit: float = None,
+                  output_file: str = ROOT_OUTPUT + "benchmark.json", solve_cache: str = None,
+                  planner_modes: List[str] = None) -> dict:
+    """
+    Run every agent and backend over the seeded corpus and write the JSON report
+
+    Args:
+        corpus: Corpus parameters, missing keys come from DEFAULT_CORPUS
+        agents: Agent names (default every agent in Runner.AGENTS)
+        backends: Inference backend names (default every backend in Runner.BACKENDS)
+        workers: Number of worker processes (None = CPU count)
+        time_limit: Per-game wall-clock limit in seconds, None = unlimited
+        memory_limit: Per-worker RSS limit in MB, None = unlimited
+        output_file: JSON report path, None to skip writing
+        solve_cache: Run.SolveCache directory; deterministic agents' solves (and their measured
+                     time and KB counters) are replayed from it when present, None = always solve
+        planner_modes: Run.PathPlanner modes to run agents with (default only DEFAULT_PLANNER_MODE);
+                       other modes report under 'agent/backend/mode'
+
+    Returns:
+        The report dict
+    """
+    corpus = {**DEFAULT_CORPUS, **(corpus or {})}
+    tasks = make_tasks(make_corpus(corpus), agents or sorted(AGENTS), backends or sorted(BACKENDS),
+                       time_limit, memory_limit, solve_cache,
+                       planner_modes=planner_modes or [DEFAULT_PLANNER_MODE])
+
+    start_time = time.perf_counter()
+    results = run_games(tasks, workers)
+    report = build_report(corpus, tasks, results, time.perf_counter() - start_time)
+
+    if output_file:
+        os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+        print(f"Benchmark saved to: {output_file}")
+    return report
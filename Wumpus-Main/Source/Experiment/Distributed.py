@@ -0,0 +1,273 @@
+"""
+Distributed runner - a coordinator hands out game tasks over a socket, workers pull and play them
+Workers can be local processes or other machines running run_worker.py; lost or slow tasks are re-queued
+
+Protocol (multiprocessing.connection messages, authenticated with a shared key):
+    worker -> coordinator: ('request', name) or ('result', name, task_id, result)
+    coordinator -> worker: ('task', task_id, task), ('wait', seconds) or ('stop',)
+
+Messages are pickles, so anyone holding the key can run code on the coordinator. The fixed
+DEFAULT_AUTHKEY is only accepted on loopback addresses and Unix sockets; elsewhere the key must
+be given, or run_distributed generates a random one and prints it.
+"""
+
+import ipaddress
+import multiprocessing
+import secrets
+import socket
+import threading
+import time
+from collections import deque
+from multiprocessing.connection import Client, Listener
+from typing import Callable, List, Optional
+
+from Experiment.Runner import play_game, run_games
+
+DEFAULT_AUTHKEY = b'wumpus'  # Well known: loopback and Unix socket coordinators only
+
+
+def parse_address(text: str):
+    """'host:port' -> (host, port) for TCP, anything containing '/' -> Unix socket path"""
+    if '/' in text:
+        return text
+    host, _, port = text.rpartition(':')
+    return host or '127.0.0.1', int(port)
+
+
+def is_local_address(address) -> bool:
+    """True for Unix socket paths and loopback hosts, which other machines cannot reach"""
+    if isinstance(address, str):
+        return True
+    host = address[0]
+    if host == 'localhost':
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False  # Host name or wildcard, reachable from the network
+
+
+def coordinator_authkey(address, authkey: bytes = None) -> bytes:
+    """
+    Key a coordinator on address should use: authkey when given, DEFAULT_AUTHKEY on a local
+    address, else a fresh random key that is printed so it can be passed to run_worker.py
+    """
+    if authkey is not None:
+        return authkey
+    if is_local_address(address):
+        return DEFAULT_AUTHKEY
+    authkey = secrets.token_hex(16).encode()
+    print(f"Generated worker authkey: {authkey.decode()} (run_worker.py --authkey {authkey.decode()})")
+    return authkey
+
+
+class Coordinator:
+    """
+    Task queue served over a Listener
+
+    Every task handed out is leased to the worker that took it. A lease older than
+    lease_timeout, or held by a worker whose connection drops, puts the task back in the
+    queue. When the queue is empty an idle worker steals (re-runs) the oldest task leased
+    for more than steal_after seconds. The first result for a task wins, later ones are ignored.
+    DEFAULT_AUTHKEY is refused on an address other machines can reach.
+    """
+
+    def __init__(self, tasks: List[dict], address=('127.0.0.1', 0), authkey: bytes = DEFAULT_AUTHKEY,
+                 lease_timeout: float = 600.0, steal_after: float = 30.0, keep_results: bool = True):
+        if authkey == DEFAULT_AUTHKEY and not is_local_address(address):
+            raise ValueError(f"the default authkey is only allowed on loopback addresses, not {address}; "
+                             f"pass an explicit authkey")
+        self.tasks = tasks
+        self.keep_results = keep_results
+        self.listener = Listener(address, authkey=authkey)
+        self.address = self.listener.address
+        self.lease_timeout = lease_timeout
+        self.steal_after = steal_after
+        self.queue = deque(range(len(tasks)))
+        self.leases = {}  # task_id -> {worker name: lease start}
+        self.results = {}  # task_id -> result
+        self.condition = threading.Condition()
+        self.on_result = None
+        self.requeued = 0
+        self.stolen = 0
+        self.workers = set()
+
+    @property
+    def done(self) -> bool:
+        return len(self.results) == len(self.tasks)
+
+    def next_task(self, worker: str) -> Optional[int]:
+        """Lease the next queued task to worker, or steal a slow one; None when there is nothing to do"""
+        now = time.monotonic()
+        while self.queue:
+            task_id = self.queue.popleft()
+            if task_id not in self.results:
+                self.leases.setdefault(task_id, {})[worker] = now
+                return task_id
+
+        candidates = [(min(holders.values()), task_id) for task_id, holders in self.leases.items()
+                      if task_id not in self.results and worker not in holders and holders]
+        if candidates:
+            started, task_id = min(candidates)
+            if now - started > self.steal_after:
+                self.leases[task_id][worker] = now
+                self.stolen += 1
+                return task_id
+        return None
+
+    def release(self, task_id: int, worker: str):
+        """Drop a worker's lease; re-queue the task if nobody else is running it"""
+        holders = self.leases.get(task_id, {})
+        holders.pop(worker, None)
+        if not holders:
+            self.leases.pop(task_id, None)
+            if task_id not in self.results:
+                self.queue.appendleft(task_id)
+                self.requeued += 1
+
+    def record(self, task_id: int, worker: str, result: dict):
+        if task_id not in self.results:
+            self.results[task_id] = result if self.keep_results else None
+            if self.on_result is not None:
+                self.on_result(result)
+        self.leases.pop(task_id, None)
+        self.condition.notify_all()
+
+    def handle(self, connection):
+        """Serve one worker connection until it disconnects or is told to stop"""
+        worker = None
+        try:
+            while True:
+                message = connection.recv()
+                worker = message[1]
+                with self.condition:
+                    self.workers.add(worker)
+                    if message[0] == 'result':
+                        self.record(message[2], worker, message[3])
+                    if self.done:
+                        reply = ('stop',)
+                    else:
+                        task_id = self.next_task(worker)
+                        reply = ('wait', 0.5) if task_id is None else ('task', task_id, self.tasks[task_id])
+                connection.send(reply)
+                if reply[0] == 'stop':
+                    break
+        except (EOFError, OSError):
+            pass
+        finally:
+            with self.condition:
+                for task_id in [task_id for task_id, holders in self.leases.items() if worker in holders]:
+                    self.release(task_id, worker)
+                self.condition.notify_all()
+            connection.close()
+
+    def accept_loop(self):
+        while True:
+            try:
+                connection = self.listener.accept()
+            except (OSError, EOFError, multiprocessing.AuthenticationError):
+                if self.done:
+                    return
+                continue
+            threading.Thread(target=self.handle, args=(connection,), daemon=True).start()
+
+    def serve(self, on_result: Callable[[dict], None] = None) -> List[dict]:
+        """Block until every task has a result; results come back in task order (empty without keep_results)"""
+        self.on_result = on_result
+        threading.Thread(target=self.accept_loop, daemon=True).start()
+        with self.condition:
+            while not self.done:
+                self.condition.wait(timeout=1.0)
+                now = time.monotonic()
+                for task_id, holders in list(self.leases.items()):
+                    for worker, started in list(holders.items()):
+                        if now - started > self.lease_timeout:
+                            self.release(task_id, worker)
+        # Give connected workers a moment to receive their stop message before closing
+        time.sleep(0.2)
+        self.listener.close()
+        if not self.keep_results:
+            return []
+        return [self.results[task_id] for task_id in range(len(self.tasks))]
+
+
+def connect(address, authkey: bytes, wait: float):
+    """Client connection, retrying for up to wait seconds so workers can start before the coordinator"""
+    deadline = time.monotonic() + wait
+    while True:
+        try:
+            return Client(address, authkey=authkey)
+        except (ConnectionRefusedError, FileNotFoundError):
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.5)
+
+
+def worker_main(address, authkey: bytes = DEFAULT_AUTHKEY, name: str = None,
+                game_function: Callable[[dict], dict] = play_game, wait: float = 60.0):
+    """Pull tasks from a coordinator and play them until told to stop"""
+    name = name or f"{socket.gethostname()}-{multiprocessing.current_process().pid}"
+    try:
+        connection = connect(address, authkey, wait)
+    except OSError as error:
+        print(f"Worker {name}: no coordinator at {address} ({error})")
+        return
+    try:
+        connection.send(('request', name))
+        while True:
+            message = connection.recv()
+            if message[0] == 'stop':
+                break
+            if message[0] == 'wait':
+                time.sleep(message[1])
+                connection.send(('request', name))
+            else:
+                _, task_id, task = message
+                connection.send(('result', name, task_id, game_function(task)))
+    except (EOFError, OSError):
+        pass  # Coordinator went away
+    finally:
+        connection.close()
+
+
+def run_distributed(tasks: List[dict], address=None, authkey: bytes = None,
+                    local_workers: Optional[int] = None, on_result: Callable[[dict], None] = None,
+                    keep_results: bool = True, lease_timeout: float = 600.0, steal_after: float = 30.0) -> List[dict]:
+    """
+    Play tasks through a Coordinator; results come back in task order
+
+    Args:
+        tasks: Runner tasks
+        address: Listen address ('host:port', (host, port) or a Unix socket path); None runs a
+                 plain local process pool (Runner.run_games) instead
+        authkey: Shared key workers must present (None = see coordinator_authkey)
+        local_workers: Worker processes started on this machine (None = CPU count, 0 = remote only)
+        on_result: Called with each result as it arrives (one at a time)
+        keep_results: Return the results; streaming callers pass False and rely on on_result
+        lease_timeout: Seconds before a task held by an unresponsive worker is re-queued
+        steal_after: Seconds before idle workers start re-running a slow task
+    """
+    if address is None:
+        return run_games(tasks, local_workers, on_result=on_result, keep_results=keep_results)
+    if isinstance(address, str):
+        address = parse_address(address)
+    authkey = coordinator_authkey(address, authkey)
+
+    coordinator = Coordinator(tasks, address, authkey, lease_timeout, steal_after, keep_results)
+    print(f"Coordinator listening on {coordinator.address}")
+    count = multiprocessing.cpu_count() if local_workers is None else local_workers
+    processes = [multiprocessing.Process(target=worker_main, args=(coordinator.address, authkey, f"local-{index}"),
+                                         daemon=True)
+                 for index in range(count)]
+    for process in processes:
+        process.start()
+    try:
+        results = coordinator.serve(on_result)
+    finally:
+        for process in processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+    if coordinator.requeued or coordinator.stolen:
+        print(f"Re-queued {coordinator.requeued} tasks, stole {coordinator.stolen}")
+    return results
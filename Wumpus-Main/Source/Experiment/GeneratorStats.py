@@ -0,0 +1,102 @@
+"""
+Map generator quality - the generation stats of many maps aggregated per (N, K, p)
+Shows where placements fall short, how much room the safe path leaves, difficulty and throughput
+"""
+
+import json
+import os
+import time
+from collections import Counter
+from typing import List
+
+from Experiment.Benchmark import describe
+from Run.RandMap import random_corpus
+from constants import ROOT_OUTPUT
+
+DEFAULT_GRID = {
+    'sizes': [4, 8, 16, 32],
+    'num_wumpus': [1, 2, 4],
+    'pit_densities': [0.1, 0.2, 0.3],
+    'maps_per_config': 200,
+    'seed': 2024
+}
+
+
+def fill_rate(stats: List[dict], entity: str) -> float:
+    """Placed / requested count of an entity over a batch (1.0 when nothing was requested)"""
+    requested = sum(row[f'requested_{entity}'] for row in stats)
+    return sum(row[f'placed_{entity}'] for row in stats) / requested if requested else 1.0
+
+
+def aggregate(maps: list) -> dict:
+    """
+    Summary of the metadata['generation'] stats (and difficulty, when analyzed) of a batch of maps
+
+    A map is degenerate when some requested entity could not be placed or it got no gold.
+    maps_per_second counts generation time only, not the difficulty analysis.
+    """
+    stats = [wumpus_map.metadata['generation'] for wumpus_map in maps]
+    degenerate = sum(row['rejections'] > 0 or row['placed_golds'] == 0 for row in stats)
+    generation_time = sum(row['time'] for row in stats)
+    summary = {
+        'maps': len(stats),
+        'degenerate': degenerate,
+        'degenerate_rate': degenerate / len(stats) if stats else 0.0,
+        'rejections': sum(row['rejections'] for row in stats),
+        'wumpus_fill': fill_rate(stats, 'wumpus'),
+        'pit_fill': fill_rate(stats, 'pits'),
+        'gold_fill': fill_rate(stats, 'golds'),
+        'protected_cells': describe([row['protected_cells'] for row in stats]),
+        'free_cells': describe([row['free_cells'] for row in stats]),
+        'time': describe([row['time'] for row in stats]),
+        'maps_per_second': len(stats) / generation_time if generation_time else 0.0
+    }
+    difficulties = Counter(wumpus_map.metadata['difficulty'] for wumpus_map in maps
+                           if 'difficulty' in wumpus_map.metadata)
+    if difficulties:
+        summary['difficulty'] = dict(sorted(difficulties.items()))
+    return summary
+
+
+def generation_sweep(grid: dict = None, workers: int = 1, analyze: bool = True,
+                     output_file: str = ROOT_OUTPUT + "generatorStats.json") -> List[dict]:
+    """
+    Generate maps_per_config maps for every (N, K, p) of the grid and aggregate each batch
+
+    Batches come from RandMap.random_corpus with a seed fixed by the batch's position, so a
+    sweep is the same on every run and with any number of workers.
+
+    Returns:
+        One row per batch: grid_size, num_wumpus, pit_density, wall time plus aggregate()'s fields
+    """
+    grid = {**DEFAULT_GRID, **(grid or {})}
+    rows = []
+    for N in grid['sizes']:
+        for K in grid['num_wumpus']:
+            for p in grid['pit_densities']:
+                start_time = time.perf_counter()
+                maps = random_corpus(grid['maps_per_config'], N, K, p, seed=grid['seed'] * 1000003 + len(rows),
+                                     workers=workers, analyze=analyze)
+                rows.append({'grid_size': N, 'num_wumpus': K, 'pit_density': p,
+                             'wall_time': time.perf_counter() - start_time, **aggregate(maps)})
+
+    if output_file:
+        os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as file:
+            json.dump({'grid': grid, 'batches': rows}, file, indent=2)
+        print(f"Generator stats saved to: {output_file}")
+    return rows
+
+
+def format_table(rows: List[dict]) -> List[str]:
+    """One line per batch: fill rates, degenerate share, protected cells, throughput and difficulty mix"""
+    lines = [f"{'N':>4} {'K':>3} {'p':>5} | {'wumpus':>6} {'pits':>6} {'gold':>6} {'degen':>6} | "
+             f"{'protected':>9} {'maps/s':>9} | difficulty",
+             "-" * 90]
+    for row in rows:
+        difficulty = " ".join(f"{name}={count}" for name, count in row.get('difficulty', {}).items())
+        lines.append(f"{row['grid_size']:>4} {row['num_wumpus']:>3} {row['pit_density']:>5} | "
+                     f"{row['wumpus_fill']:>6.2f} {row['pit_fill']:>6.2f} {row['gold_fill']:>6.2f} "
+                     f"{row['degenerate_rate']:>6.2f} | {row['protected_cells'].get('mean', 0):>9.1f} "
+                     f"{row['maps_per_second']:>9.0f} | {difficulty}")
+    return lines
@@ -0,0 +1,215 @@
+"""
+Online statistics - per-game incremental aggregation for experiment reports
+Welford mean/variance, P-square streaming quantiles and Wilson score intervals, plus
+an agent-vs-agent monitor that prints live progress and decides when to stop early
+"""
+
+import math
+import sys
+from typing import Tuple
+
+# Two-sided normal quantiles for the confidence levels used in reports
+Z_95 = 1.959964
+Z_99 = 2.575829
+
+
+class Welford:
+    """Running count, mean, variance, min and max in O(1) memory"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def average(self, default: float = -1) -> float:
+        return self.mean if self.count else default
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0 with fewer than two values)"""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stderr(self) -> float:
+        return math.sqrt(self.variance / self.count) if self.count else math.inf
+
+    def interval(self, z: float = Z_95) -> Tuple[float, float]:
+        """Normal-approximation confidence interval of the mean"""
+        half = z * self.stderr
+        return self.mean - half, self.mean + half
+
+
+class P2Quantile:
+    """
+    Streaming estimate of one quantile with the P-square algorithm (Jain & Chlamtac, 1985)
+
+    Keeps five markers whose heights follow the quantile with piecewise-parabolic
+    adjustments; exact for the first five values, O(1) memory afterwards.
+    """
+
+    def __init__(self, q: float):
+        self.q = q
+        self.heights = []
+        self.positions = [1, 2, 3, 4, 5]
+        self.desired = [1, 1 + 2 * q, 1 + 4 * q, 3 + 2 * q, 5]
+        self.increments = [0, q / 2, q, (1 + q) / 2, 1]
+
+    def add(self, value: float):
+        heights = self.heights
+        if len(heights) < 5:
+            heights.append(value)
+            heights.sort()
+            return
+
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = next(i for i in range(4) if heights[i] <= value < heights[i + 1])
+
+        for i in range(cell + 1, 5):
+            self.positions[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        # Move the three middle markers towards their desired positions
+        for i in range(1, 4):
+            offset = self.desired[i] - self.positions[i]
+            if ((offset >= 1 and self.positions[i + 1] - self.positions[i] > 1) or
+                    (offset <= -1 and self.positions[i - 1] - self.positions[i] < -1)):
+                step = 1 if offset > 0 else -1
+                height = self.parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = self.linear(i, step)
+                heights[i] = height
+                self.positions[i] += step
+
+    def parabolic(self, i: int, step: int) -> float:
+        h, n = self.heights, self.positions
+        return h[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (h[i + 1] - h[i]) / (n[i + 1] - n[i]) +
+            (n[i + 1] - n[i] - step) * (h[i] - h[i - 1]) / (n[i] - n[i - 1]))
+
+    def linear(self, i: int, step: int) -> float:
+        h, n = self.heights, self.positions
+        return h[i] + step * (h[i + step] - h[i]) / (n[i + step] - n[i])
+
+    def value(self, default: float = -1) -> float:
+        """Current estimate (nearest rank while fewer than five values were seen)"""
+        if not self.heights:
+            return default
+        if len(self.heights) < 5:
+            rank = max(1, math.ceil(self.q * len(self.heights)))
+            return self.heights[rank - 1]
+        return self.heights[2]
+
+
+def wilson_interval(successes: int, count: int, z: float = Z_95) -> Tuple[float, float]:
+    """Wilson score interval of a proportion, well behaved near 0 and 1 and for small counts"""
+    if count == 0:
+        return 0.0, 1.0
+    p = successes / count
+    denominator = 1 + z * z / count
+    center = (p + z * z / (2 * count)) / denominator
+    half = z * math.sqrt(p * (1 - p) / count + z * z / (4 * count * count)) / denominator
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+class AgentStats:
+    """Everything the comparison report needs about one agent, updated one game at a time"""
+
+    def __init__(self):
+        self.games = 0
+        self.outcomes = {}
+        self.score = Welford()
+        self.time = Welford()
+        self.actions = Welford()
+        self.time_p50 = P2Quantile(0.5)
+        self.time_p95 = P2Quantile(0.95)
+        self.score_p50 = P2Quantile(0.5)
+
+    def add(self, result: dict):
+        self.games += 1
+        self.outcomes[result['outcome']] = self.outcomes.get(result['outcome'], 0) + 1
+        self.score.add(result['score'])
+        self.time.add(result['time'])
+        self.actions.add(result['actions'])
+        self.time_p50.add(result['time'])
+        self.time_p95.add(result['time'])
+        self.score_p50.add(result['score'])
+
+    @property
+    def wins(self) -> int:
+        return self.outcomes.get('WIN', 0)
+
+    def win_interval(self, z: float = Z_95) -> Tuple[float, float]:
+        return wilson_interval(self.wins, self.games, z)
+
+
+class ComparisonMonitor:
+    """
+    Live progress and early stopping for a two-agent comparison
+
+    The difference counts as resolved once both agents have played the same number of
+    games (at least min_games) and either their win-rate Wilson intervals no longer
+    overlap or the normal interval of the mean score difference excludes zero. The
+    default z is the 99% level, which leaves room for checking after every game.
+    """
+
+    def __init__(self, total_games: int = 0, min_games: int = 20, z: float = Z_99,
+                 progress_every: int = 0, stream=None):
+        self.total_games = total_games
+        self.min_games = min_games
+        self.z = z
+        self.progress_every = progress_every
+        self.stream = stream or sys.stderr
+        self.agents = {'smart_agent': AgentStats(), 'random_agent': AgentStats()}
+        self.seen = 0
+
+    def add(self, result: dict):
+        self.agents[result['role']].add(result)
+        self.seen += 1
+        if self.progress_every and self.seen % self.progress_every == 0:
+            self.stream.write("\r" + self.progress_line())
+            self.stream.flush()
+
+    def progress_line(self) -> str:
+        parts = [f"[{self.seen}/{self.total_games or '?'}]"]
+        for role, label in (('smart_agent', 'smart'), ('random_agent', 'random')):
+            stats = self.agents[role]
+            low, high = stats.win_interval()
+            parts.append(f"{label}: win {stats.wins}/{stats.games} [{low:.2f}, {high:.2f}] "
+                         f"score {stats.score.average(0):.1f}")
+        return " | ".join(parts)
+
+    def resolved(self) -> bool:
+        smart, rand = self.agents['smart_agent'], self.agents['random_agent']
+        if smart.games != rand.games or smart.games < self.min_games:
+            return False
+
+        smart_low, smart_high = smart.win_interval(self.z)
+        rand_low, rand_high = rand.win_interval(self.z)
+        if smart_low > rand_high or rand_low > smart_high:
+            return True
+
+        difference = smart.score.mean - rand.score.mean
+        stderr = math.sqrt(smart.score.stderr ** 2 + rand.score.stderr ** 2)
+        return stderr > 0 and abs(difference) > self.z * stderr
+
+    def finish(self):
+        if self.progress_every:
+            self.stream.write("\r" + self.progress_line() + "\n")
+            self.stream.flush()
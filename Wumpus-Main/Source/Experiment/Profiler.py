@@ -0,0 +1,184 @@
+"""
+Profiling mode - cProfile plus a stack sampler around every game, aggregated across a batch
+Writes per-function stats, per-phase times, collapsed stacks for flame graphs and the slowest games' seeds
+"""
+
+import cProfile
+import heapq
+import io
+import os
+import pstats
+import signal
+import sys
+import threading
+from collections import Counter
+from typing import List
+
+from constants import ROOT_OUTPUT
+
+# Phase -> (file, function) whose cumulative time is the phase's time; phases may nest (solve holds the others)
+PHASES = {
+    'map_generation': [('RandMap.py', 'random_wumpus_map')],
+    'solve': [('HybridAgent.py', 'solve'), ('Solution.py', 'solve'), ('RandomAgentSimple.py', 'solve')],
+    'kb_forward_chaining': [('KnowledgeBase.py', '_forward_chaining')],
+    'risk': [('PathPlanner.py', 'calculate_risk')],
+    'logging': [('Base.py', 'append_event_to_output_file'), ('RandomAgentSimple.py', 'append_event_to_output_file')],
+    'scoring': [('Simulator.py', 'run')]
+}
+
+SAMPLE_INTERVAL = 0.001  # Seconds of CPU time between stack samples
+SLOWEST_GAMES = 10
+TOP_FUNCTIONS = 40
+
+
+def frame_name(frame) -> str:
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{getattr(code, 'co_qualname', code.co_name)}"
+
+
+class StackSampler:
+    """
+    Samples the Python stack on SIGPROF (process CPU time) and counts collapsed stacks
+
+    Stacks are cut at root_code (the function that started sampling), so frames inherited
+    from a forking parent do not show up. Only works in the main thread of a process with
+    setitimer; elsewhere it records nothing.
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        self.stacks = Counter()
+        self.active = False
+        self.previous = None
+        self.root_code = None
+
+    def sample(self, signum, frame):
+        names = []
+        while frame is not None:
+            names.append(frame_name(frame))
+            if frame.f_code is self.root_code:
+                break
+            frame = frame.f_back
+        self.stacks[';'.join(reversed(names))] += 1
+
+    def __enter__(self):
+        self.active = hasattr(signal, 'setitimer') and threading.current_thread() is threading.main_thread()
+        if self.active:
+            self.previous = signal.signal(signal.SIGPROF, self.sample)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        return self
+
+    def __exit__(self, *exc):
+        if self.active:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, self.previous)
+        return False
+
+
+def phase_times(stats: dict) -> dict:
+    """Cumulative seconds per phase from a pstats stats dict"""
+    times = dict.fromkeys(PHASES, 0.0)
+    for (filename, _, function), (_, _, _, cumulative, _) in stats.items():
+        name = (os.path.basename(filename), function)
+        for phase, functions in PHASES.items():
+            if name in functions:
+                times[phase] += cumulative
+    return times
+
+
+class GameProfiler:
+    """Context manager profiling one game; data() is small and picklable so workers can return it"""
+
+    def __init__(self):
+        self.profile = cProfile.Profile()
+        self.sampler = StackSampler()
+
+    def __enter__(self):
+        self.sampler.root_code = sys._getframe(1).f_code
+        self.sampler.__enter__()
+        self.profile.enable()
+        return self
+
+    def __exit__(self, *exc):
+        self.profile.disable()
+        self.sampler.__exit__(*exc)
+        return False
+
+    def data(self) -> dict:
+        self.profile.create_stats()
+        return {
+            'stats': self.profile.stats,
+            'stacks': dict(self.sampler.stacks),
+            'phases': phase_times(self.profile.stats)
+        }
+
+
+class ProfileReport:
+    """Aggregates the profile data of many games: merged pstats, summed phases and stacks, slowest games"""
+
+    def __init__(self, slowest: int = SLOWEST_GAMES):
+        self.stats = pstats.Stats()
+        self.stacks = Counter()
+        self.phases = Counter()
+        self.games = 0
+        self.slowest = slowest
+        self.heap = []  # (time, game number, row) min-heap of the slowest games
+
+    def add(self, result: dict):
+        """Take a result's 'profile' entry (removed from the result) into the aggregate"""
+        data = result.pop('profile', None)
+        if data is None:
+            return
+        self.games += 1
+        game_stats = pstats.Stats()
+        game_stats.stats = data['stats']
+        game_stats.get_top_level_stats()
+        self.stats.add(game_stats)
+        self.stacks.update(data['stacks'])
+        self.phases.update(data['phases'])
+
+        row = {key: result.get(key) for key in ('agent', 'seed', 'grid_size', 'num_wumpus', 'pit_density',
+                                                'outcome', 'time')}
+        row['phases'] = data['phases']
+        entry = (result['time'], self.games, row)
+        if len(self.heap) < self.slowest:
+            heapq.heappush(self.heap, entry)
+        else:
+            heapq.heappushpop(self.heap, entry)
+
+    def collapsed(self) -> List[str]:
+        """Brendan Gregg collapsed-stack lines ("a;b;c count"), input for flamegraph.pl or speedscope"""
+        return [f"{stack} {count}" for stack, count in sorted(self.stacks.items())]
+
+    def format(self) -> List[str]:
+        lines = ["=" * 90, f"Profile of {self.games} games (times include profiling overhead)", "=" * 90,
+                 "Phases (cumulative seconds, summed over games; solve contains the KB, risk and logging phases)"]
+        for phase in PHASES:
+            average = self.phases[phase] / self.games if self.games else 0.0
+            lines.append(f"  {phase:<20} {self.phases[phase]:>12.4f} s total {average:>12.6f} s/game")
+
+        lines += ["", f"Slowest {len(self.heap)} games (regenerate with RandMap.random_wumpus_map(N, K, p, seed=seed))"]
+        for elapsed, _, row in sorted(self.heap, reverse=True):
+            phases = ", ".join(f"{phase} {seconds:.4f}" for phase, seconds in row['phases'].items() if seconds)
+            lines.append(f"  {elapsed:.6f}s {row['agent']} seed={row['seed']} N={row['grid_size']} "
+                         f"K={row['num_wumpus']} p={row['pit_density']} {row['outcome']} | {phases}")
+
+        stream = io.StringIO()
+        self.stats.stream = stream
+        if self.games:
+            self.stats.sort_stats('cumulative').print_stats(TOP_FUNCTIONS)
+        lines += ["", "Functions by cumulative time", stream.getvalue()]
+        return lines
+
+    def write(self, prefix: str = ROOT_OUTPUT + "profile") -> List[str]:
+        """Write <prefix>.txt (report), <prefix>.collapsed (flame graph input) and <prefix>.prof (pstats dump)"""
+        os.makedirs(os.path.dirname(prefix) or '.', exist_ok=True)
+        paths = [prefix + ".txt", prefix + ".collapsed", prefix + ".prof"]
+        with open(paths[0], 'w', encoding='utf-8') as file:
+            file.write("\n".join(self.format()) + "\n")
+        with open(paths[1], 'w', encoding='utf-8') as file:
+            file.write("\n".join(self.collapsed()) + "\n")
+        if self.games:
+            self.stats.dump_stats(paths[2])
+        print(f"Profile saved to: {', '.join(paths)}")
+        return paths
@@ -0,0 +1,155 @@
+"""
+Result store - one row per game appended to a CSV or JSONL file as soon as the game finishes
+A crashed run keeps every finished game, and a resumed run skips the games already stored
+"""
+
+import csv
+import json
+import os
+from typing import Iterator, Set, Tuple
+
+# Column name -> type, in file order; backend and difficulty may be empty (no KB, map not analyzed),
+# planner_mode is empty in rows written before it was recorded
+# New columns go at the end: ResultStore.open migrates files written with an older (shorter) schema
+SCHEMA = [
+    ('test', int),
+    ('role', str),
+    ('seed', int),
+    ('grid_size', int),
+    ('num_wumpus', int),
+    ('pit_density', float),
+    ('agent', str),
+    ('backend', str),
+    ('outcome', str),
+    ('score', int),
+    ('actions', int),
+    ('time', float),
+    ('kb_queries', int),
+    ('kb_rule_checks', int),
+    ('difficulty', str),
+    ('generator_version', int),
+    ('planner_mode', str)
+]
+
+COLUMNS = [name for name, _ in SCHEMA]
+
+OPTIONAL_COLUMNS = ('backend', 'difficulty', 'planner_mode')
+
+# Columns identifying a game: a stored row with the same values means the game is done.
+# Rows from another map generator version (or written before the column existed) never match
+KEY_COLUMNS = ('seed', 'grid_size', 'num_wumpus', 'pit_density', 'generator_version', 'agent', 'backend', 'planner_mode', 'role')
+
+
+def result_key(row: dict) -> Tuple:
+    """Identity of a game, comparable between tasks, fresh results and rows read back from a file"""
+    return tuple(str(row.get(column)) if column != 'pit_density' else float(row[column])
+                 for column in KEY_COLUMNS)
+
+
+class ResultStore:
+    """
+    Append-only game results file, CSV or JSONL depending on the file extension
+
+    Rows are flushed one at a time; reading streams them back with SCHEMA types restored
+    (and a derived 'won' column), so reports never need the whole run in memory.
+    """
+
+    def __init__(self, path: str, resume: bool = False):
+        self.path = path
+        self.format = 'jsonl' if path.endswith(('.jsonl', '.json')) else 'csv'
+        self.file = None
+        self.writer = None
+        if not resume and os.path.exists(path):
+            os.remove(path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def open(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        is_new = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        torn = False
+        if not is_new and self.format == 'csv':
+            self.migrate()
+        if not is_new:
+            # A crash can leave half a row behind; start the next row on its own line
+            with open(self.path, 'rb') as file:
+                file.seek(-1, os.SEEK_END)
+                torn = file.read(1) != b"\n"
+        self.file = open(self.path, 'a', newline='', encoding='utf-8')
+        if torn:
+            self.file.write("\n")
+        if self.format == 'csv':
+            self.writer = csv.DictWriter(self.file, fieldnames=COLUMNS, extrasaction='ignore')
+            if is_new:
+                self.writer.writeheader()
+
+    def migrate(self):
+        """
+        Rewrite an existing CSV whose header is not COLUMNS (written before columns were added)
+
+        Old rows keep their values and get the new columns empty, so appending under the current
+        header never mixes row widths. A header with columns this version does not know (a file
+        from a newer version) is refused rather than rewritten.
+        """
+        with open(self.path, 'r', newline='', encoding='utf-8') as file:
+            header = next(csv.reader(file), [])
+        if header == COLUMNS:
+            return
+        unknown = [name for name in header if name not in COLUMNS]
+        if unknown:
+            raise ValueError(f"{self.path} has columns {unknown} not in the result schema, not appending to it")
+
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(self.path, 'r', newline='', encoding='utf-8') as source, \
+                open(temp_path, 'w', newline='', encoding='utf-8') as target:
+            writer = csv.DictWriter(target, fieldnames=COLUMNS, extrasaction='ignore')
+            writer.writeheader()
+            for record in csv.DictReader(source):
+                if None in record.values():
+                    continue  # Torn line left by an interrupted run
+                writer.writerow(record)
+        os.replace(temp_path, self.path)
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+            self.writer = None
+
+    def append(self, result: dict):
+        """Write one game result and flush it to disk"""
+        if self.file is None:
+            self.open()
+        if self.format == 'csv':
+            self.writer.writerow(result)
+        else:
+            self.file.write(json.dumps({name: result.get(name) for name in COLUMNS}) + "\n")
+        self.file.flush()
+
+    def rows(self) -> Iterator[dict]:
+        """Stream stored rows back with their schema types"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', newline='', encoding='utf-8') as file:
+            records = csv.DictReader(file) if self.format == 'csv' else file
+            for record in records:
+                try:
+                    if self.format == 'jsonl':
+                        record = json.loads(record)
+                    row = {name: kind(record.get(name)) if record.get(name) not in (None, '') else None
+                           for name, kind in SCHEMA}
+                except (KeyError, TypeError, ValueError):
+                    continue  # Torn or blank line left by an interrupted run
+                if any(row[name] is None for name in COLUMNS if name not in OPTIONAL_COLUMNS):
+                    continue
+                row['won'] = row['outcome'] == 'WIN'
+                yield row
+
+    def completed_keys(self) -> Set[Tuple]:
+        """Keys (see result_key) of every game already in the file"""
+        return {result_key(row) for row in self.rows()}
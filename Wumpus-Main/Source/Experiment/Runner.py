@@ -0,0 +1,511 @@
+"""
+Headless experiment runner - plays agent games without pygame
+Games are generated, solved and scored in worker processes
+"""
+
+import contextlib
+import io
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from Experiment.OnlineStats import AgentStats, ComparisonMonitor
+from Experiment.Profiler import GameProfiler, ProfileReport
+from Experiment.ResultStore import ResultStore, result_key
+from Experiment.WorkerPool import GameLimitExceeded, ResourceWatchdog, SupervisedPool
+from Run.HybridAgent import HybridAgent
+from Run.KnowledgeBase import KnowledgeBase
+from Run.PathPlanner import DEFAULT_PLANNER_MODE
+from Run.PlannerStats import PlannerStats
+from Run.RandMap import GENERATOR_VERSION, random_wumpus_map
+from Run.RandomAgentSimple import RandomAgentBaseline
+from Run.RandomBatchSimulator import parse_maps, simulate_random_agents
+from Run.Simulator import Simulator
+from Run.SolveCache import solve_cache, solve_key
+from Run.WumpusMap import WumpusMap
+from Run.Solution import Solution
+from constants import ROOT_OUTPUT, NUMBER_CELL, DEFAULT_WUMPUS_COUNT, DEFAULT_PIT_PROBABILITY
+
+# Agent name -> solver class, every class takes (input_file, output_file) and has solve()
+AGENTS = {
+    'hybrid': HybridAgent,
+    'solution': Solution,
+    'random': RandomAgentBaseline
+}
+
+# Agents whose solve depends only on the map, so their results can come from a SolveCache
+CACHEABLE_AGENTS = ('hybrid', 'solution')
+
+# Agents with a Run.PathPlanner, whose walk to the exit follows the task's planner_mode
+PLANNER_AGENTS = ('hybrid', 'solution')
+
+# Inference backend name -> knowledge base class, installed on an agent before it solves
+BACKENDS = {
+    'forward_chaining': KnowledgeBase
+}
+
+DEFAULT_CONFIG = {
+    'grid_size': NUMBER_CELL,
+    'num_wumpus': DEFAULT_WUMPUS_COUNT,
+    'pit_density': DEFAULT_PIT_PROBABILITY,
+    'num_tests': 30,
+    'mode': 'random',
+    'seed': 0,
+    'smart_agent': 'hybrid',
+    'random_agent': 'random',
+    'backend': 'forward_chaining',
+    'planner_mode': DEFAULT_PLANNER_MODE,  # How agents with a PathPlanner walk to the exit (see PLANNER_MODES)
+    'time_limit': None,    # Seconds per game, None = unlimited
+    'memory_limit': None,  # Worker RSS cap in MB, None = unlimited
+    'profile': False,      # Run every game under Experiment.Profiler
+    'solve_cache': None,   # Directory of cached solves (see Run.SolveCache), None = always solve
+    # Analyze each test's map once (in the smart agent's game) for the "Win rate by map" section;
+    # MapAnalysis costs ~0.1 s at N=64, ~0.4 s at 128 and ~30 s at 1024, far more than generation
+    'analyze': True
+}
+
+def make_tasks(config: dict) -> List[dict]:
+    """One task per (test, agent); both agents of a test get the same seeded map, analyzed in the smart agent's task"""
+    tasks = []
+    for test_num in range(1, config['num_tests'] + 1):
+        for role in ('smart_agent', 'random_agent'):
+            tasks.append({
+                'test': test_num,
+                'role': role,
+                'agent': config[role],
+                'backend': config['backend'],
+                'planner_mode': config['planner_mode'],
+                'seed': config['seed'] * 1000003 + test_num,
+                'grid_size': config['grid_size'],
+                'num_wumpus': config['num_wumpus'],
+                'pit_density': config['pit_density'],
+                'generator_version': GENERATOR_VERSION,
+                'time_limit': config['time_limit'],
+                'memory_limit': config['memory_limit'],
+                'profile': config['profile'],
+                'solve_cache': config['solve_cache'],
+                'analyze': config['analyze'] and role == 'smart_agent'
+            })
+    return tasks
+
+
+def use_backend(agent, backend: str):
+    """Swap a fresh agent's (still empty) knowledge base for the named backend"""
+    if backend is None or not hasattr(agent, 'KB'):
+        return
+    kb_class = BACKENDS[backend]
+    if not isinstance(agent.KB, kb_class):
+        agent.KB = kb_class()
+        if getattr(agent, 'planner', None) is not None:
+            agent.planner.kb = agent.KB
+
+
+def kb_stats(agent) -> Tuple[int, int]:
+    """KnowledgeBase.infer calls and forward chaining rule checks of an agent (0 for agents without a KB)"""
+    kb = getattr(agent, 'KB', None)
+    return getattr(kb, 'query_count', 0), getattr(kb, 'rule_checks', 0)
+
+
+def planner_stats(agent) -> Optional[dict]:
+    """PlannerStats snapshot of an agent's path planner (None for agents without one)"""
+    planner = getattr(agent, 'planner', None)
+    return planner.stats.snapshot() if planner is not None else None
+
+
+def game_result(task: dict, outcome: str, score: int, actions: int, elapsed: float,
+                kb: Tuple[int, int] = (0, 0), difficulty: str = None) -> dict:
+    """One result row: the task's map parameters and difficulty (see Run.MapAnalysis) plus what was measured"""
+    return {
+        'test': task['test'],
+        'role': task['role'],
+        'agent': task['agent'],
+        'backend': task.get('backend'),
+        'planner_mode': task.get('planner_mode', DEFAULT_PLANNER_MODE),
+        'seed': task['seed'],
+        'grid_size': task['grid_size'],
+        'num_wumpus': task['num_wumpus'],
+        'pit_density': task['pit_density'],
+        'generator_version': GENERATOR_VERSION,
+        'difficulty': difficulty,
+        'outcome': outcome,
+        'won': outcome == 'WIN',
+        'score': score,
+        'actions': actions,
+        'time': elapsed,
+        'kb_queries': kb[0],
+        'kb_rule_checks': kb[1]
+    }
+
+
+def limit_result(task: dict, outcome: str, elapsed: float) -> dict:
+    """Result for a game killed from outside (TIMEOUT, MEMORY or ERROR), when nothing else was measured"""
+    return game_result(task, outcome, 0, 0, elapsed)
+
+
+def generate_map(task: dict, rng: random.Random = None) -> WumpusMap:
+    """
+    The task's seeded map, in memory (drawn from rng when given, else from a new stream seeded
+    with the task seed), with its difficulty in metadata when the task sets 'analyze'
+
+    Analysis is off by default: at large N it costs far more than generating the map (see
+    Run.MapAnalysis), so task makers only ask for it once per map, and only when results are
+    grouped by difficulty.
+    """
+    return random_wumpus_map(task['grid_size'], task['num_wumpus'], task['pit_density'],
+                             seed=rng if rng is not None else task['seed'], analyze=task.get('analyze', False))
+
+
+def solve_task(task: dict, wumpus_map: WumpusMap) -> Tuple[list, str, float, Tuple[int, int], Optional[dict]]:
+    """
+    Solve the map with the task's agent under the task's limits, with planner stats switched on
+    and the task's planner_mode selected
+
+    Returns:
+        (actions, outcome, elapsed, kb counters, planner stats snapshot or None); outcome is None
+        for a finished solve, else TIMEOUT, MEMORY or ERROR with the partial action list
+    """
+    agent = None
+    outcome = None
+    start_time = time.perf_counter()
+    try:
+        with ResourceWatchdog(task.get('time_limit'), task.get('memory_limit')), \
+                contextlib.redirect_stdout(io.StringIO()):
+            agent = AGENTS[task['agent']](wumpus_map, os.devnull)
+            use_backend(agent, task.get('backend'))
+            if getattr(agent, 'planner', None) is not None:
+                agent.planner.stats.enabled = True
+                agent.planner.mode = task.get('planner_mode', DEFAULT_PLANNER_MODE)
+            actions = agent.solve()
+    except GameLimitExceeded as error:
+        outcome = error.outcome
+    except MemoryError:
+        outcome = 'MEMORY'
+    except Exception:
+        outcome = 'ERROR'
+    elapsed = time.perf_counter() - start_time
+
+    if outcome is not None:
+        # Score the partial action list of an interrupted game
+        actions = list(getattr(agent, 'action_list', []))
+    return actions, outcome, elapsed, kb_stats(agent), planner_stats(agent)
+
+
+def play_game(task: dict) -> dict:
+    """
+    Generate the task's map, solve it with the task's agent and score the actions (runs in a worker)
+
+    With a time or memory limit in the task the game is interrupted once over it, and the
+    actions taken so far are scored as a partial result with outcome TIMEOUT or MEMORY.
+    With 'profile' set in the task the whole game runs under a GameProfiler and the result
+    carries its data under 'profile' (see Experiment.Profiler.ProfileReport).
+    With a 'solve_cache' directory in the task, deterministic agents' finished solves are
+    stored there (see Run.SolveCache) and replayed, with their measured time, KB counters and
+    planner stats, the next time the same map, agent, backend, planner mode and limits come up.
+    Agents with a path planner return its PlannerStats snapshot under 'planner'.
+    """
+    profiler = GameProfiler() if task.get('profile') else None
+    with profiler or contextlib.nullcontext():
+        rng = random.Random(task['seed'])
+        wumpus_map = generate_map(task, rng)
+        # Agents drawing from the random module (RandomAgentBaseline) carry on the task's stream,
+        # so their games are as reproducible as the map
+        random.setstate(rng.getstate())
+
+        cache = cached = None
+        if task.get('solve_cache') and task['agent'] in CACHEABLE_AGENTS:
+            cache = solve_cache(task['solve_cache'])
+            # Limits are part of the key: a solve that finished under a loose limit may not under a tight one
+            key = solve_key(wumpus_map, task['agent'], {'backend': task.get('backend'),
+                                                        'planner_mode': task.get('planner_mode', DEFAULT_PLANNER_MODE),
+                                                        'time_limit': task.get('time_limit'),
+                                                        'memory_limit': task.get('memory_limit')})
+            cached = cache.get(key)
+        if cached is not None:
+            actions, outcome, elapsed, kb = cached['actions'], None, cached['time'], tuple(cached['kb'])
+            planner = cached.get('planner')
+        else:
+            actions, outcome, elapsed, kb, planner = solve_task(task, wumpus_map)
+            if cache is not None and outcome is None:
+                cache.put(key, actions, time=elapsed, kb=list(kb), planner=planner)
+        result = Simulator.from_map(wumpus_map).run(actions)
+
+    if outcome is None:
+        outcome = 'WIN' if result['won'] else 'LOSE'
+    row = game_result(task, outcome, result['score'], len(actions), elapsed, kb,
+                      wumpus_map.metadata.get('difficulty'))
+    if planner is not None:
+        row['planner'] = planner
+    if profiler is not None:
+        row['profile'] = profiler.data()
+    return row
+
+
+def batch_map(task: dict) -> Tuple[list, Optional[str]]:
+    """generate_map for play_random_batch (runs in a worker): only the cells and difficulty travel back"""
+    wumpus_map = generate_map(task)
+    return wumpus_map.cells, wumpus_map.metadata.get('difficulty')
+
+
+def play_random_batch(tasks: List[dict], seed: int = 0, workers: int = None) -> List[dict]:
+    """
+    Play random-agent tasks with the vectorized RandomBatchSimulator instead of one by one
+
+    Maps are generated exactly as for play_game, each from its task's seed, across a process
+    pool of workers (None = CPU count, 1 = in this process) - generation, not the simulation,
+    dominates a large batch. The agent's own random draws come from one NumPy Generator, so
+    games follow RandomAgentBaseline's distribution but not its exact action lists. Each
+    result gets the batch (simulation) time divided by the batch size.
+    """
+    results = [None] * len(tasks)
+    by_size = {}
+    for index, task in enumerate(tasks):
+        by_size.setdefault(task['grid_size'], []).append(index)
+
+    if workers == 1:
+        generated = list(map(batch_map, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            generated = list(executor.map(batch_map, tasks, chunksize=max(1, len(tasks) // 256)))
+
+    rng = np.random.default_rng(seed)
+    for indices in by_size.values():
+        maps = [generated[index][0] for index in indices]
+        start_time = time.perf_counter()
+        games = simulate_random_agents(*parse_maps(maps), rng=rng)
+        elapsed = (time.perf_counter() - start_time) / len(indices)
+        for game, index in enumerate(indices):
+            outcome = 'WIN' if games['won'][game] else 'LOSE'
+            results[index] = game_result(tasks[index], outcome, int(games['score'][game]),
+                                         int(games['actions'][game]), elapsed,
+                                         difficulty=generated[index][1])
+    return results
+
+
+def run_games(tasks: List[dict], workers: int = None, chunksize: int = 1,
+              on_result: Callable[[dict], None] = None, keep_results: bool = True,
+              should_stop: Callable[[], bool] = None) -> List[dict]:
+    """
+    Play every task across a process pool; results come back in task order
+
+    on_result is called with each result as soon as it is available (in task order
+    for the plain pool, in completion order for the supervised one). Streaming callers
+    pass keep_results=False so results are not also held in memory. should_stop is checked
+    after every result; once it returns True the games not yet finished are dropped.
+
+    Tasks with a time or memory limit go through a SupervisedPool, which kills games that
+    ignore their soft limit and replaces workers after a TIMEOUT, MEMORY or ERROR outcome.
+    """
+    limited = any(task.get('time_limit') is not None or task.get('memory_limit') is not None for task in tasks)
+    if limited:
+        time_limit = max((task['time_limit'] for task in tasks if task.get('time_limit') is not None), default=None)
+        memory_limit = max((task['memory_limit'] for task in tasks if task.get('memory_limit') is not None),
+                           default=None)
+        pool = SupervisedPool(play_game, limit_result, workers, time_limit, memory_limit)
+        return pool.map(tasks, on_result, keep_results, should_stop)
+
+    results = []
+    with contextlib.ExitStack() as stack:
+        executor = None
+        if workers == 1:
+            games = map(play_game, tasks)
+        else:
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+            games = executor.map(play_game, tasks, chunksize=chunksize)
+        for result in games:
+            if keep_results:
+                results.append(result)
+            if on_result is not None:
+                on_result(result)
+            if should_stop is not None and should_stop():
+                if executor is not None:
+                    executor.shutdown(wait=True, cancel_futures=True)
+                break
+    return results
+
+
+def summary_row(label: str, smart, rand) -> str:
+    return f"{label:<20} | {smart:^18} | {rand:^18}"
+
+
+def format_report(config: dict, results: Iterable[dict], planner: dict = None) -> List[str]:
+    """
+    Report lines in the Output/resultComparison.txt format
+
+    results is consumed as a stream: a test's lines are emitted once both agents of the
+    test have been seen and the summary comes from OnlineStats aggregators. A test's map
+    difficulty comes from whichever of its two results carries it (see make_tasks). planner is the
+    smart agent's aggregated PlannerStats snapshot, reported last when given.
+    """
+    lines = ["=" * 55, "Experiment Result", "=" * 55,
+             "Configure:",
+             f" - Grid size(N): {config['grid_size']}.",
+             f" - Number of wumpus(K): {config['num_wumpus']}.",
+             f" - Pit density(p): {config['pit_density']}.",
+             f" - Mode: {config['mode']}.",
+             f" - Planner mode: {config.get('planner_mode', DEFAULT_PLANNER_MODE)}.",
+             f" - Number of test (M): {config['num_tests']}.",
+             "=" * 55, ""]
+
+    totals = {role: {'all': AgentStats(), 'WIN': AgentStats(), 'LOSE': AgentStats()}
+              for role in ('smart_agent', 'random_agent')}
+    by_difficulty = {}  # difficulty -> role -> [wins, games]
+    pending = {}  # test -> {role: result} until both agents of the test are in
+    for result in results:
+        role_totals = totals[result['role']]
+        role_totals['all'].add(result)
+        if result['outcome'] in ('WIN', 'LOSE'):
+            role_totals[result['outcome']].add(result)
+
+        test = pending.setdefault(result['test'], {})
+        test[result['role']] = result
+        if len(test) < 2:
+            continue
+        del pending[result['test']]
+        difficulty = next((r['difficulty'] for r in test.values() if r.get('difficulty') is not None), None)
+        if difficulty is not None:
+            counts = by_difficulty.setdefault(difficulty, {role: [0, 0] for role in totals})
+            for role, r in test.items():
+                counts[role][0] += r['won']
+                counts[role][1] += 1
+        lines.append(f"Test {result['test']}:")
+        for role, label in (('smart_agent', 'Smart Agent'), ('random_agent', 'Random Agent')):
+            r = test[role]
+            lines.append(f"{label}: {r['outcome']} | Score: {r['score']} | "
+                         f"Actions: {r['actions']} | Time: {r['time']:.6f}s")
+        lines.append("")
+
+    stats = {}
+    for role, role_totals in totals.items():
+        games, wins, losses = role_totals['all'], role_totals['WIN'], role_totals['LOSE']
+        win_low, win_high = games.win_interval()
+        score_low, score_high = games.score.interval()
+        stats[role] = {
+            'win_rate': round(games.wins / games.games, 2) if games.games else 0.0,
+            'win_ci': f"[{win_low:.2f}, {win_high:.2f}]",
+            'score': f"{games.score.average():.2f}",
+            'score_ci': f"[{score_low:.0f}, {score_high:.0f}]" if games.games > 1 else "-",
+            'score_p50': f"{games.score_p50.value():.2f}",
+            'time': f"{games.time.average():.6f}",
+            'time_p50': f"{games.time_p50.value():.6f}",
+            'time_p95': f"{games.time_p95.value():.6f}",
+            'actions': f"{games.actions.average():.2f}",
+            'wins': wins.games,
+            'win_score': f"{wins.score.average():.2f}",
+            'win_time': f"{wins.time.average():.6f}",
+            'win_actions': f"{wins.actions.average():.2f}",
+            'losses': losses.games,
+            'loss_score': f"{losses.score.average():.2f}",
+            'loss_time': f"{losses.time.average():.6f}",
+            'loss_actions': f"{losses.actions.average():.2f}",
+            'timeouts': games.outcomes.get('TIMEOUT', 0),
+            'memory_aborts': games.outcomes.get('MEMORY', 0),
+            'errors': games.outcomes.get('ERROR', 0)
+        }
+
+    smart, rand = stats['smart_agent'], stats['random_agent']
+    lines += ["", "=" * 55, "SUMMARY", "=" * 55,
+              summary_row('Stats', 'Smart Agent', 'Random Agent'),
+              "-" * 55]
+    for label, key in (('Win rate (%)', 'win_rate'), ('Win rate 95% CI', 'win_ci'), ('Average score', 'score'),
+                       ('Score 95% CI', 'score_ci'), ('Median score', 'score_p50'), ('Average time (s)', 'time'),
+                       ('Median time (s)', 'time_p50'), ('p95 time (s)', 'time_p95'),
+                       ('Average actions', 'actions')):
+        lines.append(summary_row(label, smart[key], rand[key]))
+    lines.append("=" * 55)
+    for label, key in (('Number of wins', 'wins'), ('Average win score', 'win_score'),
+                       ('Average win time (s)', 'win_time'), ('Average win actions', 'win_actions'),
+                       ('Number of losses', 'losses'), ('Average loss score', 'loss_score'),
+                       ('Average loss time (s)', 'loss_time'), ('Average loss actions', 'loss_actions')):
+        lines.append(summary_row(label, smart[key], rand[key]))
+    # Only shown when limits actually cut games short, so unlimited reports keep their layout
+    for label, key in (('Number of timeouts', 'timeouts'), ('Number of memory aborts', 'memory_aborts'),
+                       ('Number of errors', 'errors')):
+        if smart[key] or rand[key]:
+            lines.append(summary_row(label, smart[key], rand[key]))
+    if by_difficulty:
+        lines += ["-" * 55, summary_row('Win rate by map', 'Smart Agent', 'Random Agent')]
+        for difficulty in ('easy', 'medium', 'hard', 'unsolvable'):
+            if difficulty in by_difficulty:
+                cells = [f"{wins / games:.2f} ({games})" if games else "-"
+                         for wins, games in (by_difficulty[difficulty][role] for role in totals)]
+                lines.append(summary_row(f"  {difficulty}", *cells))
+    if planner is not None:
+        lines += ["", "PLANNER STATISTICS (Smart Agent, games played in this run):"]
+        lines.extend(PlannerStats.format(planner))
+    return lines
+
+
+def run_comparison(config: dict = None, workers: int = None, chunksize: int = 1,
+                   output_file: str = ROOT_OUTPUT + "resultComparison.txt",
+                   results_file: str = ROOT_OUTPUT + "resultComparison.csv", resume: bool = False,
+                   early_stop: bool = False, min_games: int = 20, progress: int = 0) -> List[str]:
+    """
+    Play the smart agent and the random agent on the same seeded maps and write the comparison report
+
+    Every game is appended to results_file as it finishes; the report is then built by
+    streaming that file, so results are never all held in memory. The smart agent's planner
+    stats are summed as games finish (resumed games have none). With config['profile'] the
+    games' profiles are aggregated into ROOT_OUTPUT/profile.* as well.
+
+    Args:
+        config: Experiment configuration, missing keys come from DEFAULT_CONFIG
+        workers: Number of worker processes (None = CPU count, 1 = run in this process)
+        chunksize: Number of games handed to a worker at once
+        output_file: Report path
+        results_file: Per-game results, CSV or JSONL (by extension)
+        resume: Keep results_file and only play the games it does not have yet
+        early_stop: Stop once the smart-vs-random difference is statistically resolved
+        min_games: Games per agent before early stopping is considered
+        progress: Print a live progress line every this many games (0 = quiet)
+
+    Returns:
+        The report lines
+    """
+    config = {**DEFAULT_CONFIG, **(config or {})}
+    tasks = make_tasks(config)
+    wanted = {result_key(task) for task in tasks}
+
+    with ResultStore(results_file, resume) as store:
+        done = store.completed_keys() if resume else set()
+        remaining = [task for task in tasks if result_key(task) not in done]
+        if done:
+            print(f"Resuming: {len(tasks) - len(remaining)} of {len(tasks)} games already stored")
+
+        monitor = ComparisonMonitor(len(tasks), min_games, progress_every=progress)
+        for row in store.rows():
+            if result_key(row) in wanted:
+                monitor.add(row)
+
+        profile = ProfileReport() if config['profile'] else None
+        planner = None
+
+        def on_result(result):
+            nonlocal planner
+            if profile is not None:
+                profile.add(result)
+            if result['role'] == 'smart_agent' and result.get('planner') is not None:
+                planner = PlannerStats.aggregate([result['planner']] + ([planner] if planner else []))
+            store.append(result)
+            monitor.add(result)
+
+        run_games(remaining, workers, chunksize, on_result=on_result, keep_results=False,
+                  should_stop=monitor.resolved if early_stop else None)
+        monitor.finish()
+        store.close()
+        if early_stop and monitor.seen < len(tasks):
+            tests = min(stats.games for stats in monitor.agents.values())
+            print(f"Stopped early: difference resolved after {tests} tests")
+            config = {**config, 'num_tests': tests}
+        lines = format_report(config, (row for row in store.rows() if result_key(row) in wanted), planner)
+
+    os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+    with open(output_file, 'w', encoding='utf-8') as file:
+        file.write("\n".join(lines) + "\n")
+    print(f"Results saved to: {output_file}")
+    if profile is not None:
+        profile.write()
+    return lines
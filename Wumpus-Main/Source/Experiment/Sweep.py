@@ -0,0 +1,197 @@
+"""
+Scenario sweep - the full grid size x wumpus count x pit density product, with replications
+Results are streamed to a ResultStore file as games finish and summarized as scaling curves over N
+"""
+
+import os
+from typing import Iterable, List
+
+from Experiment.Benchmark import make_corpus, make_tasks
+from Experiment.Distributed import run_distributed
+from Experiment.OnlineStats import P2Quantile, Welford
+from Experiment.Profiler import ProfileReport
+from Experiment.ResultStore import ResultStore, result_key
+from Experiment.Runner import play_random_batch, run_games
+from Run.PathPlanner import DEFAULT_PLANNER_MODE
+from constants import ROOT_OUTPUT
+
+DEFAULT_SWEEP = {
+    'sizes': [4, 8, 16, 32],
+    'num_wumpus': [1, 2],
+    'pit_densities': [0.1, 0.2],
+    'replications': 5,
+    'agents': ['hybrid'],
+    'backend': 'forward_chaining',
+    'planner_mode': DEFAULT_PLANNER_MODE,  # Exit planner of agents with a PathPlanner (see PLANNER_MODES)
+    'seed': 0,
+    'time_limit': 60.0,
+    'memory_limit': None,
+    'vectorized_random': False,  # Play the random agent with RandomBatchSimulator
+    'profile': False             # Run every game under Experiment.Profiler
+}
+
+BAR_WIDTH = 40
+
+
+def parse_range(text: str, cast=int) -> list:
+    """
+    Parse a sweep axis: a comma list ("4,8,16") or an inclusive range "start:stop:step"
+
+    A step written as "x2" multiplies instead of adds ("4:64:x2" -> 4, 8, 16, 32, 64).
+    A step that never reaches stop (additive step <= 0, factor <= 1, or a factor applied to
+    a start <= 0) raises ValueError.
+    """
+    if ':' not in text:
+        return [cast(value) for value in text.split(',')]
+    parts = text.split(':')
+    start, stop = cast(parts[0]), cast(parts[1])
+    step = parts[2] if len(parts) > 2 else '1'
+    multiply = step.startswith('x')
+    amount = cast(step[1:]) if multiply else cast(step)
+    if multiply and (amount <= 1 or start <= 0):
+        raise ValueError(f"range {text!r}: a multiplicative step needs a factor > 1 and a start > 0")
+    if not multiply and amount <= 0:
+        raise ValueError(f"range {text!r}: the step must be > 0")
+    values = []
+    value = start
+    while value <= stop + 1e-9:
+        values.append(round(value, 6) if cast is float else value)
+        value = value * amount if multiply else value + amount
+    return values
+
+
+def sweep_tasks(sweep: dict) -> List[dict]:
+    """Runner tasks for every (N, K, p, replication, agent) combination; scaling curves do not use difficulty, so maps are not analyzed"""
+    maps = make_corpus({
+        'sizes': sweep['sizes'],
+        'num_wumpus': sweep['num_wumpus'],
+        'pit_densities': sweep['pit_densities'],
+        'maps_per_config': sweep['replications'],
+        'seed': sweep['seed']
+    })
+    tasks = make_tasks(maps, sweep['agents'], [sweep['backend']], sweep['time_limit'], sweep['memory_limit'],
+                       analyze=False, planner_modes=[sweep['planner_mode']])
+    for task in tasks:
+        task['profile'] = sweep['profile']
+    return tasks
+
+
+def scaling_curves(rows: Iterable[dict]) -> dict:
+    """
+    Per agent, per grid size: games, win rate, solve time percentiles, mean score and actions
+
+    Aggregated in constant memory per group (P-square quantiles, Welford means).
+
+    Returns:
+        {agent: [(N, stats), ...]} sorted by N
+    """
+    groups = {}
+    for row in rows:
+        group = groups.setdefault(row['agent'], {}).setdefault(row['grid_size'], {
+            'time_p50': P2Quantile(0.5), 'time_p95': P2Quantile(0.95), 'games': 0, 'wins': 0, 'timeouts': 0,
+            'score': Welford(), 'actions': Welford()})
+        group['games'] += 1
+        group['time_p50'].add(row['time'])
+        group['time_p95'].add(row['time'])
+        group['wins'] += row['outcome'] == 'WIN'
+        group['timeouts'] += row['outcome'] == 'TIMEOUT'
+        group['score'].add(row['score'])
+        group['actions'].add(row['actions'])
+
+    curves = {}
+    for agent, by_size in sorted(groups.items()):
+        curves[agent] = []
+        for N, group in sorted(by_size.items()):
+            curves[agent].append((N, {
+                'games': group['games'],
+                'win_rate': group['wins'] / group['games'],
+                'timeouts': group['timeouts'],
+                'time_p50': group['time_p50'].value(),
+                'time_p95': group['time_p95'].value(),
+                'score': group['score'].mean,
+                'actions': group['actions'].mean
+            }))
+    return curves
+
+
+def format_curves(curves: dict) -> List[str]:
+    """Text table and bar charts of solve time and score against N, with the growth of p50 time per step"""
+    lines = []
+    for agent, points in curves.items():
+        lines += ["=" * 90, f"Scaling curve: {agent}", "=" * 90,
+                  f"{'N':>5} | {'games':>5} | {'win':>5} | {'t/o':>4} | {'time p50 (s)':>12} | "
+                  f"{'time p95 (s)':>12} | {'growth':>7} | {'score':>9} | {'actions':>9}",
+                  "-" * 90]
+        previous = None
+        for N, stats in points:
+            growth = f"x{stats['time_p50'] / previous:.1f}" if previous else "-"
+            lines.append(f"{N:>5} | {stats['games']:>5} | {stats['win_rate']:>5.2f} | {stats['timeouts']:>4} | "
+                         f"{stats['time_p50']:>12.6f} | {stats['time_p95']:>12.6f} | {growth:>7} | "
+                         f"{stats['score']:>9.1f} | {stats['actions']:>9.1f}")
+            previous = stats['time_p50'] or None
+
+        for title, key in (('Solve time p50 vs N', 'time_p50'), ('Average score vs N', 'score')):
+            lines += ["", title]
+            largest = max(abs(stats[key]) for _, stats in points) or 1
+            for N, stats in points:
+                bar = '#' * round(abs(stats[key]) / largest * BAR_WIDTH)
+                lines.append(f"{N:>5} | {'-' if stats[key] < 0 else ' '}{bar:<{BAR_WIDTH}} {stats[key]:.6g}")
+        lines.append("")
+    return lines
+
+
+def run_sweep(sweep: dict = None, workers: int = None, results_file: str = ROOT_OUTPUT + "sweep.csv",
+              curves_file: str = ROOT_OUTPUT + "sweepCurves.txt", resume: bool = False,
+              listen=None, authkey: bytes = None) -> dict:
+    """
+    Run the sweep, appending one row per finished game to a ResultStore, then write the scaling curves
+
+    Args:
+        sweep: Sweep parameters, missing keys come from DEFAULT_SWEEP
+        workers: Number of worker processes on this machine (None = CPU count, 1 = run in this process)
+        results_file: Result rows, CSV or JSONL (by extension)
+        curves_file: Scaling curve report
+        resume: Keep results_file and only play the games it does not have yet
+        listen: Coordinator address ('host:port' or a Unix socket path) that remote run_worker.py
+                nodes connect to; None keeps everything in a local process pool
+        authkey: Shared key remote workers must present (None = the default key on a loopback
+                 address, a printed random key otherwise; see Distributed.coordinator_authkey)
+
+    Returns:
+        The scaling curves (see scaling_curves)
+    """
+    sweep = {**DEFAULT_SWEEP, **(sweep or {})}
+    tasks = sweep_tasks(sweep)
+    wanted = {result_key(task) for task in tasks}
+
+    profile = ProfileReport() if sweep['profile'] else None
+
+    def on_result(result):
+        if profile is not None:
+            profile.add(result)
+        store.append(result)
+
+    with ResultStore(results_file, resume) as store:
+        done = store.completed_keys() if resume else set()
+        remaining = [task for task in tasks if result_key(task) not in done]
+        print(f"Sweep: {len(tasks)} games, {len(remaining)} to play")
+        if sweep['vectorized_random']:
+            batch = [task for task in remaining if task['agent'] == 'random']
+            remaining = [task for task in remaining if task['agent'] != 'random']
+            for result in play_random_batch(batch, sweep['seed'], workers or None):
+                store.append(result)
+        if listen is None:
+            run_games(remaining, workers, on_result=on_result, keep_results=False)
+        else:
+            run_distributed(remaining, listen, authkey, workers, on_result=on_result, keep_results=False)
+        store.close()
+        print(f"Results saved to: {results_file}")
+        curves = scaling_curves(row for row in store.rows() if result_key(row) in wanted)
+
+    os.makedirs(os.path.dirname(curves_file) or '.', exist_ok=True)
+    with open(curves_file, 'w', encoding='utf-8') as file:
+        file.write("\n".join(format_curves(curves)) + "\n")
+    print(f"Scaling curves saved to: {curves_file}")
+    if profile is not None:
+        profile.write()
+    return curves
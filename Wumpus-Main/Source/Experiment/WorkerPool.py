@@ -0,0 +1,216 @@
+"""
+Supervised worker pool - per-game wall-clock and memory limits for batch runs
+A game over its limits is stopped, recorded with partial metrics and its worker is recycled
+"""
+
+import multiprocessing
+import os
+import signal
+import time
+from multiprocessing.connection import wait
+from typing import Callable, List, Optional
+
+# Outcomes after which a worker process is replaced instead of reused
+RECYCLE_OUTCOMES = ('TIMEOUT', 'MEMORY', 'ERROR')
+
+
+class GameLimitExceeded(Exception):
+    """Raised inside a running game when it goes over its time or memory limit"""
+
+    def __init__(self, outcome: str, message: str):
+        super().__init__(message)
+        self.outcome = outcome
+
+
+def current_rss_mb(pid: Optional[int] = None) -> float:
+    """Resident set size of a process in MB (0 when it can't be read on this platform)"""
+    try:
+        with open(f"/proc/{pid or 'self'}/statm", 'r') as file:
+            return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        pass
+    if pid is None:
+        try:
+            import resource
+            # Peak RSS, in KB on Linux and bytes on macOS
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            return peak / (1024 * 1024) if peak > 1 << 32 else peak / 1024
+        except ImportError:
+            pass
+    return 0.0
+
+
+class ResourceWatchdog:
+    """
+    Context manager that interrupts the code it wraps once a deadline or RSS cap is passed
+
+    Uses a SIGALRM interval timer, so it only works in the main thread of a Unix process.
+    Elsewhere it does nothing and the supervisor's hard kill is the only limit.
+    """
+
+    def __init__(self, time_limit: Optional[float] = None, memory_limit: Optional[float] = None,
+                 interval: float = 0.05):
+        self.time_limit = time_limit
+        self.memory_limit = memory_limit
+        self.interval = interval
+        self.start_time = 0.0
+        self.previous_handler = None
+        self.active = False
+
+    def tick(self, signum, frame):
+        if self.time_limit is not None and time.perf_counter() - self.start_time > self.time_limit:
+            self.stop()
+            raise GameLimitExceeded('TIMEOUT', f'Game exceeded {self.time_limit}s')
+        if self.memory_limit is not None and current_rss_mb() > self.memory_limit:
+            self.stop()
+            raise GameLimitExceeded('MEMORY', f'Game exceeded {self.memory_limit}MB')
+
+    def stop(self):
+        if self.active:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self.previous_handler)
+            self.active = False
+
+    def __enter__(self):
+        self.start_time = time.perf_counter()
+        limited = self.time_limit is not None or self.memory_limit is not None
+        if limited and hasattr(signal, 'setitimer'):
+            try:
+                self.previous_handler = signal.signal(signal.SIGALRM, self.tick)
+                interval = min(self.interval, self.time_limit) if self.time_limit else self.interval
+                signal.setitimer(signal.ITIMER_REAL, interval, interval)
+                self.active = True
+            except ValueError:
+                pass  # Not in the main thread
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+
+
+def worker_main(connection, game_function: Callable[[dict], dict]):
+    """Worker process: play tasks sent over the pipe until told to stop or a game hits a limit"""
+    while True:
+        task = connection.recv()
+        if task is None:
+            break
+        result = game_function(task)
+        connection.send(result)
+        if result.get('outcome') in RECYCLE_OUTCOMES:
+            break  # The interrupted game may have left this process in a bad state
+    connection.close()
+
+
+class SupervisedPool:
+    """
+    Process pool that hands out one game at a time and enforces hard limits from outside
+
+    Workers enforce soft limits themselves (ResourceWatchdog inside game_function) and return
+    partial metrics. If a worker does not answer within time_limit + grace seconds, or its RSS
+    passes memory_limit * 1.5, it is killed and limit_result(task, outcome, elapsed) is recorded.
+    """
+
+    def __init__(self, game_function: Callable[[dict], dict], limit_result: Callable[[dict, str, float], dict],
+                 workers: Optional[int] = None, time_limit: Optional[float] = None,
+                 memory_limit: Optional[float] = None, grace: float = 5.0):
+        self.game_function = game_function
+        self.limit_result = limit_result
+        self.workers = workers or os.cpu_count() or 1
+        self.time_limit = time_limit
+        self.memory_limit = memory_limit
+        self.grace = grace
+        self.recycled = 0  # Number of workers replaced during the last map()
+
+    def start_worker(self):
+        parent_connection, child_connection = multiprocessing.Pipe()
+        process = multiprocessing.Process(target=worker_main, args=(child_connection, self.game_function),
+                                          daemon=True)
+        process.start()
+        child_connection.close()
+        return {'process': process, 'connection': parent_connection, 'task': None, 'index': None,
+                'start_time': 0.0}
+
+    def stop_worker(self, worker, kill: bool = False):
+        if kill:
+            worker['process'].terminate()
+        else:
+            try:
+                worker['connection'].send(None)
+            except (OSError, BrokenPipeError):
+                pass
+        worker['process'].join(timeout=self.grace)
+        if worker['process'].is_alive():
+            worker['process'].kill()
+            worker['process'].join()
+        worker['connection'].close()
+
+    def map(self, tasks: List[dict], on_result: Callable[[dict], None] = None,
+            keep_results: bool = True, should_stop: Callable[[], bool] = None) -> List[dict]:
+        """
+        Play every task, returning results in task order (nothing when keep_results is False)
+
+        Once should_stop returns True no new task is started and running games are killed;
+        their results are left as None.
+        """
+        results = [None] * len(tasks) if keep_results else None
+        pending = list(enumerate(tasks))
+        pending.reverse()
+        workers = [self.start_worker() for _ in range(min(self.workers, len(tasks)))]
+        self.recycled = 0
+
+        def finish(worker, result):
+            if keep_results:
+                results[worker['index']] = result
+            worker['task'] = None
+            if on_result is not None:
+                on_result(result)
+            if should_stop is not None and should_stop():
+                pending.clear()
+
+        def replace(worker):
+            self.stop_worker(worker, kill=True)
+            self.recycled += 1
+            workers[workers.index(worker)] = self.start_worker()
+
+        try:
+            while pending or any(worker['task'] is not None for worker in workers):
+                if should_stop is not None and not pending and should_stop():
+                    break
+                for worker in workers:
+                    if worker['task'] is None and pending:
+                        worker['index'], worker['task'] = pending.pop()
+                        worker['start_time'] = time.perf_counter()
+                        worker['connection'].send(worker['task'])
+
+                busy = [worker for worker in workers if worker['task'] is not None]
+                ready = wait([worker['connection'] for worker in busy] +
+                             [worker['process'].sentinel for worker in busy], timeout=0.1)
+
+                for worker in busy:
+                    elapsed = time.perf_counter() - worker['start_time']
+                    if worker['connection'] in ready:
+                        try:
+                            result = worker['connection'].recv()
+                        except EOFError:
+                            finish(worker, self.limit_result(worker['task'], 'ERROR', elapsed))
+                            replace(worker)
+                            continue
+                        finish(worker, result)
+                        if result.get('outcome') in RECYCLE_OUTCOMES:
+                            replace(worker)
+                    elif not worker['process'].is_alive():
+                        finish(worker, self.limit_result(worker['task'], 'ERROR', elapsed))
+                        replace(worker)
+                    elif self.time_limit is not None and elapsed > self.time_limit + self.grace:
+                        finish(worker, self.limit_result(worker['task'], 'TIMEOUT', elapsed))
+                        replace(worker)
+                    elif (self.memory_limit is not None and
+                          current_rss_mb(worker['process'].pid) > self.memory_limit * 1.5):
+                        finish(worker, self.limit_result(worker['task'], 'MEMORY', elapsed))
+                        replace(worker)
+        finally:
+            for worker in workers:
+                self.stop_worker(worker, kill=worker['task'] is not None)
+
+        return results if keep_results else []
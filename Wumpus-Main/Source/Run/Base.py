@@ -1,12 +1,15 @@
 from Run.Action import Action
 from Run.Cell import Cell
 from Run.CellType import CellType
+from Run.MapCache import load_map
+from Run.WumpusMap import WumpusMap
 
 
 class Base(object):
     def __init__(self, output_filename):
         self.output_filename = output_filename
         self.map_size = 10
+        self.exit_pos = None  # Exit door (row, col), set by read_map
         self.cell_matrix = None
 
         self.agent_cell = None  # initial cell
@@ -14,6 +17,7 @@ class Base(object):
         self.path = []
         self.action_list = []
         self.score = 0
+        self.facing = Action.TURN_RIGHT  # Board agent starts facing right
 
         self.cave_cell: Cell = Cell(-1, -1, 10, CellType.EMPTY.value)
 
@@ -47,13 +51,18 @@ class Base(object):
 
     def turn_to(self, new_cell):
         if new_cell.map_pos[1] > self.agent_cell.map_pos[1]:
-            self.add_action(Action.TURN_UP)
+            direction = Action.TURN_UP
         elif new_cell.map_pos[1] < self.agent_cell.map_pos[1]:
-            self.add_action(Action.TURN_DOWN)
+            direction = Action.TURN_DOWN
         elif new_cell.map_pos[0] - self.agent_cell.map_pos[0] == 1:
-            self.add_action(Action.TURN_RIGHT)
+            direction = Action.TURN_RIGHT
         else:
-            self.add_action(Action.TURN_LEFT)
+            direction = Action.TURN_LEFT
+
+        # Board charges every TURN_* action, so skip turning to where we already face
+        if direction != self.facing:
+            self.add_action(direction)
+            self.facing = direction
 
     def move_to(self, new_cell):
         self.turn_to(new_cell)
@@ -61,10 +70,12 @@ class Base(object):
         self.agent_cell = new_cell
 
     def read_map(self, filename):
-        file = open(filename, 'r')
-
-        self.map_size = int(file.readline())
-        raw_map = [line.split('.') for line in file.read().splitlines()]
+        # filename may also be an in-memory WumpusMap, which skips the file round-trip;
+        # map files are parsed once and shared with Board through Run.MapCache
+        wumpus_map = filename if isinstance(filename, WumpusMap) else load_map(filename)
+        self.map_size = wumpus_map.N
+        self.exit_pos = wumpus_map.exit
+        raw_map = wumpus_map.cells
 
         self.cell_matrix = [[None for _ in range(self.map_size)] for _ in range(self.map_size)]
         for row in range(self.map_size):
@@ -73,5 +84,3 @@ class Base(object):
                 if CellType.AGENT.value in raw_map[row][col]:
                     self.agent_cell = self.cell_matrix[row][col]
                     self.agent_cell.update_parent(self.cave_cell)
-
-        file.close()
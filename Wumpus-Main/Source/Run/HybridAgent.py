@@ -64,8 +64,7 @@ class HybridAgent(Solution):
     
     def at_exit(self) -> bool:
         """Check if agent is at exit position (N-1,0)"""
-        from constants import EXIT_DOOR_ROW, EXIT_DOOR_COL
-        return self.agent_cell.map_pos == (EXIT_DOOR_ROW, EXIT_DOOR_COL)
+        return self.agent_cell.map_pos == self.exit_pos
     
     def estimate_max_possible_score(self) -> int:
         """Estimate maximum achievable score from current state"""
@@ -192,6 +191,10 @@ class HybridAgent(Solution):
         self.top_condition()
         self.total_moves += 1  # Track moves for score calculation
 
+        # Gold in hand: leave by the planned route as soon as it only crosses explored cells
+        if self.has_gold and self.navigate_to_exit():
+            return False
+
         # Check if reached exit
         if self.agent_cell.map_pos[0] == 0 and self.agent_cell.map_pos[1] == 0:
             self.add_action(Action.CLIMB_OUT_OF_THE_CAVE)
@@ -242,6 +245,7 @@ class HybridAgent(Solution):
                                 self.killed_wumpus += 1
                                 
                             valid_adj_cell.kill_wumpus(self.cell_matrix, self.KB)
+                            self.notify_knowledge_changed(valid_adj_cell, 2)
                             self.append_event_to_output_file('KB: ' + str(self.KB.KB))
                         else:
                             # Don't shoot, avoid cell
@@ -0,0 +1,169 @@
+"""
+Jump Point Search for 4-connected uniform-cost grids
+Alternative to plain A* when every passable cell costs the same to enter
+"""
+
+import heapq
+from typing import List, Tuple, Optional
+
+DDX = [(0, 1), (0, -1), (-1, 0), (1, 0)]
+
+
+def is_open(pos: Tuple[int, int], N: int, passable: Optional[List[List[bool]]] = None) -> bool:
+    """Check that a position is inside the grid and passable"""
+    row, col = pos
+    if not (0 <= row < N and 0 <= col < N):
+        return False
+    return passable is None or passable[row][col]
+
+
+def jump_horizontal(pos: Tuple[int, int], d_c: int, goal: Tuple[int, int], N: int,
+                    passable: Optional[List[List[bool]]] = None) -> Optional[Tuple[int, int]]:
+    """
+    Slide horizontally from pos until the goal or a forced neighbor is found
+
+    A horizontal run may only turn vertically where the cell diagonally behind
+    the turn is blocked, otherwise the vertical move could have been made first.
+    """
+    row, col = pos
+    while True:
+        col += d_c
+        if not is_open((row, col), N, passable):
+            return None
+        if (row, col) == goal:
+            return row, col
+        if passable is None:
+            continue
+        for d_r in (-1, 1):
+            new_r = row + d_r
+            if 0 <= new_r < N and passable[new_r][col] and not passable[new_r][col - d_c]:
+                return row, col
+
+
+def jump_vertical(pos: Tuple[int, int], d_r: int, goal: Tuple[int, int], N: int,
+                  passable: Optional[List[List[bool]]] = None) -> Optional[Tuple[int, int]]:
+    """
+    Slide vertically from pos until the goal or a cell with a horizontal jump point
+
+    Vertical runs may turn horizontally anywhere, so each step probes both horizontal directions.
+    """
+    row, col = pos
+    while True:
+        row += d_r
+        if not is_open((row, col), N, passable):
+            return None
+        if (row, col) == goal:
+            return row, col
+        if (jump_horizontal((row, col), 1, goal, N, passable) is not None or
+                jump_horizontal((row, col), -1, goal, N, passable) is not None):
+            return row, col
+
+
+def pruned_directions(pos: Tuple[int, int], direction: Optional[Tuple[int, int]], N: int,
+                      passable: Optional[List[List[bool]]] = None) -> List[Tuple[int, int]]:
+    """Get the directions worth expanding from a jump point reached moving along direction"""
+    if direction is None:
+        return list(DDX)
+
+    d_r, d_c = direction
+    if d_c == 0:
+        # Arrived vertically: keep going or turn to either side
+        return [(d_r, 0), (0, 1), (0, -1)]
+
+    # Arrived horizontally: keep going, turn only towards forced neighbors
+    row, col = pos
+    directions = [(0, d_c)]
+    for turn in (-1, 1):
+        if (is_open((row + turn, col), N, passable) and
+                not is_open((row + turn, col - d_c), N, passable)):
+            directions.append((turn, 0))
+    return directions
+
+
+def expand_path(jump_points: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Fill in every cell between consecutive (axis aligned) jump points"""
+    path = [jump_points[0]]
+    for (r, c) in jump_points[1:]:
+        cur_r, cur_c = path[-1]
+        step_r = (r > cur_r) - (r < cur_r)
+        step_c = (c > cur_c) - (c < cur_c)
+        while (cur_r, cur_c) != (r, c):
+            cur_r += step_r
+            cur_c += step_c
+            path.append((cur_r, cur_c))
+    return path
+
+
+def jump_point_search(start: Tuple[int, int], goal: Tuple[int, int], N: int,
+                      passable: Optional[List[List[bool]]] = None, stats=None) -> Optional[List[Tuple[int, int]]]:
+    """
+    Shortest path on a 4-connected uniform-cost grid using Jump Point Search
+
+    Args:
+        start: Starting position (row, col)
+        goal: Goal position (row, col)
+        N: Grid size
+        passable: N x N grid of booleans, None means every cell is open
+        stats: Optional PlannerStats receiving expansions, pushes and latency
+
+    Returns:
+        List of positions from start to goal (same length as A*), or None if unreachable
+    """
+    if not is_open(start, N, passable) or not is_open(goal, N, passable):
+        return None
+    if start == goal:
+        return [start]
+
+    start_time = stats.start_timer() if stats is not None else 0.0
+    expanded = stale = 0
+
+    # States are (position, incoming direction): the direction decides which successors are pruned
+    start_state = (start, None)
+    g_cost = {start_state: 0}
+    parent = {start_state: None}
+    closed_set = set()
+
+    counter = 0
+    open_list = [(abs(start[0] - goal[0]) + abs(start[1] - goal[1]), counter, start_state)]
+
+    while open_list:
+        _, _, state = heapq.heappop(open_list)
+        if state in closed_set:
+            stale += 1
+            continue
+        closed_set.add(state)
+        expanded += 1
+
+        pos, direction = state
+        if pos == goal:
+            jump_points = []
+            while state is not None:
+                jump_points.append(state[0])
+                state = parent[state]
+            if stats is not None and stats.enabled:
+                stats.record_call('jump_point_search', start_time, expanded, counter, stale)
+            return expand_path(jump_points[::-1])
+
+        for (d_r, d_c) in pruned_directions(pos, direction, N, passable):
+            if d_r == 0:
+                jump_point = jump_horizontal(pos, d_c, goal, N, passable)
+            else:
+                jump_point = jump_vertical(pos, d_r, goal, N, passable)
+            if jump_point is None:
+                continue
+
+            next_state = (jump_point, (d_r, d_c))
+            if next_state in closed_set:
+                continue
+
+            tentative_g = g_cost[state] + abs(jump_point[0] - pos[0]) + abs(jump_point[1] - pos[1])
+            if tentative_g < g_cost.get(next_state, float('inf')):
+                g_cost[next_state] = tentative_g
+                parent[next_state] = state
+                counter += 1
+                h_cost = abs(jump_point[0] - goal[0]) + abs(jump_point[1] - goal[1])
+                heapq.heappush(open_list, (tentative_g + h_cost, counter, next_state))
+
+    if stats is not None and stats.enabled:
+        stats.record_call('jump_point_search', start_time, expanded, counter, stale)
+    return None
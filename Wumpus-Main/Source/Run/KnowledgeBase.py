@@ -7,6 +7,8 @@ class KnowledgeBase:
         self.KB = []  # Clauses in CNF
         self.facts = set()  # Known facts (positive literals)
         self.rules = []  # Horn clauses for forward chaining
+        self.query_count = 0  # infer() calls, reported by the benchmark suite
+        self.rule_checks = 0  # Rules examined while forward chaining
 
     def add_clause(self, clause):
         """Add a clause to the knowledge base"""
@@ -54,7 +56,8 @@ class KnowledgeBase:
         """
         # For forward chaining, we'll use a different approach
         # We'll check if we can derive the positive form of not_alpha
-        
+        self.query_count += 1
+
         if len(not_alpha) == 1 and len(not_alpha[0]) == 1:
             target_literal = not_alpha[0][0]
             if target_literal < 0:
@@ -77,6 +80,7 @@ class KnowledgeBase:
             new_facts_added = False
             
             # Check each rule
+            self.rule_checks += len(self.rules)
             for premises, conclusion in self.rules:
                 # If conclusion already derived, skip
                 if conclusion in derived_facts:
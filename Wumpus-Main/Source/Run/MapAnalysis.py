@@ -0,0 +1,197 @@
+"""
+Map pre-analysis - how hard a map is for a logical agent, computed once when the map is generated
+Flood fill over what can be proven safe from percepts, forced guesses, and the optimal action count
+"""
+
+import heapq
+from collections import deque
+from typing import Optional
+
+from constants import PIT, BREEZE, WUMPUS, STENCH, GOLD
+
+DDX = [(0, 1), (0, -1), (-1, 0), (1, 0)]
+
+# Most forced guesses a map can need and still count as 'medium'
+MEDIUM_GUESSES = 2
+
+
+def safety_closure(wumpus_map) -> dict:
+    """
+    Explore the map the way a sound propositional agent can, guessing only when it must
+
+    From the agent cell, every visited cell's percepts are applied: no breeze makes all
+    neighbours pit-free, no stench makes them wumpus-free, and a stench with a single
+    possible neighbour pins that wumpus down (once all K are pinned, every other cell is
+    wumpus-free). Cells proven pit- and wumpus-free are visited, to a fixpoint. When nothing
+    is left to prove, the agent has to guess: the frontier cell with the fewest unknowns
+    that is actually safe is taken (an optimistic, lucky guesser), and the closure resumes.
+
+    Frontier cells sit in a heap by unknown count and are pushed again whenever a percept
+    lowers it (stale entries are skipped on pop), so a guess costs a heap pop, not a scan.
+
+    Returns:
+        dict with reachable_without_guessing (cells visited before the first guess),
+        forced_guesses (guesses until both gold and exit were visited, or exploration
+        stopped), gold_without_guessing (some gold) and exit_without_guessing
+    """
+    N = wumpus_map.N
+    cells = wumpus_map.cells
+    deadly = {(row, col) for row in range(N) for col in range(N)
+              if PIT in cells[row][col] or WUMPUS in cells[row][col]}
+    golds = {(row, col) for row in range(N) for col in range(N) if GOLD in cells[row][col]}
+    wumpus_total = sum(WUMPUS in cell for row in cells for cell in row)
+    exit_pos = wumpus_map.exit
+
+    def neighbors(pos):
+        for d_r, d_c in DDX:
+            row, col = pos[0] + d_r, pos[1] + d_c
+            if 0 <= row < N and 0 <= col < N:
+                yield row, col
+
+    no_pit, no_wumpus, known_wumpus = set(), set(), set()
+    visited, frontier = set(), set()
+    all_pinned = wumpus_total == 0  # Every wumpus located: all other cells are wumpus-free
+    queue = deque([wumpus_map.agent])
+    guesses = 0
+    reachable_without_guessing = None
+    gold_without_guessing = exit_without_guessing = False
+    candidates_heap = []  # (unknowns, pos) of frontier cells, possibly stale
+
+    def wumpus_free(pos):
+        return pos in no_wumpus or (all_pinned and pos not in known_wumpus)
+
+    def unknowns(pos):
+        return (pos not in no_pit) + (not wumpus_free(pos))
+
+    def proven_safe(pos):
+        return pos in no_pit and wumpus_free(pos) and pos not in visited
+
+    while True:
+        while queue:
+            pos = queue.popleft()
+            if pos in visited or pos in deadly:
+                continue  # Already seen, or percepts that contradict the map
+            visited.add(pos)
+            frontier.discard(pos)
+            no_pit.add(pos)
+            no_wumpus.add(pos)
+            cell = cells[pos[0]][pos[1]]
+            around = list(neighbors(pos))
+            frontier.update(n for n in around if n not in visited)
+            if BREEZE not in cell:
+                no_pit.update(around)
+            if STENCH not in cell:
+                no_wumpus.update(around)
+            else:
+                candidates = [n for n in around if not wumpus_free(n)]
+                if len(candidates) == 1 and candidates[0] not in known_wumpus:
+                    known_wumpus.add(candidates[0])
+                    if len(known_wumpus) == wumpus_total:
+                        # Unvisited neighbours of visited cells are exactly the frontier
+                        all_pinned = True
+                        for n in frontier:
+                            if proven_safe(n):
+                                queue.append(n)
+                            heapq.heappush(candidates_heap, (unknowns(n), n))
+            for n in around:
+                if n not in visited:
+                    if proven_safe(n):
+                        queue.append(n)
+                    heapq.heappush(candidates_heap, (unknowns(n), n))
+
+        if reachable_without_guessing is None:
+            reachable_without_guessing = len(visited)
+            gold_without_guessing = bool(golds & visited)
+            exit_without_guessing = exit_pos in visited
+        if exit_pos in visited and (golds & visited or not golds):
+            break
+
+        guess = None
+        while candidates_heap:
+            count, n = heapq.heappop(candidates_heap)
+            if n in visited or n in deadly or n in known_wumpus:
+                continue  # Explored since, or never a good guess
+            if count == unknowns(n):
+                guess = n
+                break
+            # Otherwise stale: a fresher entry with the lower count is in the heap
+        if guess is None:
+            break
+        guesses += 1
+        queue.append(guess)
+
+    return {
+        'reachable_without_guessing': reachable_without_guessing,
+        'forced_guesses': guesses,
+        'gold_without_guessing': gold_without_guessing,
+        'exit_without_guessing': exit_without_guessing
+    }
+
+
+def optimal_actions(wumpus_map) -> Optional[int]:
+    """
+    Fewest Board actions to grab a gold and walk out, knowing the whole map
+
+    Breadth-first search over (carrying gold, row, col, facing): a turn, a move and the grab
+    each cost one action, the agent starts facing right, and walking onto the exit before
+    grabbing ends the game, so the exit only counts once gold is carried. Shooting is not
+    considered, so with a wumpus in the way this is an upper bound.
+
+    Returns:
+        The action count, or None when no gold can be grabbed and carried out safely
+    """
+    N = wumpus_map.N
+    cells = wumpus_map.cells
+    if wumpus_map.agent is None:
+        return None
+    blocked = [[PIT in cell or WUMPUS in cell for cell in row] for row in cells]
+    exit_pos = wumpus_map.exit
+
+    start = (0, wumpus_map.agent[0], wumpus_map.agent[1], 0)
+    distance = {start: 0}
+    queue = deque([start])
+    while queue:
+        state = queue.popleft()
+        carrying, row, col, facing = state
+        steps = distance[state] + 1
+        if carrying and (row, col) == exit_pos:
+            return distance[state]
+        following = [(carrying, row, col, turn) for turn in range(4) if turn != facing]
+        new_r, new_c = row + DDX[facing][0], col + DDX[facing][1]
+        if 0 <= new_r < N and 0 <= new_c < N and not blocked[new_r][new_c]:
+            if carrying or (new_r, new_c) != exit_pos:
+                following.append((carrying, new_r, new_c, facing))
+        if not carrying and GOLD in cells[row][col]:
+            following.append((1, row, col, facing))
+        for successor in following:
+            if successor not in distance:
+                distance[successor] = steps
+                queue.append(successor)
+    return None
+
+
+def analyze_map(wumpus_map) -> dict:
+    """
+    Solvability and difficulty of a map, for WumpusMap.metadata
+
+    Returns:
+        safety_closure's fields plus safe_cells (cells without pit or wumpus), optimal_actions
+        and difficulty: 'unsolvable' (no gold can be carried out, e.g. gold only on the exit cell;
+        leaving without it may still be possible), 'easy' (gold and exit
+        reachable without guessing), 'medium' (up to MEDIUM_GUESSES guesses) or 'hard'
+    """
+    analysis = safety_closure(wumpus_map) if wumpus_map.agent is not None else {
+        'reachable_without_guessing': 0, 'forced_guesses': 0,
+        'gold_without_guessing': False, 'exit_without_guessing': False}
+    analysis['safe_cells'] = sum(PIT not in cell and WUMPUS not in cell for row in wumpus_map.cells for cell in row)
+    analysis['optimal_actions'] = optimal_actions(wumpus_map)
+
+    if analysis['optimal_actions'] is None:
+        analysis['difficulty'] = 'unsolvable'
+    elif analysis['gold_without_guessing'] and analysis['exit_without_guessing']:
+        analysis['difficulty'] = 'easy'
+    elif analysis['forced_guesses'] <= MEDIUM_GUESSES:
+        analysis['difficulty'] = 'medium'
+    else:
+        analysis['difficulty'] = 'hard'
+    return analysis
@@ -0,0 +1,149 @@
+"""
+Binary map format - one byte per cell (WumpusMap.CELL_BITS) after a fixed header with N, agent and exit
+Corpus files pack many maps behind an offset table and are read through mmap, so map i loads in O(1)
+
+Map record:  '<4sHHHHH2x' magic b'WMB1', N, agent row, agent col, exit row, exit col  then N*N cell bytes
+Corpus file: '<4sIQ' magic b'WMC1', version, count  then count uint64 record offsets  then the records
+"""
+
+import mmap
+import os
+import struct
+from typing import Iterable, List, Sequence
+
+import numpy as np
+
+from Run.WumpusMap import WumpusMap
+
+MAP_MAGIC = b'WMB1'
+CORPUS_MAGIC = b'WMC1'
+CORPUS_VERSION = 1
+MAP_HEADER = struct.Struct('<4sHHHHH2x')
+CORPUS_HEADER = struct.Struct('<4sIQ')
+NO_AGENT = 0xFFFF
+
+
+def encode_map(wumpus_map: WumpusMap) -> bytes:
+    """Header plus one code byte per cell, row by row"""
+    agent = wumpus_map.agent if wumpus_map.agent is not None else (NO_AGENT, NO_AGENT)
+    header = MAP_HEADER.pack(MAP_MAGIC, wumpus_map.N, agent[0], agent[1], *wumpus_map.exit)
+    return header + wumpus_map.codes().tobytes()
+
+
+def map_codes(buffer, offset: int = 0):
+    """
+    Decode the record at offset without copying the cells
+
+    Returns:
+        (codes, agent, exit): (N, N) uint8 view into buffer, agent (row, col) or None, exit (row, col)
+    """
+    magic, N, agent_r, agent_c, exit_r, exit_c = MAP_HEADER.unpack_from(buffer, offset)
+    if magic != MAP_MAGIC:
+        raise ValueError(f"Not a binary map record at offset {offset}")
+    codes = np.frombuffer(buffer, dtype=np.uint8, count=N * N, offset=offset + MAP_HEADER.size).reshape(N, N)
+    agent = None if agent_r == NO_AGENT else (agent_r, agent_c)
+    return codes, agent, (exit_r, exit_c)
+
+
+def decode_map(buffer, offset: int = 0) -> WumpusMap:
+    codes, agent, exit_pos = map_codes(buffer, offset)
+    return WumpusMap.from_codes(codes, exit_pos, agent)
+
+
+def write_map(wumpus_map: WumpusMap, path: str):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'wb') as file:
+        file.write(encode_map(wumpus_map))
+
+
+def read_map(path: str) -> WumpusMap:
+    with open(path, 'rb') as file:
+        return decode_map(file.read())
+
+
+def write_corpus(maps: Sequence[WumpusMap], path: str):
+    """Pack maps into one corpus file; map i of the sequence gets map id i"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    offsets = np.zeros(len(maps), dtype='<u8')
+    with open(path, 'wb') as file:
+        file.write(CORPUS_HEADER.pack(CORPUS_MAGIC, CORPUS_VERSION, len(maps)))
+        file.write(offsets.tobytes())  # Placeholder, filled once the record offsets are known
+        for index, wumpus_map in enumerate(maps):
+            offsets[index] = file.tell()
+            file.write(encode_map(wumpus_map))
+        file.seek(CORPUS_HEADER.size)
+        file.write(offsets.tobytes())
+
+
+class MapCorpus:
+    """
+    Read-only, memory-mapped corpus file: corpus[i] is map i as a WumpusMap, corpus.codes(i)
+    its cells as a zero-copy uint8 array. Pages are only read when a map is touched.
+
+    codes() arrays point into the mapping and stay valid after close(): while any is alive
+    the mmap cannot be closed, so close() only drops it and it is unmapped with the last array.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.file = open(path, 'rb')
+        self.buffer = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count = CORPUS_HEADER.unpack_from(self.buffer, 0)
+        if magic != CORPUS_MAGIC or version != CORPUS_VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {CORPUS_VERSION} map corpus")
+        self.offsets = np.frombuffer(self.buffer, dtype='<u8', count=count, offset=CORPUS_HEADER.size)
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def codes(self, map_id: int):
+        """(codes, agent, exit) of a map, see map_codes"""
+        return map_codes(self.buffer, int(self.offsets[map_id]))
+
+    def __getitem__(self, map_id: int) -> WumpusMap:
+        return decode_map(self.buffer, int(self.offsets[map_id]))
+
+    def __iter__(self) -> Iterable[WumpusMap]:
+        return (self[map_id] for map_id in range(len(self)))
+
+    def close(self):
+        # Views into the mapping must go before it can be closed
+        self.offsets = None
+        if self.buffer is not None:
+            try:
+                self.buffer.close()
+            except BufferError:
+                pass  # codes() arrays still use it; unmapped once they are collected
+            self.buffer = None
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def text_to_binary(text_path: str, binary_path: str):
+    write_map(WumpusMap.from_file(text_path), binary_path)
+
+
+def binary_to_text(binary_path: str, text_path: str):
+    read_map(binary_path).write(text_path)
+
+
+def pack_text_maps(text_paths: List[str], corpus_path: str):
+    """Corpus of .txt maps, map ids in the order given"""
+    write_corpus([WumpusMap.from_file(path) for path in text_paths], corpus_path)
+
+
+def unpack_corpus(corpus_path: str, output_dir: str, prefix: str = 'map') -> List[str]:
+    """Write every corpus map as output_dir/<prefix><map id>.txt and return the paths"""
+    paths = []
+    with MapCorpus(corpus_path) as corpus:
+        for map_id, wumpus_map in enumerate(corpus):
+            paths.append(os.path.join(output_dir, f"{prefix}{map_id}.txt"))
+            wumpus_map.write(paths[-1])
+    return paths
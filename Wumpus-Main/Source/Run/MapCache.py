@@ -0,0 +1,57 @@
+"""
+Parsed map cache - a map file is parsed once per (path, mtime, size) and shared by every reader
+Base.read_map, utils.readMapInFile and Simulator.read_map_rows all get the same read-only WumpusMap back
+"""
+
+import os
+from collections import OrderedDict
+
+from Run.WumpusMap import WumpusMap
+
+MAX_ENTRIES = 64  # Maps kept, least recently used dropped first
+
+
+class MapCache:
+    """
+    Least-recently-used cache of parsed map files
+
+    Entries are keyed by absolute path and checked against the file's mtime and size on every
+    lookup, so an edited or regenerated file is parsed again. Cached maps have tuple rows and
+    are shared between callers, who must not modify them.
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()  # path -> (mtime_ns, size, WumpusMap)
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, path: str) -> WumpusMap:
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        entry = self.entries.get(path)
+        if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+            self.hits += 1
+            self.entries.move_to_end(path)
+            return entry[2]
+
+        self.misses += 1
+        wumpus_map = WumpusMap.from_file(path)
+        wumpus_map.cells = tuple(tuple(row) for row in wumpus_map.cells)
+        self.entries[path] = (stat.st_mtime_ns, stat.st_size, wumpus_map)
+        self.entries.move_to_end(path)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return wumpus_map
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = self.misses = 0
+
+
+map_cache = MapCache()
+
+
+def load_map(path: str) -> WumpusMap:
+    """Parsed map file from the shared cache (read-only, see MapCache)"""
+    return map_cache.load(path)
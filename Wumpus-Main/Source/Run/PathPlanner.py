@@ -1,7 +1,31 @@
 import heapq
 from typing import List, Tuple, Set, Optional
+from Run.Action import Action
 from Run.Cell import Cell
 from Run.CellType import CellType
+from Run.JumpPointSearch import jump_point_search
+from Run.PlannerStats import PlannerStats
+from constants import POINT
+
+# Facing of the agent as (row, col) step, keyed by the absolute TURN_* action that sets it
+FACING_STEP = {
+    Action.TURN_RIGHT: (0, 1),
+    Action.TURN_LEFT: (0, -1),
+    Action.TURN_UP: (-1, 0),
+    Action.TURN_DOWN: (1, 0)
+}
+MOVE_COST = -POINT["MOVE_FORWARD"]
+MIN_TURN_COST = min(-POINT[direction.name] for direction in FACING_STEP)
+
+# How the agent plans its walk to the exit door (PathPlanner.mode):
+#   incremental  - IncrementalExitPlanner (D* Lite) over risk-weighted cells, kept between moves
+#   turn_aware   - plan_turn_aware_path over known-safe cells, fewest emitted move + turn actions
+#   uniform      - plan_uniform_path (jump point search) over known-safe cells, fewest moves
+#   hierarchical - plan_hierarchical_path (HPA*) over known-safe cells on maps of at least
+#                  HIERARCHICAL_MIN_SIZE cells per side, incremental below that
+PLANNER_MODES = ('incremental', 'turn_aware', 'uniform', 'hierarchical')
+DEFAULT_PLANNER_MODE = 'incremental'
+HIERARCHICAL_MIN_SIZE = 64
 
 
 class PlanningNode:
@@ -42,10 +66,21 @@ class PlanningNode:
 class PathPlanner:
     """Planning Module implementing A* with cost, risk, and expected utility"""
     
-    def __init__(self, cell_matrix: List[List[Cell]], kb):
+    def __init__(self, cell_matrix: List[List[Cell]], kb, stats: PlannerStats = None,
+                 exit_pos: Tuple[int, int] = None, mode: str = DEFAULT_PLANNER_MODE):
         self.cell_matrix = cell_matrix
         self.kb = kb
         self.N = len(cell_matrix)
+        self.exit_pos = exit_pos  # Exit door (row, col), safe by the rules of the map
+        self.mode = mode  # One of PLANNER_MODES, used by plan_exit_path
+        self.hierarchy = None  # HierarchicalPlanner, built on first hierarchical query
+        self.stats = stats if stats is not None else PlannerStats()
+
+    def infer(self, alpha) -> bool:
+        """KB inference, counted in stats since it dominates planning time"""
+        if self.stats.enabled:
+            self.stats.counters['kb_infer_calls'] += 1
+        return self.kb.infer(alpha)
     
     def manhattan_distance(self, pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
         """Calculate Manhattan distance heuristic"""
@@ -53,6 +88,8 @@ class PathPlanner:
     
     def calculate_risk(self, cell: Cell) -> float:
         """Calculate risk cost for a cell based on pit/wumpus probability"""
+        if self.stats.enabled:
+            self.stats.counters['risk_evaluations'] += 1
         if cell.is_explored():
             # Known cell risks
             if cell.exist_Entity(1):  # Pit
@@ -70,12 +107,12 @@ class PathPlanner:
         
         # Try to prove NO PIT
         alpha_no_pit = [[cell.get_literal(CellType.PIT, '-')]]
-        if self.kb.infer(alpha_no_pit):
+        if self.infer(alpha_no_pit):
             safe_from_pit = True
         
         # Try to prove NO WUMPUS  
         alpha_no_wumpus = [[cell.get_literal(CellType.WUMPUS, '-')]]
-        if self.kb.infer(alpha_no_wumpus):
+        if self.infer(alpha_no_wumpus):
             safe_from_wumpus = True
         
         # If we can prove safety, low risk
@@ -86,12 +123,12 @@ class PathPlanner:
         alpha_pit = [[cell.get_literal(CellType.PIT, '+')]]
         alpha_wumpus = [[cell.get_literal(CellType.WUMPUS, '+')]]
         
-        if self.kb.infer(alpha_pit):
+        if self.infer(alpha_pit):
             risk += 1000.0  # Proven pit
         elif not safe_from_pit:
             risk += 300.0  # Uncertain about pit
             
-        if self.kb.infer(alpha_wumpus):
+        if self.infer(alpha_wumpus):
             risk += 800.0  # Proven wumpus
         elif not safe_from_wumpus:
             risk += 200.0  # Uncertain about wumpus
@@ -100,6 +137,8 @@ class PathPlanner:
     
     def calculate_utility(self, cell: Cell) -> float:
         """Calculate expected utility for a cell"""
+        if self.stats.enabled:
+            self.stats.counters['utility_evaluations'] += 1
         utility = 0.0
         
         if cell.is_explored():
@@ -191,6 +230,9 @@ class PathPlanner:
         Returns:
             List of positions representing optimal path, or None if no path found
         """
+        start_time = self.stats.start_timer()
+        expanded = pushed = 0
+
         # Priority queue for open nodes
         open_list = []
         start_cell = self.cell_matrix[start[0]][start[1]]
@@ -213,6 +255,7 @@ class PathPlanner:
             current = heapq.heappop(open_list)
             open_set.remove(current.pos)
             closed_set.add(current.pos)
+            expanded += 1
             
             # Check if we reached the goal
             if current.pos == goal:
@@ -221,6 +264,8 @@ class PathPlanner:
                 while current:
                     path.append(current.pos)
                     current = current.parent
+                if self.stats.enabled:
+                    self.stats.record_call('plan_optimal_path', start_time, expanded, pushed)
                 return path[::-1]  # Reverse to get start->goal path
             
             # Explore neighbors
@@ -253,6 +298,7 @@ class PathPlanner:
                                                risk_cost, utility, current)
                     nodes[neighbor_pos] = neighbor_node
                     heapq.heappush(open_list, neighbor_node)
+                    pushed += 1
                     open_set.add(neighbor_pos)
                 elif tentative_g < nodes[neighbor_pos].g_cost:
                     # Update existing node with better path
@@ -268,8 +314,159 @@ class PathPlanner:
                     neighbor_node.parent = current
         
         # No path found
+        if self.stats.enabled:
+            self.stats.record_call('plan_optimal_path', start_time, expanded, pushed)
         return None
     
+    def is_known_safe(self, cell: Cell) -> bool:
+        """
+        Explored cell with no pit and no wumpus, or the exit door (the map guarantees a safe
+        way to it): every such cell costs the same to cross
+        """
+        if cell.matrix_pos == self.exit_pos:
+            return True
+        return cell.is_explored() and not cell.exist_Entity(1) and not cell.exist_Entity(2)
+
+    def known_safe_grid(self) -> List[List[bool]]:
+        """Passability grid over explored safe cells"""
+        return [[self.is_known_safe(cell) for cell in row] for row in self.cell_matrix]
+
+    def plan_uniform_path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        """
+        Plan shortest path over already explored safe cells using Jump Point Search
+
+        Risk is 0 on every explored safe cell, so this region is a uniform-cost grid:
+        the path has the same length as A* but far fewer nodes are expanded.
+
+        Args:
+            start: Starting position (row, col)
+            goal: Goal position (row, col)
+
+        Returns:
+            List of positions representing the path, or None if goal is not reachable over safe cells
+        """
+        return jump_point_search(start, goal, self.N, self.known_safe_grid(), self.stats)
+
+    def turn_heuristic(self, pos: Tuple[int, int], facing: Action, goal: Tuple[int, int]) -> float:
+        """Manhattan distance plus the turns that are unavoidable to reach goal from this facing"""
+        needed = set()
+        if goal[0] != pos[0]:
+            needed.add((1 if goal[0] > pos[0] else -1, 0))
+        if goal[1] != pos[1]:
+            needed.add((0, 1 if goal[1] > pos[1] else -1))
+        needed.discard(FACING_STEP[facing])
+        return self.manhattan_distance(pos, goal) * MOVE_COST + len(needed) * MIN_TURN_COST
+
+    def plan_turn_aware_path(self, start: Tuple[int, int], goal: Tuple[int, int],
+                             facing: Action = Action.TURN_RIGHT) -> Optional[List[Tuple[int, int]]]:
+        """
+        Plan path over explored safe cells on (position, facing) states
+
+        Moving costs POINT["MOVE_FORWARD"] and changing facing costs the matching POINT["TURN_*"],
+        exactly like Board scoring, so the path minimizes the actions Base.move_to will emit.
+
+        Args:
+            start: Starting position (row, col)
+            goal: Goal position (row, col)
+            facing: Current facing of the agent as an absolute TURN_* action
+
+        Returns:
+            List of positions representing the path, or None if goal is not reachable over safe cells
+        """
+        start_time = self.stats.start_timer()
+        expanded = stale = 0
+
+        start_state = (start, facing)
+        g_cost = {start_state: 0}
+        parent = {start_state: None}
+        counter = 0
+        open_list = [(self.turn_heuristic(start, facing, goal), counter, start_state)]
+
+        while open_list:
+            f_cost, _, state = heapq.heappop(open_list)
+            pos, direction = state
+            if f_cost > g_cost[state] + self.turn_heuristic(pos, direction, goal):
+                stale += 1
+                continue  # Stale entry
+            expanded += 1
+
+            if pos == goal:
+                path = []
+                while state is not None:
+                    path.append(state[0])
+                    state = parent[state]
+                if self.stats.enabled:
+                    self.stats.record_call('plan_turn_aware_path', start_time, expanded, counter, stale)
+                return path[::-1]
+
+            for new_direction, (d_r, d_c) in FACING_STEP.items():
+                neighbor_pos = (pos[0] + d_r, pos[1] + d_c)
+                if not (0 <= neighbor_pos[0] < self.N and 0 <= neighbor_pos[1] < self.N):
+                    continue
+                if not self.is_known_safe(self.cell_matrix[neighbor_pos[0]][neighbor_pos[1]]):
+                    continue
+
+                step_cost = MOVE_COST
+                if new_direction != direction:
+                    step_cost += -POINT[new_direction.name]
+                next_state = (neighbor_pos, new_direction)
+                tentative_g = g_cost[state] + step_cost
+                if tentative_g < g_cost.get(next_state, float('inf')):
+                    g_cost[next_state] = tentative_g
+                    parent[next_state] = state
+                    counter += 1
+                    heapq.heappush(open_list, (tentative_g + self.turn_heuristic(neighbor_pos, new_direction, goal),
+                                               counter, next_state))
+
+        if self.stats.enabled:
+            self.stats.record_call('plan_turn_aware_path', start_time, expanded, counter, stale)
+        return None
+
+    def plan_hierarchical_path(self, start: Tuple[int, int], goal: Tuple[int, int],
+                               cluster_size: int = 16) -> Optional[List[Tuple[int, int]]]:
+        """
+        Plan path over explored safe cells with the hierarchical (HPA*) mode, meant for 256x256+ maps
+
+        Paths are near-optimal: they go through cluster entrances instead of the exact shortest route.
+        """
+        if self.hierarchy is None or self.hierarchy.cluster_size != cluster_size:
+            self.hierarchy = HierarchicalPlanner(self, cluster_size)
+        return self.hierarchy.plan(start, goal)
+
+    def exit_mode(self) -> str:
+        """Planner mode actually used for the exit walk on this map (hierarchical falls back on small maps)"""
+        if self.mode == 'hierarchical' and self.N < HIERARCHICAL_MIN_SIZE:
+            return 'incremental'
+        return self.mode
+
+    def plan_exit_path(self, start: Tuple[int, int], facing: Action = Action.TURN_RIGHT) -> Optional[List[Tuple[int, int]]]:
+        """
+        Path from start to the exit door over known-safe cells with the planner selected by exit_mode
+
+        The incremental mode keeps its own IncrementalExitPlanner on the agent (see
+        Solution.navigate_to_exit) and is not planned here.
+
+        Args:
+            start: Agent position (row, col)
+            facing: Current facing of the agent as an absolute TURN_* action
+
+        Returns:
+            List of positions from start to the exit, or None if no known-safe route exists
+        """
+        mode = self.exit_mode()
+        if mode == 'turn_aware':
+            return self.plan_turn_aware_path(start, self.exit_pos, facing)
+        if mode == 'uniform':
+            return self.plan_uniform_path(start, self.exit_pos)
+        if mode == 'hierarchical':
+            return self.plan_hierarchical_path(start, self.exit_pos)
+        raise ValueError(f"unknown planner mode {self.mode!r}, expected one of {PLANNER_MODES}")
+
+    def notify_changed(self, positions):
+        """Invalidate cached planning data for cells whose exploration or danger status changed"""
+        if self.hierarchy is not None:
+            self.hierarchy.notify_changed(positions)
+
     def plan_safe_exploration(self, current_pos: Tuple[int, int], 
                             explored_cells: Set[Tuple[int, int]]) -> Optional[Tuple[int, int]]:
         """
@@ -332,3 +529,414 @@ class PathPlanner:
             return relaxed_candidates[0][0]
         
         return None
+
+
+class IncrementalExitPlanner:
+    """
+    D* Lite planner that keeps its search tree towards a fixed goal (the exit door)
+
+    The search runs backwards from the goal, so g[pos] is the cost from pos to the goal.
+    When knowledge about a cell changes (explored, proven safe or dangerous, stench appears
+    or disappears) only that cell's neighbors are repaired instead of replanning from scratch.
+    """
+
+    def __init__(self, planner: PathPlanner, goal: Tuple[int, int]):
+        self.planner = planner
+        self.N = planner.N
+        self.goal = goal
+
+        self.g = {}  # Cost-to-goal of the last consistent search
+        self.rhs = {goal: 0.0}  # One-step lookahead cost-to-goal
+        self.cost_cache = {}  # Cost of entering each cell
+
+        self.open_list = []
+        self.open_keys = {}  # Current key of each queued position (lazy deletion)
+
+        self.km = 0.0  # Key modifier accumulated as the start moves
+        self.last_start = None
+
+        # Search counters, flushed into planner.stats once per plan() call
+        self.expanded = 0
+        self.pushed = 0
+        self.stale = 0
+
+        self.push(goal)
+
+    def enter_cost(self, pos: Tuple[int, int]) -> float:
+        """Cost of moving into pos: one move plus the same risk weighting as plan_optimal_path"""
+        stats = self.planner.stats
+        if pos in self.cost_cache:
+            if stats.enabled:
+                stats.counters['cache_hits'] += 1
+        else:
+            if stats.enabled:
+                stats.counters['cache_misses'] += 1
+            cell = self.planner.cell_matrix[pos[0]][pos[1]]
+            risk = self.planner.calculate_risk(cell)
+            self.cost_cache[pos] = float('inf') if risk == float('inf') else 1.0 + risk * 0.5
+        return self.cost_cache[pos]
+
+    def get_g(self, pos: Tuple[int, int]) -> float:
+        return self.g.get(pos, float('inf'))
+
+    def get_rhs(self, pos: Tuple[int, int]) -> float:
+        return self.rhs.get(pos, float('inf'))
+
+    def calculate_key(self, pos: Tuple[int, int]) -> Tuple[float, float]:
+        best = min(self.get_g(pos), self.get_rhs(pos))
+        h_cost = self.planner.manhattan_distance(self.last_start, pos) if self.last_start else 0
+        return best + h_cost + self.km, best
+
+    def push(self, pos: Tuple[int, int]):
+        key = self.calculate_key(pos)
+        self.open_keys[pos] = key
+        heapq.heappush(self.open_list, (key, pos))
+        self.pushed += 1
+
+    def update_vertex(self, pos: Tuple[int, int]):
+        if pos != self.goal:
+            best = float('inf')
+            for neighbor_pos in self.planner.get_valid_neighbors(pos):
+                cost = self.enter_cost(neighbor_pos)
+                if cost != float('inf'):
+                    best = min(best, cost + self.get_g(neighbor_pos))
+            self.rhs[pos] = best
+
+        self.open_keys.pop(pos, None)
+        if self.get_g(pos) != self.get_rhs(pos):
+            self.push(pos)
+
+    def compute_shortest_path(self):
+        start = self.last_start
+        while self.open_list:
+            key, pos = self.open_list[0]
+            if self.open_keys.get(pos) != key:
+                # Stale entry, the position was re-queued or made consistent
+                heapq.heappop(self.open_list)
+                self.stale += 1
+                continue
+
+            if key >= self.calculate_key(start) and self.get_rhs(start) == self.get_g(start):
+                break
+
+            heapq.heappop(self.open_list)
+            self.expanded += 1
+            new_key = self.calculate_key(pos)
+            if key < new_key:
+                self.push(pos)
+            elif self.get_g(pos) > self.get_rhs(pos):
+                # Over-consistent: settle the node and relax its predecessors
+                del self.open_keys[pos]
+                self.g[pos] = self.get_rhs(pos)
+                for neighbor_pos in self.planner.get_valid_neighbors(pos):
+                    self.update_vertex(neighbor_pos)
+            else:
+                # Under-consistent: the node got more expensive, reset and repair
+                self.g[pos] = float('inf')
+                self.update_vertex(pos)
+                for neighbor_pos in self.planner.get_valid_neighbors(pos):
+                    self.update_vertex(neighbor_pos)
+
+    def notify_changed(self, positions):
+        """
+        Repair the search tree after the risk of some cells changed
+
+        Args:
+            positions: Iterable of positions (row, col) whose knowledge changed
+        """
+        for pos in positions:
+            if pos not in self.cost_cache:
+                continue  # Never evaluated, nothing depends on it yet
+            old_cost = self.cost_cache.pop(pos)
+            if self.enter_cost(pos) == old_cost:
+                continue
+            # Edges into pos changed cost: every neighbor's lookahead must be recomputed
+            for neighbor_pos in self.planner.get_valid_neighbors(pos):
+                self.update_vertex(neighbor_pos)
+
+    def plan(self, start: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        """
+        Get the current best path from start to the goal, repairing the search tree as needed
+
+        Args:
+            start: Agent position (row, col)
+
+        Returns:
+            List of positions from start to goal, or None if the goal is unreachable
+        """
+        start_time = self.planner.stats.start_timer()
+        if self.last_start is not None and start != self.last_start:
+            self.km += self.planner.manhattan_distance(self.last_start, start)
+        self.last_start = start
+        self.compute_shortest_path()
+
+        if self.planner.stats.enabled:
+            # Repairs triggered by notify_changed between calls are charged to this call
+            self.planner.stats.record_call('incremental_plan', start_time, self.expanded, self.pushed, self.stale)
+        self.expanded = self.pushed = self.stale = 0
+
+        if self.get_g(start) == float('inf') and start != self.goal:
+            return None
+
+        path = [start]
+        visited = {start}
+        current = start
+        while current != self.goal:
+            next_pos = None
+            best = float('inf')
+            for neighbor_pos in self.planner.get_valid_neighbors(current):
+                cost = self.enter_cost(neighbor_pos) + self.get_g(neighbor_pos)
+                if cost < best:
+                    best = cost
+                    next_pos = neighbor_pos
+            if next_pos is None or next_pos in visited:
+                return None
+            path.append(next_pos)
+            visited.add(next_pos)
+            current = next_pos
+        return path
+
+
+class HierarchicalPlanner:
+    """
+    HPA*-style planner over known-safe cells for very large maps
+
+    The grid is split into cluster_size x cluster_size clusters. Entrances are placed on
+    every open run of a cluster border, intra-cluster entrance distances are cached, and a
+    query searches this small abstract graph first before refining only the clusters used.
+    Caches are rebuilt lazily, and only for clusters reported through notify_changed.
+    """
+
+    def __init__(self, planner: PathPlanner, cluster_size: int = 16):
+        self.planner = planner
+        self.N = planner.N
+        self.cluster_size = cluster_size
+        self.clusters_per_side = (self.N + cluster_size - 1) // cluster_size
+
+        self.border_entrances = {}  # (cluster_a, cluster_b) -> [(pos_a, pos_b), ...]
+        self.cluster_nodes = {}  # cluster -> set of entrance positions inside it
+        self.intra_edges = {}  # cluster -> {pos: {other_pos: distance}}
+        self.inter_edges = {}  # pos -> set of positions across a cluster border
+        self.segment_cache = {}  # cluster -> {(start, goal): refined path inside the cluster}
+
+        self.dirty_clusters = {(cr, cc) for cr in range(self.clusters_per_side)
+                               for cc in range(self.clusters_per_side)}
+
+    def cluster_of(self, pos: Tuple[int, int]) -> Tuple[int, int]:
+        return pos[0] // self.cluster_size, pos[1] // self.cluster_size
+
+    def cluster_bounds(self, cluster: Tuple[int, int]) -> Tuple[int, int, int, int]:
+        """Inclusive-exclusive (row_min, row_max, col_min, col_max) of a cluster"""
+        row_min = cluster[0] * self.cluster_size
+        col_min = cluster[1] * self.cluster_size
+        return (row_min, min(row_min + self.cluster_size, self.N),
+                col_min, min(col_min + self.cluster_size, self.N))
+
+    def is_passable(self, pos: Tuple[int, int]) -> bool:
+        return self.planner.is_known_safe(self.planner.cell_matrix[pos[0]][pos[1]])
+
+    def notify_changed(self, positions):
+        """Invalidate the clusters containing cells whose exploration or danger status changed"""
+        for pos in positions:
+            self.dirty_clusters.add(self.cluster_of(pos))
+
+    def build_border(self, cluster_a: Tuple[int, int], cluster_b: Tuple[int, int]) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
+        """Place one entrance in the middle of every open run along the border of two clusters"""
+        row_min, row_max, col_min, col_max = self.cluster_bounds(cluster_a)
+        if cluster_b[0] > cluster_a[0]:
+            # b is below a
+            pairs = [((row_max - 1, col), (row_max, col)) for col in range(col_min, col_max)]
+        else:
+            # b is right of a
+            pairs = [((row, col_max - 1), (row, col_max)) for row in range(row_min, row_max)]
+
+        entrances = []
+        run = []
+        for pos_a, pos_b in pairs:
+            if self.is_passable(pos_a) and self.is_passable(pos_b):
+                run.append((pos_a, pos_b))
+            elif run:
+                entrances.append(run[len(run) // 2])
+                run = []
+        if run:
+            entrances.append(run[len(run) // 2])
+        return entrances
+
+    def cluster_distances(self, source: Tuple[int, int], cluster: Tuple[int, int]) -> dict:
+        """BFS distances from source to every known-safe cell inside the cluster"""
+        row_min, row_max, col_min, col_max = self.cluster_bounds(cluster)
+        distances = {source: 0}
+        queue = [source]
+        for pos in queue:
+            for neighbor_pos in self.planner.get_valid_neighbors(pos):
+                if (neighbor_pos not in distances and row_min <= neighbor_pos[0] < row_max and
+                        col_min <= neighbor_pos[1] < col_max and self.is_passable(neighbor_pos)):
+                    distances[neighbor_pos] = distances[pos] + 1
+                    queue.append(neighbor_pos)
+        return distances
+
+    def cluster_path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        """Refine one abstract edge: shortest path between two cells staying inside start's cluster"""
+        cluster = self.cluster_of(start)
+        segments = self.segment_cache.setdefault(cluster, {})
+        stats = self.planner.stats
+        if (start, goal) in segments:
+            if stats.enabled:
+                stats.counters['cache_hits'] += 1
+            return segments[(start, goal)]
+        if stats.enabled:
+            stats.counters['cache_misses'] += 1
+
+        row_min, row_max, col_min, col_max = self.cluster_bounds(cluster)
+        parent = {start: None}
+        queue = [start]
+        for pos in queue:
+            if pos == goal:
+                path = []
+                while pos is not None:
+                    path.append(pos)
+                    pos = parent[pos]
+                segments[(start, goal)] = path[::-1]
+                return segments[(start, goal)]
+            for neighbor_pos in self.planner.get_valid_neighbors(pos):
+                if (neighbor_pos not in parent and row_min <= neighbor_pos[0] < row_max and
+                        col_min <= neighbor_pos[1] < col_max and self.is_passable(neighbor_pos)):
+                    parent[neighbor_pos] = pos
+                    queue.append(neighbor_pos)
+        return None
+
+    def refresh(self):
+        """Rebuild borders and intra-cluster distances for dirty clusters only"""
+        if not self.dirty_clusters:
+            return
+
+        rebuild = set(self.dirty_clusters)
+        for cluster in self.dirty_clusters:
+            cr, cc = cluster
+            for other in [(cr - 1, cc), (cr + 1, cc), (cr, cc - 1), (cr, cc + 1)]:
+                if not (0 <= other[0] < self.clusters_per_side and 0 <= other[1] < self.clusters_per_side):
+                    continue
+                key = (min(cluster, other), max(cluster, other))
+                entrances = self.build_border(key[0], key[1])
+                old_entrances = self.border_entrances.get(key)
+                if entrances == old_entrances:
+                    continue
+                for pos_a, pos_b in old_entrances or []:
+                    self.inter_edges.get(pos_a, set()).discard(pos_b)
+                    self.inter_edges.get(pos_b, set()).discard(pos_a)
+                for pos_a, pos_b in entrances:
+                    self.inter_edges.setdefault(pos_a, set()).add(pos_b)
+                    self.inter_edges.setdefault(pos_b, set()).add(pos_a)
+                self.border_entrances[key] = entrances
+                # The neighbor's entrance set changed, its distances are stale too
+                rebuild.add(other)
+        self.dirty_clusters = set()
+
+        for cluster in rebuild:
+            nodes = set()
+            cr, cc = cluster
+            for other in [(cr - 1, cc), (cr + 1, cc), (cr, cc - 1), (cr, cc + 1)]:
+                key = (min(cluster, other), max(cluster, other))
+                for pos_a, pos_b in self.border_entrances.get(key, []):
+                    nodes.add(pos_a if self.cluster_of(pos_a) == cluster else pos_b)
+            self.cluster_nodes[cluster] = nodes
+
+            edges = {}
+            for node in nodes:
+                distances = self.cluster_distances(node, cluster)
+                edges[node] = {other: distances[other] for other in nodes
+                               if other != node and other in distances}
+            self.intra_edges[cluster] = edges
+            self.segment_cache.pop(cluster, None)
+
+    def plan(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        """
+        Plan a path over known-safe cells: abstract search first, then refine the chosen clusters
+
+        Args:
+            start: Starting position (row, col)
+            goal: Goal position (row, col)
+
+        Returns:
+            List of positions from start to goal, or None if no known-safe route exists
+        """
+        if not self.is_passable(start) or not self.is_passable(goal):
+            return None
+        if start == goal:
+            return [start]
+        start_time = self.planner.stats.start_timer()
+        expanded = pushed = stale = 0
+        self.refresh()
+
+        start_cluster = self.cluster_of(start)
+        goal_cluster = self.cluster_of(goal)
+
+        # Temporary edges connecting start and goal to their clusters' entrances
+        start_distances = self.cluster_distances(start, start_cluster)
+        goal_distances = self.cluster_distances(goal, goal_cluster)
+        start_edges = {node: start_distances[node] for node in self.cluster_nodes.get(start_cluster, ())
+                       if node in start_distances}
+        goal_edges = {node: goal_distances[node] for node in self.cluster_nodes.get(goal_cluster, ())
+                      if node in goal_distances}
+        if start_cluster == goal_cluster and goal in start_distances:
+            start_edges[goal] = start_distances[goal]
+
+        g_cost = {start: 0}
+        parent = {start: None}
+        open_list = [(self.planner.manhattan_distance(start, goal), start)]
+        closed_set = set()
+        while open_list:
+            _, pos = heapq.heappop(open_list)
+            if pos in closed_set:
+                stale += 1
+                continue
+            closed_set.add(pos)
+            expanded += 1
+            if pos == goal:
+                break
+
+            if pos == start:
+                edges = dict(start_edges)
+            else:
+                edges = dict(self.intra_edges[self.cluster_of(pos)].get(pos, {}))
+                if pos in goal_edges:
+                    edges[goal] = goal_edges[pos]
+            for other in self.inter_edges.get(pos, ()):
+                edges[other] = 1
+
+            for neighbor_pos, cost in edges.items():
+                tentative_g = g_cost[pos] + cost
+                if tentative_g < g_cost.get(neighbor_pos, float('inf')):
+                    g_cost[neighbor_pos] = tentative_g
+                    parent[neighbor_pos] = pos
+                    heapq.heappush(open_list, (tentative_g + self.planner.manhattan_distance(neighbor_pos, goal),
+                                               neighbor_pos))
+                    pushed += 1
+        else:
+            if self.planner.stats.enabled:
+                self.planner.stats.record_call('hierarchical_plan', start_time, expanded, pushed, stale)
+            return None
+
+        abstract_path = []
+        pos = goal
+        while pos is not None:
+            abstract_path.append(pos)
+            pos = parent[pos]
+        abstract_path.reverse()
+
+        # Refinement: inter edges are single steps, intra edges are searched inside one cluster
+        path = [start]
+        for pos in abstract_path[1:]:
+            previous = path[-1]
+            if self.cluster_of(previous) != self.cluster_of(pos):
+                path.append(pos)
+                continue
+            segment = self.cluster_path(previous, pos)
+            if segment is None:
+                path = None
+                break
+            path.extend(segment[1:])
+
+        if self.planner.stats.enabled:
+            self.planner.stats.record_call('hierarchical_plan', start_time, expanded, pushed, stale)
+        return path
@@ -0,0 +1,87 @@
+"""
+Planner instrumentation - counters and per-call timers for path planning
+Disabled stats only cost an attribute check, so they can stay wired in everywhere
+"""
+
+import time
+from typing import List
+
+COUNTERS = [
+    'nodes_expanded',
+    'nodes_pushed',
+    'stale_pops',
+    'risk_evaluations',
+    'utility_evaluations',
+    'kb_infer_calls',
+    'cache_hits',
+    'cache_misses'
+]
+
+
+class PlannerStats:
+    """Counters for node expansions, heap operations, evaluations and cache use plus per-call latency"""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled  # Experiment runners switch it on per agent (see Experiment.Runner.solve_task)
+        self.counters = {}
+        self.timings = {}  # method name -> [calls, total seconds, max seconds]
+        self.reset()
+
+    def reset(self):
+        self.counters = {name: 0 for name in COUNTERS}
+        self.timings = {}
+
+    def add(self, name: str, value: int = 1):
+        self.counters[name] += value
+
+    def start_timer(self) -> float:
+        return time.perf_counter() if self.enabled else 0.0
+
+    def record_call(self, method: str, start_time: float, expanded: int = 0, pushed: int = 0, stale: int = 0):
+        """Close a timed planner call and add its search counters"""
+        elapsed = time.perf_counter() - start_time
+        self.counters['nodes_expanded'] += expanded
+        self.counters['nodes_pushed'] += pushed
+        self.counters['stale_pops'] += stale
+
+        timing = self.timings.setdefault(method, [0, 0.0, 0.0])
+        timing[0] += 1
+        timing[1] += elapsed
+        timing[2] = max(timing[2], elapsed)
+
+    def snapshot(self) -> dict:
+        """Plain-dict copy of the current counters, safe to pickle or aggregate"""
+        return {
+            'counters': dict(self.counters),
+            'timings': {method: list(timing) for method, timing in self.timings.items()}
+        }
+
+    @staticmethod
+    def aggregate(snapshots: List[dict]) -> dict:
+        """Sum several snapshots (e.g. one per game) into one"""
+        total = {'counters': {name: 0 for name in COUNTERS}, 'timings': {}}
+        for snapshot in snapshots:
+            for name, value in snapshot['counters'].items():
+                total['counters'][name] = total['counters'].get(name, 0) + value
+            for method, (calls, seconds, longest) in snapshot['timings'].items():
+                timing = total['timings'].setdefault(method, [0, 0.0, 0.0])
+                timing[0] += calls
+                timing[1] += seconds
+                timing[2] = max(timing[2], longest)
+        return total
+
+    @staticmethod
+    def format(snapshot: dict) -> List[str]:
+        """Report lines for a snapshot: counters, cache hit rate and latency per planner method"""
+        counters = snapshot['counters']
+        lines = [f"{name:<20} | {counters.get(name, 0)}" for name in COUNTERS]
+
+        lookups = counters.get('cache_hits', 0) + counters.get('cache_misses', 0)
+        hit_rate = counters.get('cache_hits', 0) / lookups * 100 if lookups else 0.0
+        lines.append(f"{'cache_hit_rate (%)':<20} | {hit_rate:.1f}")
+
+        for method, (calls, seconds, longest) in sorted(snapshot['timings'].items()):
+            average = seconds / calls if calls else 0.0
+            lines.append(f"{method:<20} | calls: {calls} | avg: {average * 1000:.3f}ms | "
+                         f"max: {longest * 1000:.3f}ms | total: {seconds:.6f}s")
+        return lines
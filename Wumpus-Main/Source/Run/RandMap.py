@@ -1,120 +1,32 @@
 import random
-import heapq
-from typing import List, Tuple, Set
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Tuple
 import sys
 import os
+
+import numpy as np
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import utils
-from constants import ROOT_INPUT
+from constants import ROOT_INPUT, PIT, BREEZE, WUMPUS, STENCH, GOLD, AGENT
+from Run.MapAnalysis import analyze_map
+from Run.VectorizedRandMap import layer_codes, neighbors
+from Run.WumpusMap import CELL_BITS, CELL_STRINGS, WumpusMap, cell_code, default_exit
 
 DDX = [(0, 1), (0, -1), (-1, 0), (1, 0)]
 
-
-class AStarNode:
-    """Node class for A* pathfinding algorithm"""
-    def __init__(self, pos: Tuple[int, int], g_cost: float = 0, h_cost: float = 0, parent=None):
-        self.pos = pos
-        self.g_cost = g_cost  # Cost from start to current node
-        self.h_cost = h_cost  # Heuristic cost from current node to goal
-        self.f_cost = g_cost + h_cost  # Total cost
-        self.parent = parent
-    
-    def __lt__(self, other):
-        return self.f_cost < other.f_cost
-    
-    def __eq__(self, other):
-        return self.pos == other.pos
-
-
-def manhattan_distance(pos1: Tuple[int, int], pos2: Tuple[int, int]) -> int:
-    """Calculate Manhattan distance between two positions"""
-    return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
-
-
-def get_neighbors(pos: Tuple[int, int], N: int) -> List[Tuple[int, int]]:
-    """Get valid neighboring positions"""
-    neighbors = []
-    for dr, dc in DDX:
-        new_r, new_c = pos[0] + dr, pos[1] + dc
-        if 0 <= new_r < N and 0 <= new_c < N:
-            neighbors.append((new_r, new_c))
-    return neighbors
-
-
-def astar_pathfinding(start: Tuple[int, int], goal: Tuple[int, int], N: int, 
-                     obstacles: Set[Tuple[int, int]] = None) -> List[Tuple[int, int]]:
-    """
-    A* pathfinding algorithm to find optimal path from start to goal
-    
-    Args:
-        start: Starting position (row, col)
-        goal: Goal position (row, col)  
-        N: Grid size
-        obstacles: Set of positions to avoid (optional)
-    
-    Returns:
-        List of positions representing the optimal path
-    """
-    if obstacles is None:
-        obstacles = set()
-    
-    # Priority queue for open nodes
-    open_list = []
-    heapq.heappush(open_list, AStarNode(start, 0, manhattan_distance(start, goal)))
-    
-    # Sets for tracking visited and open nodes
-    closed_set = set()
-    open_set = {start}
-    
-    # Dictionary for quick node lookup
-    nodes = {start: AStarNode(start, 0, manhattan_distance(start, goal))}
-    
-    while open_list:
-        # Get node with lowest f_cost
-        current = heapq.heappop(open_list)
-        open_set.remove(current.pos)
-        closed_set.add(current.pos)
-        
-        # Check if we reached the goal
-        if current.pos == goal:
-            # Reconstruct path
-            path = []
-            while current:
-                path.append(current.pos)
-                current = current.parent
-            return path[::-1]  # Reverse to get start->goal path
-        
-        # Explore neighbors
-        for neighbor_pos in get_neighbors(current.pos, N):
-            # Skip if neighbor is obstacle or already visited
-            if neighbor_pos in obstacles or neighbor_pos in closed_set:
-                continue
-            
-            # Calculate costs
-            tentative_g = current.g_cost + 1  # Cost of moving to neighbor
-            h_cost = manhattan_distance(neighbor_pos, goal)
-            
-            # If neighbor not in open set or we found a better path
-            if neighbor_pos not in open_set:
-                neighbor = AStarNode(neighbor_pos, tentative_g, h_cost, current)
-                nodes[neighbor_pos] = neighbor
-                heapq.heappush(open_list, neighbor)
-                open_set.add(neighbor_pos)
-            elif tentative_g < nodes[neighbor_pos].g_cost:
-                # Update existing node with better path
-                neighbor = nodes[neighbor_pos]
-                neighbor.g_cost = tentative_g
-                neighbor.f_cost = tentative_g + h_cost
-                neighbor.parent = current
-    
-    # No path found - fallback to simple L-shaped path
-    return create_simple_path(start, goal)
+# Bump whenever random_wumpus_map draws a different map for the same seed and parameters:
+# stored results and benchmark baselines from another version describe other maps
+GENERATOR_VERSION = 2
 
 
 def create_simple_path(start: Tuple[int, int], goal: Tuple[int, int]) -> List[Tuple[int, int]]:
     """
-    Fallback: Create simple L-shaped path when A* fails
+    L-shaped path from start to goal, horizontal leg first
+
+    random_wumpus_map lays it on a still empty grid, where it is a shortest path, so no
+    search is needed to find the safe corridor.
     """
     path = []
     current_r, current_c = start
@@ -142,196 +54,309 @@ def create_simple_path(start: Tuple[int, int], goal: Tuple[int, int]) -> List[Tu
     return path
 
 
-def create_safe_path(start_r: int, start_c: int, end_r: int, end_c: int, N: int) -> List[Tuple[int, int]]:
+def make_rng(seed=None) -> random.Random:
     """
-    Create optimal safe path using A* algorithm
+    Private random.Random for one map, so generation never touches the global random module
+
+    seed may be None (fresh entropy), an int (same stream as random.seed(seed)), a
+    numpy.random.SeedSequence (its 128-bit state seeds the stream) or a random.Random to use as is.
     """
-    start = (start_r, start_c)
-    goal = (end_r, end_c)
-    
-    # Use A* to find optimal path
-    path = astar_pathfinding(start, goal, N)
-    
-    # Ensure path is valid
-    if not path or path[0] != start or path[-1] != goal:
-        # Fallback to simple path if A* fails
-        path = create_simple_path(start, goal)
-    
-    return path
+    if isinstance(seed, random.Random):
+        return seed
+    if isinstance(seed, np.random.SeedSequence):
+        seed = int.from_bytes(seed.generate_state(4).tobytes(), 'little')
+    return random.Random(seed)
 
 
-def random_Map(N: int = 8, map_name: str = "randMap.txt", K: int = 2, p: float = 0.2) -> None:
+def random_wumpus_map(N: int = 8, K: int = 2, p: float = 0.2, seed=None,
+                      verbose: bool = False, analyze: bool = False, golds: int = 1,
+                      exit_pos: Tuple[int, int] = None) -> WumpusMap:
     """
-    Generate random N x N Wumpus World map with GUARANTEED safe path
+    Generate random N x N Wumpus World map with GUARANTEED safe path, in memory
     Args:
-        N: Grid size (default 8)
-        map_name: Output file name
+        N: Grid size (default 8), at least 2
         K: Number of Wumpus (default 2)
-        p: Pit density factor (default 0.2) - unused, will be calculated based on map size
-    
+        p: Pit density factor (default 0.2)
+        seed: int, numpy.random.SeedSequence or random.Random (see make_rng), the same seed
+              always gives the same map (default None = unseeded)
+        verbose: Print the generation details (default False)
+        analyze: Store MapAnalysis.analyze_map's solvability and difficulty in the map's
+                 metadata (default False: the analysis costs far more than generating a
+                 large map, so callers that report difficulty ask for it)
+        golds: Number of gold cells (default 1)
+        exit_pos: Exit door (row, col) (default None = default_exit(N), the bottom-left corner)
+
     NEW LOGIC:
-    - Agent spawns randomly anywhere
-    - Exit door is at bottom-left corner (N-1, 0)
-    - Number of pits = (N*N - 2) * 0.2
-    - GUARANTEED safe path from agent spawn to exit door
+    - Agent spawns randomly anywhere except the exit door
+    - Number of pits = (N*N - 2) * p
+    - GUARANTEED safe path from agent spawn to exit door: the grid is still empty, so the
+      L-shaped path is a shortest one; it and its neighbours get no pit or wumpus
+    - Wumpus, pits and gold are sampled without replacement from the cells allowed for them,
+      linear in N*N with no retry loops; with fewer allowed cells than asked for, all are used
+    - Gold never lands on a pit, a wumpus or the exit door (it could not be carried out)
+    - metadata['generation'] holds the generation stats: requested vs placed wumpus, pits and
+      gold, rejections (requested but not placed), protected and free cells, path length and time (see
+      Experiment.GeneratorStats for batches)
     """
-    _map = [['' for _ in range(N)] for _ in range(N)]
-    
+    log = print if verbose else (lambda *args: None)
+    start_time = time.perf_counter()
+    rng = make_rng(seed)
+    if N < 2:
+        raise ValueError(f"Map size must be at least 2, got {N}")
+    exit_r, exit_c = exit_pos if exit_pos is not None else default_exit(N)
+    if not utils.Utils.isValid(exit_r, exit_c, N):
+        raise ValueError(f"Exit door {(exit_r, exit_c)} is outside the {N}x{N} map")
+
     # Calculate number of pits based on map size and probability
     total_cells = N * N
-    num_pits = int((total_cells - 2) * p)  # Use provided pit probability
-    
-    print(f"Map size: {N}x{N} = {total_cells} cells")
-    print(f"Number of pits to place: {num_pits}")
-    
-    # Step 1: Set exit door position (bottom-left corner)
-    from constants import EXIT_DOOR_ROW, EXIT_DOOR_COL
-    exit_r = EXIT_DOOR_ROW    # Bottom row (N-1)
-    exit_c = EXIT_DOOR_COL    # Left column (0)
-    
-    # Step 2: Choose random agent spawn position (not at exit)
-    agent_r, agent_c = None, None
-    attempts = 0
-    while agent_r is None and attempts < 100:
-        temp_r = random.randint(0, N-1)
-        temp_c = random.randint(0, N-1)
-        # Agent cannot spawn at exit door position
-        if not (temp_r == exit_r and temp_c == exit_c):
-            agent_r = temp_r
-            agent_c = temp_c
-        attempts += 1
-    
-    # Fallback if no valid position found
-    if agent_r is None:
-        agent_r = N - 1  # Bottom row
-        agent_c = N - 1  # Right column
-    
-    # Step 3: Create GUARANTEED safe path from agent to exit using simple pathfinding
-    safe_path = create_safe_path(agent_r, agent_c, exit_r, exit_c, N)
-    
-    # Step 4: Mark all safe path cells and their neighbors as protected
-    protected_cells = set()
-    for (r, c) in safe_path:
-        protected_cells.add((r, c))
-        # Add adjacent cells to protected zone
-        for (d_r, d_c) in DDX:
-            new_r = r + d_r
-            new_c = c + d_c
-            if utils.Utils.isValid(new_r, new_c, N):
-                protected_cells.add((new_r, new_c))
-    
-    # Step 5: Place agent
-    _map[agent_r][agent_c] = 'A'
-    # Step 6: Place exactly K Wumpus randomly (not in protected cells)
-    wumpus_count = 0
-    max_attempts = 1000  # Increase max attempts to ensure we place all wumpus
-    attempts = 0
-    while wumpus_count < K and attempts < max_attempts:
-        row = random.randint(0, N-1)
-        col = random.randint(0, N-1)
-        if (row, col) not in protected_cells and 'W' not in _map[row][col]:
-            _map[row][col] += 'W'
-            wumpus_count += 1
-            # Add stench to adjacent cells (only if not protected)
-            for (d_r, d_c) in DDX:
-                neighbor_row = row + d_r
-                neighbor_col = col + d_c
-                if utils.Utils.isValid(neighbor_row, neighbor_col, N):
-                    # Only add stench if not in protected safe path
-                    if (neighbor_row, neighbor_col) not in safe_path:
-                        if 'S' not in _map[neighbor_row][neighbor_col]:
-                            _map[neighbor_row][neighbor_col] += 'S'
-        attempts += 1
-    
-    # Step 7: Place exact number of pits (not in protected cells)
-    pit_count = 0
-    attempts = 0
-    available_cells = []
-    
-    # Collect all available cells for pit placement
-    for row in range(N):
-        for col in range(N):
-            if ((row, col) not in protected_cells and 
-                'W' not in _map[row][col] and 
-                'A' not in _map[row][col]):
-                available_cells.append((row, col))
-    
-    print(f"Available cells for pit placement: {len(available_cells)}")
-    
-    # Randomly select cells for pit placement
-    if len(available_cells) >= num_pits:
-        selected_pit_cells = random.sample(available_cells, num_pits)
-        
-        for pit_row, pit_col in selected_pit_cells:
-            _map[pit_row][pit_col] += 'P'
-            pit_count += 1
-            
-            # Add breeze to adjacent cells (only if not protected)
-            for (d_r, d_c) in DDX:
-                neighbor_row = pit_row + d_r
-                neighbor_col = pit_col + d_c
-                if utils.Utils.isValid(neighbor_row, neighbor_col, N):
-                    # Only add breeze if not in protected safe path
-                    if (neighbor_row, neighbor_col) not in safe_path:
-                        if 'B' not in _map[neighbor_row][neighbor_col]:
-                            _map[neighbor_row][neighbor_col] += 'B'
-    else:
-        print(f"Warning: Not enough available cells for {num_pits} pits. Only {len(available_cells)} available.")
-        # Place as many pits as possible
-        for pit_row, pit_col in available_cells:
-            _map[pit_row][pit_col] += 'P'
-            pit_count += 1
-            
-            # Add breeze to adjacent cells
-            for (d_r, d_c) in DDX:
-                neighbor_row = pit_row + d_r
-                neighbor_col = pit_col + d_c
-                if utils.Utils.isValid(neighbor_row, neighbor_col, N):
-                    if (neighbor_row, neighbor_col) not in safe_path:
-                        if 'B' not in _map[neighbor_row][neighbor_col]:
-                            _map[neighbor_row][neighbor_col] += 'B'
-    
-    print(f"Actually placed pits: {pit_count}")
-    
-    # Step 8: Place exactly one gold (can be anywhere except cells with pit or wumpus)
-    gold_placed = False
-    attempts = 0
-    while not gold_placed and attempts < 100:
-        row = random.randint(0, N-1)
-        col = random.randint(0, N-1)
-        if 'P' not in _map[row][col] and 'W' not in _map[row][col]:
-            _map[row][col] += 'G'
-            gold_placed = True
-        attempts += 1
-
-    # Step 9: Fill empty cells
-    for row in range(N):
-        for col in range(N):
-            if len(_map[row][col]) == 0:
-                _map[row][col] = '-'
-                
+    num_pits = int((total_cells - 2) * p)
+
+    log(f"Map size: {N}x{N} = {total_cells} cells")
+    log(f"Number of pits to place: {num_pits}")
+
+    # Step 1: Choose random agent spawn position, uniform over every cell but the exit door
+    exit_index = exit_r * N + exit_c
+    agent_index = rng.randrange(total_cells - 1)
+    agent_index += agent_index >= exit_index
+    agent_r, agent_c = divmod(agent_index, N)
+    # NumPy stream seeded from rng for the placements: Generator.choice samples without
+    # replacement in linear time, where random.sample would loop in Python per pit
+    sampler = np.random.default_rng(rng.getrandbits(128))
+
+    # Step 2: Safe path from agent to exit, protected together with its neighbours
+    safe_path = create_simple_path((agent_r, agent_c), (exit_r, exit_c))
+    path = np.zeros((1, N, N), dtype=bool)
+    path[0, [r for r, _ in safe_path], [c for _, c in safe_path]] = True
+    protected = path | neighbors(path)
+
+    # Step 3: Wumpus and pits in one draw from the unprotected cells (wumpus first, as K is exact)
+    free_cells = np.flatnonzero(~protected)
+    placed = sampler.choice(free_cells, min(K + num_pits, len(free_cells)), replace=False)
+    wumpus = np.zeros(total_cells, dtype=bool)
+    wumpus[placed[:K]] = True
+    pit = np.zeros(total_cells, dtype=bool)
+    pit[placed[K:]] = True
+    log(f"Available cells for wumpus and pit placement: {len(free_cells)}")
+    if len(placed) < K + num_pits:
+        log(f"Warning: Not enough available cells for {K} wumpus and {num_pits} pits. "
+            f"Only {len(free_cells)} available (see metadata['generation'])")
+
+    # Step 4: Place gold (anywhere except cells with pit or wumpus, and the exit door)
+    gold_allowed = ~(pit | wumpus)
+    gold_allowed[exit_index] = False
+    gold_cells = np.flatnonzero(gold_allowed)
+    gold = np.zeros(total_cells, dtype=bool)
+    gold[sampler.choice(gold_cells, min(golds, len(gold_cells)), replace=False)] = True
+
+    # Step 5: Stench and breeze next to wumpus and pits, except on the safe path
+    wumpus = wumpus.reshape(1, N, N)
+    pit = pit.reshape(1, N, N)
+    agent = np.zeros((1, N, N), dtype=bool)
+    agent[0, agent_r, agent_c] = True
+    codes = layer_codes({
+        'agent': agent,
+        'wumpus': wumpus,
+        'stench': neighbors(wumpus) & ~path,
+        'pit': pit,
+        'breeze': neighbors(pit) & ~path,
+        'gold': gold.reshape(1, N, N)
+    })[0]
+
+    wumpus_map = WumpusMap.from_codes(codes, (exit_r, exit_c), (agent_r, agent_c))
+    # Generation stats: every draw is without replacement from allowed cells, so a placement
+    # attempt never fails; rejections are requested entities left out for lack of room
+    requested = {'wumpus': K, 'pits': num_pits, 'golds': golds}
+    placed_counts = {'wumpus': min(K, len(placed)), 'pits': max(0, len(placed) - K), 'golds': int(gold.sum())}
+    stats = {
+        'generator_version': GENERATOR_VERSION,
+        'N': N,
+        'agent': (agent_r, agent_c),
+        'exit': (exit_r, exit_c),
+        'path_length': len(safe_path),
+        'protected_cells': int(protected.sum()),
+        'free_cells': len(free_cells),
+        'rejections': sum(requested.values()) - sum(placed_counts.values()),
+        'time': time.perf_counter() - start_time
+    }
+    for entity in requested:
+        stats[f'requested_{entity}'] = requested[entity]
+        stats[f'placed_{entity}'] = placed_counts[entity]
+    wumpus_map.metadata['generation'] = stats
+
     # Debug: Print map generation information
-    print(f"Generated map using A* pathfinding:")
-    print(f"Agent spawn: ({agent_r}, {agent_c})")
-    print(f"Exit door: ({exit_r}, {exit_c})")
-    print(f"Map size: {N}x{N} = {total_cells} cells")
-    print(f"Wumpus placed: {wumpus_count}/{K}")
-    print(f"Pits placed: {pit_count}/{num_pits}")
-    print(f"A* optimal path length: {len(safe_path)} cells")
-    print(f"Protected cells (path + buffer): {len(protected_cells)} cells")
-    print(f"Path: {' -> '.join([f'({r},{c})' for r, c in safe_path])}")
-    
-    # Write file only once
-    file = open(f'{ROOT_INPUT}{map_name}', 'w')
-    file.write(f'{N}\n')
-    for row in range(N):
-        for col in range(N):
-            file.write(_map[row][col])
-            if col != N - 1:
-                file.write('.')
-        if row != N - 1:
-            file.write('\n')
-    file.close()
+    log(f"Agent spawn: {stats['agent']}")
+    log(f"Exit door: {stats['exit']}")
+    log(f"Wumpus placed: {stats['placed_wumpus']}/{K}")
+    log(f"Pits placed: {stats['placed_pits']}/{num_pits}")
+    log(f"Gold placed: {stats['placed_golds']}/{golds}")
+    log(f"Safe path length: {stats['path_length']} cells")
+    log(f"Protected cells (path + buffer): {stats['protected_cells']} cells")
+
+    if analyze:
+        analysis_start = time.perf_counter()
+        wumpus_map.metadata.update(analyze_map(wumpus_map))
+        stats['analysis_time'] = time.perf_counter() - analysis_start
+        log(f"Difficulty: {wumpus_map.metadata['difficulty']} "
+            f"({wumpus_map.metadata['forced_guesses']} forced guesses)")
+    return wumpus_map
+
+
+def random_Map(N: int = 8, map_name: str = "randMap.txt", K: int = 2, p: float = 0.2,
+               output_dir: str = ROOT_INPUT, seed=None, verbose: bool = True, golds: int = 1,
+               exit_pos: Tuple[int, int] = None) -> WumpusMap:
+    """
+    Generate a random map (see random_wumpus_map) and write it to output_dir/map_name
+    Args:
+        map_name: Output file name, None to only return the map
+        output_dir: Directory the map file is written to (default ROOT_INPUT)
+        verbose: Print the generation details (default True)
+    """
+    wumpus_map = random_wumpus_map(N, K, p, seed, verbose, golds=golds, exit_pos=exit_pos)
+    if map_name is not None:
+        wumpus_map.write(os.path.join(output_dir, map_name))
+    return wumpus_map
+
+
+def corpus_map(args) -> WumpusMap:
+    """random_wumpus_map for one (N, K, p, SeedSequence, analyze) entry of random_corpus (runs in a worker)"""
+    N, K, p, seed_sequence, analyze = args
+    return random_wumpus_map(N, K, p, seed_sequence, analyze=analyze)
+
+
+def random_corpus(count: int, N: int = 8, K: int = 2, p: float = 0.2, seed=None,
+                  workers: int = 1, analyze: bool = False) -> List[WumpusMap]:
+    """
+    count maps, each from its own stream spawned off one numpy.random.SeedSequence
+
+    Map i only depends on (seed, i), so the corpus is the same whatever workers is and
+    whichever process generates which map.
+
+    Args:
+        seed: int or SeedSequence for the whole corpus (None = fresh entropy); a SeedSequence
+              passed in keeps numpy's spawn count, so calling again with it gives new maps
+        workers: Processes generating maps (1 = in this process, None = CPU count)
+        analyze: Run MapAnalysis on every map (default False, see random_wumpus_map)
+    """
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    jobs = [(N, K, p, child, analyze) for child in root.spawn(count)]
+    if workers == 1:
+        return [corpus_map(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(corpus_map, jobs, chunksize=max(1, count // 64)))
+
+
+# Entity letter -> percept letter it puts on the 4 neighbouring cells (gold has none)
+PERCEPTS = {PIT: BREEZE, WUMPUS: STENCH, GOLD: None}
+
+
+def set_letter(cell: str, letter: str, present: bool) -> str:
+    """Cell string with letter added or removed, in the CELL_BITS letter order ('-' when empty)"""
+    code = cell_code(cell)
+    code = code | CELL_BITS[letter] if present else code & ~CELL_BITS[letter]
+    return CELL_STRINGS[code]
+
+
+def mutate_map(base: WumpusMap, edits: Iterable[tuple]) -> WumpusMap:
+    """
+    Copy of base with entity edits applied, only touching the edited cells and their neighbours
+
+    Each edit is ('add', entity, pos), ('remove', entity, pos) or ('move', entity, from_pos, to_pos)
+    with entity PIT, WUMPUS or GOLD. Breeze and stench are updated on the 4 neighbours only: a
+    percept is added next to a new pit or wumpus, and cleared next to a removed one unless
+    another of its kind still touches that cell. Rows are copied on first write, so the base
+    (which may be a read-only Run.MapCache map) is never modified.
+
+    Pits and wumpus may not be put on the agent or the exit door, nor on a cell that already
+    has one of the same entity; removing an entity that is not there is an error too.
+
+    Returns:
+        The new map, with the edits in metadata['mutation'] (base analysis does not carry over)
+    """
+    N = base.N
+    cells = list(base.cells)
+    copied = set()
+
+    def write(row: int, col: int, cell: str):
+        if row not in copied:
+            cells[row] = list(cells[row])
+            copied.add(row)
+        cells[row][col] = cell
+
+    def place(entity: str, pos: Tuple[int, int], present: bool):
+        row, col = pos
+        if entity not in PERCEPTS:
+            raise ValueError(f"Cannot edit {entity!r}, only {', '.join(PERCEPTS)}")
+        if not utils.Utils.isValid(row, col, N):
+            raise ValueError(f"{pos} is outside the {N}x{N} map")
+        if (entity in cells[row][col]) == present:
+            raise ValueError(f"{pos} {'already has' if present else 'has no'} {entity}")
+        if present and entity != GOLD and (pos == base.agent or pos == base.exit):
+            raise ValueError(f"Cannot put {entity} on the agent or exit cell {pos}")
+        write(row, col, set_letter(cells[row][col], entity, present))
+
+        percept = PERCEPTS[entity]
+        if percept is None:
+            return
+        for d_r, d_c in DDX:
+            n_r, n_c = row + d_r, col + d_c
+            if not (0 <= n_r < N and 0 <= n_c < N):
+                continue
+            if not present:
+                # Keep the percept if another entity of this kind still touches the cell
+                if any(0 <= n_r + e_r < N and 0 <= n_c + e_c < N and entity in cells[n_r + e_r][n_c + e_c]
+                       for e_r, e_c in DDX):
+                    continue
+            if (percept in cells[n_r][n_c]) != present:
+                write(n_r, n_c, set_letter(cells[n_r][n_c], percept, present))
+
+    applied = []
+    for edit in edits:
+        kind, entity, *positions = edit
+        if kind == 'move':
+            place(entity, tuple(positions[0]), False)
+            place(entity, tuple(positions[1]), True)
+        elif kind in ('add', 'remove'):
+            place(entity, tuple(positions[0]), kind == 'add')
+        else:
+            raise ValueError(f"Unknown edit {kind!r}, expected add, remove or move")
+        applied.append(tuple(edit))
+
+    mutated = WumpusMap(cells, base.exit, base.agent)
+    mutated.metadata['mutation'] = applied
+    return mutated
+
+
+def map_family(base: WumpusMap, count: int, seed=None, entities: Iterable[str] = (PIT, WUMPUS),
+               analyze: bool = False) -> List[WumpusMap]:
+    """
+    count variants of base, each with one pit or wumpus (of the given kinds) moved to another cell
+
+    The target is drawn uniformly from the cells free of pit, wumpus, gold, agent and exit, so
+    variants stay valid maps but may lose the guaranteed safe path - robustness benchmarks
+    want exactly that. Free cells are listed once; each variant costs one mutate_map.
+
+    Args:
+        seed: int, SeedSequence or random.Random (see make_rng)
+        analyze: Run MapAnalysis on every variant (default False, it costs more than the edit)
+    """
+    rng = make_rng(seed)
+    sources = [(entity, pos) for entity in entities for pos in base.positions(entity)]
+    if not sources:
+        raise ValueError(f"Base map has no {' or '.join(entities)} to move")
+    free = [(row, col) for row in range(base.N) for col in range(base.N)
+            if not any(letter in base.cells[row][col] for letter in (PIT, WUMPUS, GOLD, AGENT))
+            and (row, col) != base.exit]
+    if not free:
+        raise ValueError("Base map has no free cell to move an entity to")
+
+    family = []
+    for _ in range(count):
+        entity, source = sources[rng.randrange(len(sources))]
+        variant = mutate_map(base, [('move', entity, source, free[rng.randrange(len(free))])])
+        if analyze:
+            variant.metadata.update(analyze_map(variant))
+        family.append(variant)
+    return family
 
 
 if __name__ == "__main__":
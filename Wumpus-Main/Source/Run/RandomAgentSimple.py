@@ -19,6 +19,7 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from Action import Action
+from Run.WumpusMap import WumpusMap, default_exit
 
 class SimpleAction:
     """Simplified Action representation for random agent"""
@@ -62,9 +63,13 @@ class RandomAgentBaseline:
         
         # Read map size (simplified)
         self.map_size = self._read_map_size()
+        self.exit_pos = (self.input_filename.exit if isinstance(self.input_filename, WumpusMap)
+                         else default_exit(self.map_size))
     
     def _read_map_size(self):
-        """Read map size from input file"""
+        """Read map size from input file (or an in-memory WumpusMap)"""
+        if isinstance(self.input_filename, WumpusMap):
+            return self.input_filename.N
         try:
             with open(self.input_filename, 'r') as f:
                 first_line = f.readline().strip()
@@ -108,8 +113,7 @@ class RandomAgentBaseline:
             possible_actions.append(SimpleAction.SHOOT)
         
         # Add exit if at exit door position
-        from constants import EXIT_DOOR_ROW, EXIT_DOOR_COL
-        if self.current_position == (EXIT_DOOR_ROW, EXIT_DOOR_COL):
+        if self.current_position == self.exit_pos:
             possible_actions.append(SimpleAction.CLIMB_OUT_OF_THE_CAVE)
         
         # Choose random action
@@ -186,8 +190,7 @@ class RandomAgentBaseline:
             
             # Random chance to exit early (simulate getting "lucky")
             if self.performance_metrics['total_moves'] > 50 and random.random() < 0.1:
-                from constants import EXIT_DOOR_ROW, EXIT_DOOR_COL
-                if self.current_position == (EXIT_DOOR_ROW, EXIT_DOOR_COL) or random.random() < 0.3:
+                if self.current_position == self.exit_pos or random.random() < 0.3:
                     self.add_action(SimpleAction.CLIMB_OUT_OF_THE_CAVE)
                     self.performance_metrics['reached_exit'] = True
                     self.game_ended = True
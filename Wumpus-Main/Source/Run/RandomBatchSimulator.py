@@ -0,0 +1,187 @@
+"""
+Vectorized random baseline - plays thousands of RandomAgentBaseline games in lockstep with NumPy
+Each step draws every game's next action from one Generator and applies the Board rules with masks
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from constants import POINT, PIT, WUMPUS, AGENT
+from Run.WumpusMap import default_exit
+
+# Action codes used inside the batch
+MOVE_FORWARD, TURN_LEFT, TURN_RIGHT, GRAB_GOLD, SHOOT, CLIMB_OUT_OF_THE_CAVE = range(6)
+
+# RandomAgentBaseline's own (x, y) position model: facing 0=UP, 1=RIGHT, 2=DOWN, 3=LEFT
+INTERNAL_STEP_X = np.array([0, 1, 0, -1])
+INTERNAL_STEP_Y = np.array([-1, 0, 1, 0])
+
+# Board facing after TURN_LEFT / TURN_RIGHT (both are absolute turns there): 0=RIGHT, 1=LEFT.
+# The random agent never turns up or down, so on the Board it only ever moves along its row.
+REAL_STEP_C = np.array([1, -1])
+
+DEATH_CHANCE = 0.02      # Per-move chance that the random agent stops ("dies") in its own model
+EARLY_EXIT_AFTER = 50    # Moves before the agent starts trying to climb out
+EARLY_EXIT_CHANCE = 0.1
+LUCKY_EXIT_CHANCE = 0.3
+
+
+def parse_maps(maps: List[List[List[str]]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Stack same-size parsed maps into arrays
+
+    Returns:
+        pits (M, N, N) bool, wumpus (M, N, N) bool and agent starts (M, 2) int
+    """
+    N = len(maps[0])
+    pits = np.zeros((len(maps), N, N), dtype=bool)
+    wumpus = np.zeros((len(maps), N, N), dtype=bool)
+    starts = np.zeros((len(maps), 2), dtype=np.int64)
+    for index, rows in enumerate(maps):
+        found = False
+        for row in range(N):
+            for col in range(N):
+                cell = rows[row][col]
+                pits[index, row, col] = PIT in cell
+                wumpus[index, row, col] = WUMPUS in cell
+                if AGENT in cell and not found:
+                    starts[index] = (row, col)
+                    found = True
+        if not found:
+            raise ValueError(f"Map {index} has no agent cell")
+    return pits, wumpus, starts
+
+
+def simulate_random_agents(pits: np.ndarray, wumpus: np.ndarray, starts: np.ndarray,
+                           map_index: np.ndarray = None, rng: np.random.Generator = None,
+                           max_moves: int = 200, exit_pos: Optional[Tuple[int, int]] = None) -> dict:
+    """
+    Play one RandomAgentBaseline game per entry of map_index, all games advancing together
+
+    The action policy is RandomAgentBaseline.solve's (uniform over MOVE_FORWARD, TURN_LEFT,
+    TURN_RIGHT, GRAB_GOLD, SHOOT while the arrow is unused and CLIMB when its own position
+    model is at the exit; 2% stop chance per move; lucky early exit after 50 moves; at most
+    max_moves moves) and the scoring is Run.Simulator's, so results follow the same
+    distribution as solving and replaying games one at a time.
+
+    Args:
+        pits, wumpus: (M, N, N) bool map arrays (see parse_maps)
+        starts: (M, 2) agent start (row, col) per map
+        map_index: (G,) map played by each game, default one game per map
+        rng: NumPy Generator, default an unseeded one
+        max_moves: RandomAgentBaseline.max_moves
+        exit_pos: Exit door (row, col), default default_exit(N)
+
+    Returns:
+        dict of (G,) arrays: won, dead, score, actions (length of the agent's action list)
+        and replayed (actions processed before the game ended)
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    M, N, _ = pits.shape
+    map_index = np.arange(M) if map_index is None else np.asarray(map_index)
+    G = len(map_index)
+    flat_pits = pits.reshape(M, N * N)
+    flat_wumpus = wumpus.reshape(M, N * N)
+    exit_pos = exit_pos if exit_pos is not None else default_exit(N)
+    exit_cell = exit_pos[0] * N + exit_pos[1]
+
+    results = {
+        'won': np.zeros(G, dtype=bool),
+        'dead': np.zeros(G, dtype=bool),
+        'score': np.zeros(G, dtype=np.int64),
+        'actions': np.zeros(G, dtype=np.int64),
+        'replayed': np.zeros(G, dtype=np.int64)
+    }
+
+    # Per-game state of the games still generating actions; finished games are dropped every step
+    state = {
+        'game': np.arange(G),
+        'map': map_index,
+        # Agent side: what RandomAgentBaseline believes and how many actions it has emitted
+        'x': np.zeros(G, dtype=np.int64),
+        'y': np.zeros(G, dtype=np.int64),
+        'internal_facing': np.zeros(G, dtype=np.int64),
+        'arrow_used': np.zeros(G, dtype=bool),
+        'moves': np.zeros(G, dtype=np.int64),
+        'actions': np.zeros(G, dtype=np.int64),
+        # Board side: the real game the actions are replayed in, starting facing RIGHT
+        'row': starts[map_index, 0].copy(),
+        'col': starts[map_index, 1].copy(),
+        'real_facing': np.zeros(G, dtype=np.int64),
+        'has_gold': np.zeros(G, dtype=bool),
+        'killed': np.full(G, -1, dtype=np.int64),  # Cell of the wumpus shot (one arrow, so at most one)
+        'score': np.zeros(G, dtype=np.int64),
+        'replayed': np.zeros(G, dtype=np.int64),
+        'won': np.zeros(G, dtype=bool),
+        'dead': np.zeros(G, dtype=bool),
+        'playing': np.ones(G, dtype=bool)
+    }
+
+    while len(state['game']):
+        s = state
+        n = len(s['game'])
+        at_exit = (s['x'] == exit_pos[0]) & (s['y'] == exit_pos[1])
+        options = 4 + (~s['arrow_used']) + at_exit
+        choice = (rng.random(n) * options).astype(np.int64)
+        action = np.where(choice < 4, choice,
+                          np.where((choice == 4) & ~s['arrow_used'], SHOOT, CLIMB_OUT_OF_THE_CAVE))
+        s['moves'] += 1
+        s['actions'] += 1
+
+        # Agent's own model
+        is_move = action == MOVE_FORWARD
+        facing = s['internal_facing']
+        s['x'] = np.where(is_move, np.clip(s['x'] + INTERNAL_STEP_X[facing], 0, N - 1), s['x'])
+        s['y'] = np.where(is_move, np.clip(s['y'] + INTERNAL_STEP_Y[facing], 0, N - 1), s['y'])
+        facing = np.where(action == TURN_LEFT, (facing - 1) % 4, facing)
+        s['internal_facing'] = np.where(action == TURN_RIGHT, (facing + 1) % 4, facing)
+        s['arrow_used'] |= action == SHOOT
+        ended = (action == CLIMB_OUT_OF_THE_CAVE) | (rng.random(n) < DEATH_CHANCE)
+
+        # Board rules for games still running
+        live = s['playing']
+        s['replayed'] += live
+        turn = live & ((action == TURN_LEFT) | (action == TURN_RIGHT))
+        s['real_facing'] = np.where(turn, action == TURN_LEFT, s['real_facing'])
+        s['score'] += np.where(turn, np.where(action == TURN_LEFT, POINT['TURN_LEFT'], POINT['TURN_RIGHT']), 0)
+
+        grab = live & (action == GRAB_GOLD)
+        s['has_gold'] |= grab
+        s['score'] += np.where(grab, POINT['PICK_GOLD'], 0)
+
+        step = REAL_STEP_C[s['real_facing']]
+        shoot = live & (action == SHOOT)
+        target_c = s['col'] + step
+        inside = (target_c >= 0) & (target_c < N)
+        target = s['row'] * N + np.where(inside, target_c, 0)
+        hit = shoot & inside & flat_wumpus[s['map'], target]
+        s['killed'] = np.where(hit, target, s['killed'])
+        s['score'] += np.where(shoot, POINT['SHOOT'], 0)
+
+        move = live & is_move
+        s['col'] = np.where(move & inside, target_c, s['col'])
+        cell = s['row'] * N + s['col']
+        s['score'] += np.where(move, POINT['MOVE_FORWARD'], 0)
+        deadly = move & (flat_pits[s['map'], cell] | (flat_wumpus[s['map'], cell] & (s['killed'] != cell)))
+        s['score'] += np.where(deadly, POINT['DYING'], 0)
+        escaped = move & ~deadly & (cell == exit_cell)
+        s['score'] += np.where(escaped & s['has_gold'], POINT['CLIMB_WITH_GOLD'], 0)
+        s['dead'] |= deadly
+        s['won'] |= escaped
+        s['playing'] &= ~(deadly | escaped)
+
+        # Lucky early exit: the agent appends one CLIMB (no score on the Board) and stops
+        lucky = (s['moves'] > EARLY_EXIT_AFTER) & (rng.random(n) < EARLY_EXIT_CHANCE)
+        lucky &= ((s['x'] == exit_pos[0]) & (s['y'] == exit_pos[1])) | (rng.random(n) < LUCKY_EXIT_CHANCE)
+        s['actions'] += lucky
+        s['replayed'] += lucky & s['playing']
+
+        done = ended | lucky | (s['moves'] >= max_moves)
+        if done.any():
+            finished = s['game'][done]
+            for key in results:
+                results[key][finished] = s[key][done]
+            state = {key: value[~done] for key, value in s.items()}
+
+    return results
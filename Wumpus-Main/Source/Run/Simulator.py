@@ -0,0 +1,180 @@
+"""
+Pure simulation of a game - replays an action list with the Entity.Board.move rules
+No pygame, images or screen margins, so batch runs can score games without a display
+"""
+
+from typing import Iterable, Optional, Sequence, Tuple
+
+from constants import POINT, PIT, WUMPUS, GOLD, AGENT
+from Run.MapCache import load_map
+from Run.WumpusMap import default_exit
+
+DDX = [(0, 1), (0, -1), (-1, 0), (1, 0)]
+
+# Action name -> small integer, so the replay loop dispatches on ints
+TURN_RIGHT, TURN_LEFT, TURN_UP, TURN_DOWN, MOVE_FORWARD, GRAB_GOLD, SHOOT, FALL_INTO_PIT, NO_SCORE = range(9)
+ACTION_CODES = {
+    'TURN_RIGHT': TURN_RIGHT,
+    'TURN_LEFT': TURN_LEFT,
+    'TURN_UP': TURN_UP,
+    'TURN_DOWN': TURN_DOWN,
+    'MOVE_FORWARD': MOVE_FORWARD,
+    'GRAB_GOLD': GRAB_GOLD,
+    'SHOOT': SHOOT,
+    'FALL_INTO_PIT': FALL_INTO_PIT
+}
+
+# Facing code (same order as the TURN_* codes) -> (row, col) step, like Entity.Agent.move_forward
+FACING_STEP = [(0, 1), (0, -1), (-1, 0), (1, 0)]
+
+
+def read_map_rows(map_path: str) -> Sequence[Sequence[str]]:
+    """Map cells as strings, without the pygame margin bookkeeping of utils.readMapInFile (cached, read-only)"""
+    return load_map(map_path).cells
+
+
+class Simulator:
+    """
+    Replays action lists against one parsed map
+
+    Rules follow Entity.Board.move exactly: TURN_* sets an absolute facing, MOVE_FORWARD
+    off the map leaves the agent in place, stepping onto a wumpus or pit costs DYING and
+    ends the game, reaching the exit door ends it (+1000 when carrying gold), GRAB_GOLD
+    always sets has_gold, SHOOT kills a wumpus on the cell ahead and updates the stenches,
+    FALL_INTO_PIT costs DYING without ending the game and other actions score nothing.
+
+    The map is parsed once; run() can be called any number of times.
+    """
+
+    def __init__(self, map_rows: Sequence[Sequence[str]], exit_pos: Optional[Tuple[int, int]] = None):
+        self.N = len(map_rows)
+        self.exit_pos = tuple(exit_pos) if exit_pos is not None else default_exit(self.N)
+        pits, wumpus, golds = set(), set(), set()
+        start = None
+        for row in range(self.N):
+            for col in range(self.N):
+                cell = map_rows[row][col]
+                if PIT in cell:
+                    pits.add((row, col))
+                if WUMPUS in cell:
+                    wumpus.add((row, col))
+                if GOLD in cell:
+                    golds.add((row, col))
+                if AGENT in cell and start is None:
+                    start = (row, col)
+        if start is None:
+            raise ValueError("Map has no agent cell")
+        self.start = start
+        self.pits = frozenset(pits)
+        self.wumpus = frozenset(wumpus)
+        self.golds = frozenset(golds)
+        # Action object -> code; filled on first sight, so agents with their own Action enum work too
+        self.codes = {}
+
+    @classmethod
+    def from_file(cls, map_path: str, exit_pos: Optional[Tuple[int, int]] = None) -> 'Simulator':
+        """Parse a map file in the Input/ format"""
+        return cls(read_map_rows(map_path), exit_pos)
+
+    @classmethod
+    def from_map(cls, wumpus_map) -> 'Simulator':
+        """Use an in-memory Run.WumpusMap and its exit"""
+        return cls(wumpus_map.cells, wumpus_map.exit)
+
+    def stenches(self, wumpus: Iterable[Tuple[int, int]]) -> set:
+        """Cells next to at least one living wumpus"""
+        cells = set()
+        for (row, col) in wumpus:
+            for (d_r, d_c) in DDX:
+                if 0 <= row + d_r < self.N and 0 <= col + d_c < self.N:
+                    cells.add((row + d_r, col + d_c))
+        return cells
+
+    def code(self, action) -> int:
+        name = action.name if hasattr(action, 'name') else str(action)
+        code = ACTION_CODES.get(name, NO_SCORE)
+        self.codes[action] = code
+        return code
+
+    def run(self, actions: Iterable) -> dict:
+        """
+        Replay actions from the map's start state
+
+        Returns:
+            dict with won (reached the exit), dead (walked into a wumpus or pit), score,
+            replayed (actions processed before the game ended), has_gold, position, facing
+            (TURN_* name), wumpus (still alive), stenches and golds left on the map
+        """
+        N = self.N
+        pits = self.pits
+        exit_pos = self.exit_pos
+        codes = self.codes
+        wumpus = set(self.wumpus)
+        golds = set(self.golds)
+        killed = False
+
+        turn_cost = [POINT['TURN_RIGHT'], POINT['TURN_LEFT'], POINT['TURN_UP'], POINT['TURN_DOWN']]
+        move_cost = POINT['MOVE_FORWARD']
+        row, col = self.start
+        facing = TURN_RIGHT
+        d_r, d_c = FACING_STEP[facing]
+        has_gold = False
+        won = dead = False
+        score = 0
+        replayed = 0
+
+        for action in actions:
+            replayed += 1
+            code = codes.get(action)
+            if code is None:
+                code = self.code(action)
+
+            if code == MOVE_FORWARD:
+                new_r, new_c = row + d_r, col + d_c
+                if 0 <= new_r < N and 0 <= new_c < N:
+                    row, col = new_r, new_c
+                score += move_cost
+                if (row, col) in wumpus or (row, col) in pits:
+                    score += POINT['DYING']
+                    dead = True
+                    break
+                if (row, col) == exit_pos:
+                    if has_gold:
+                        score += POINT['CLIMB_WITH_GOLD']
+                    won = True
+                    break
+            elif code <= TURN_DOWN:
+                facing = code
+                d_r, d_c = FACING_STEP[facing]
+                score += turn_cost[code]
+            elif code == GRAB_GOLD:
+                golds.discard((row, col))
+                has_gold = True
+                score += POINT['PICK_GOLD']
+            elif code == SHOOT:
+                score += POINT['SHOOT']
+                target = (row + d_r, col + d_c)
+                if target in wumpus:
+                    wumpus.discard(target)
+                    killed = True
+            elif code == FALL_INTO_PIT:
+                score += POINT['DYING']
+
+        return {
+            'won': won,
+            'dead': dead,
+            'score': score,
+            'replayed': replayed,
+            'has_gold': has_gold,
+            'position': (row, col),
+            'facing': ('TURN_RIGHT', 'TURN_LEFT', 'TURN_UP', 'TURN_DOWN')[facing],
+            'wumpus': wumpus,
+            # Stenches only change when a wumpus dies, so they are rebuilt once at the end
+            'stenches': self.stenches(wumpus) if killed else self.stenches(self.wumpus),
+            'golds': golds
+        }
+
+
+def simulate(map_path: str, actions: Iterable) -> dict:
+    """Score an action list on a map file (see Simulator.run)"""
+    return Simulator.from_file(map_path).run(actions)
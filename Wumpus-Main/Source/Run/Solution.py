@@ -3,7 +3,7 @@ from Run.Base import Base
 from Run.Cell import Cell
 from Run.CellType import CellType
 from Run.KnowledgeBase import KnowledgeBase
-from Run.PathPlanner import PathPlanner
+from Run.PathPlanner import PathPlanner, IncrementalExitPlanner
 
 
 class Solution(Base):
@@ -12,7 +12,7 @@ class Solution(Base):
         self.KB = KnowledgeBase()
         self.planner = None  # Will be initialized after reading map
         self.game_ended = False  # NEW: Flag to track if game has ended
-        self.is_advance_mode = "advance.txt" in input_file  # NEW: Check if advance mode
+        self.is_advance_mode = isinstance(input_file, str) and "advance.txt" in input_file  # NEW: Check if advance mode
         
         # Score optimization tracking
         self.collected_gold = 0
@@ -23,7 +23,9 @@ class Solution(Base):
         
         self.read_map(input_file)
         # Initialize path planner after map is loaded
-        self.planner = PathPlanner(self.cell_matrix, self.KB)
+        self.planner = PathPlanner(self.cell_matrix, self.KB, exit_pos=self.exit_pos)
+        # Incremental (D* Lite) route to the exit door, built on first use
+        self.exit_planner = None
 
     def calculate_current_score(self) -> int:
         """Calculate current estimated score for optimization"""
@@ -31,11 +33,10 @@ class Solution(Base):
         total_score += self.collected_gold * 1000  # Gold bonus
         total_score += self.killed_wumpus * 500   # Wumpus kill bonus
         total_score -= self.total_moves           # Move penalty
-        from constants import EXIT_DOOR_ROW, EXIT_DOOR_COL
-        total_score += 10 if self.agent_cell.map_pos == (EXIT_DOOR_ROW, EXIT_DOOR_COL) else 0  # Exit bonus
+        total_score += 10 if self.agent_cell.map_pos == self.exit_pos else 0  # Exit bonus
         
         # Additional 1000 point bonus for climbing out with gold
-        if self.agent_cell.map_pos == (EXIT_DOOR_ROW, EXIT_DOOR_COL) and self.has_gold:
+        if self.agent_cell.map_pos == self.exit_pos and self.has_gold:
             total_score += 1000  # Extra gold collection completion bonus
             
         return total_score
@@ -133,9 +134,21 @@ class Solution(Base):
 
         # Forward Chaining: Add facts and rules directly
         self._add_forward_chaining_knowledge(cell, neighbor_cells)
+        self.notify_knowledge_changed(cell)
 
         self.append_event_to_output_file(str(self.KB.KB))
 
+    def notify_knowledge_changed(self, cell: Cell, radius: int = 1):
+        """Tell the planners which cells around this one may have a new risk"""
+        row, col = cell.matrix_pos
+        positions = [(r, c)
+                     for r in range(max(0, row - radius), min(self.map_size, row + radius + 1))
+                     for c in range(max(0, col - radius), min(self.map_size, col + radius + 1))
+                     if abs(r - row) + abs(c - col) <= radius]
+        self.planner.notify_changed(positions)
+        if self.exit_planner is not None:
+            self.exit_planner.notify_changed(positions)
+
     def _add_forward_chaining_knowledge(self, cell: Cell, neighbor_cells: list[Cell]):
         """Add knowledge using Forward Chaining approach"""
         
@@ -284,8 +297,7 @@ class Solution(Base):
         self.total_moves += 1  # Track moves for score optimization
 
         # NEW: Check if agent reached exit door - END GAME IMMEDIATELY
-        from constants import EXIT_DOOR_ROW, EXIT_DOOR_COL
-        if self.agent_cell.map_pos[0] == EXIT_DOOR_ROW and self.agent_cell.map_pos[1] == EXIT_DOOR_COL:
+        if self.agent_cell.map_pos == self.exit_pos:
             # Award points before ending the game!
             if self.has_gold:
                 pass  # Bonus points awarded in Board.py
@@ -346,6 +358,8 @@ class Solution(Base):
                                 self.killed_wumpus += 1
                                 
                             valid_adj_cell.kill_wumpus(self.cell_matrix, self.KB)
+                            # Wumpus and the stench around it are gone
+                            self.notify_knowledge_changed(valid_adj_cell, 2)
                             self.append_event_to_output_file('KB: ' + str(self.KB.KB))
                         else:
                             # Don't shoot, avoid the cell for score optimization
@@ -390,6 +404,7 @@ class Solution(Base):
                     if adj_cell.exist_Entity(2):
                         # this cell have wumpus - update KB but don't assume kill
                         adj_cell.kill_wumpus(self.cell_matrix, self.KB)
+                        self.notify_knowledge_changed(adj_cell, 2)
                         self.append_event_to_output_file('KB: ' + str(self.KB.KB))
 
                     if not self.agent_cell.exist_Entity(4):
@@ -459,8 +474,7 @@ class Solution(Base):
             self.append_event_to_output_file('Move to: ' + str(self.agent_cell.map_pos))
 
             # NEW: Check if we reached exit door after moving - STOP IMMEDIATELY!
-            from constants import EXIT_DOOR_ROW, EXIT_DOOR_COL
-            if self.agent_cell.map_pos[0] == EXIT_DOOR_ROW and self.agent_cell.map_pos[1] == EXIT_DOOR_COL:
+            if self.agent_cell.map_pos == self.exit_pos:
                 # Award points before ending the game!
                 if self.has_gold:
                     pass  # Bonus points awarded in Board.py
@@ -484,8 +498,7 @@ class Solution(Base):
 
     def navigate_to_exit(self):
         """Navigate agent back to exit door using explored safe cells"""
-        from constants import EXIT_DOOR_ROW, EXIT_DOOR_COL
-        target_pos = [EXIT_DOOR_ROW, EXIT_DOOR_COL]  # Exit door position
+        target_pos = self.exit_pos  # Exit door position
         current_pos = self.agent_cell.map_pos
         
         # If already at exit, no need to navigate
@@ -512,82 +525,39 @@ class Solution(Base):
             if target_cell and target_cell.is_explored():
                 # Target is already explored and safe, move directly
                 self.move_to(target_cell)
-    def navigate_to_exit(self):
-        """Navigate to exit using optimal path planning"""
-        from constants import EXIT_DOOR_ROW, EXIT_DOOR_COL
-        target_pos = (EXIT_DOOR_ROW, EXIT_DOOR_COL)  # Exit position
-        current_pos = self.agent_cell.map_pos
-        
-        # Use path planner to find optimal route considering cost, risk, and utility
-        optimal_path = self.planner.plan_optimal_path(current_pos, target_pos)
-        
-        if optimal_path and len(optimal_path) > 1:
-            # Follow the planned optimal path
-            for i in range(1, len(optimal_path)):  # Skip current position
-                next_pos = optimal_path[i]
-                next_cell = self.cell_matrix[next_pos[0]][next_pos[1]]
-                
-                # Safety check before moving
-                if (next_cell.is_explored() and 
-                    not next_cell.exist_Entity(1) and  # No pit
-                    not next_cell.exist_Entity(2)):    # No wumpus
-                    self.move_to(next_cell)
-                    
-                    # If we reached the exit, stop
-                    if self.agent_cell.map_pos == target_pos:
-                        return
-                else:
-                    # Path blocked by danger, try to find alternative
-                    break
-        
-        # Fallback: use original navigation logic if planning fails
-        max_iterations = 100  # Prevent infinite loops
-        iteration_count = 0
-        
-        while self.agent_cell.map_pos != target_pos and iteration_count < max_iterations:
-            iteration_count += 1
-            
-            # Check if target is directly accessible
-            target_cell = self.cell_matrix[target_pos[0]][target_pos[1]]
-            if (target_cell.is_explored() and 
-                not target_cell.exist_Entity(1) and  # No pit
-                not target_cell.exist_Entity(2)):    # No wumpus
-                
-                # Move directly to target
-                self.move_to(target_cell)
-                break
-            else:
-                # Target not explored yet, find closest safe explored cell
-                adj_cells = self.agent_cell.get_adj_cell(self.cell_matrix)
-                
-                # Find closest SAFE cell to target
-                best_cell = None
-                min_distance = float('inf')
-                
-                for adj_cell in adj_cells:
-                    # Check if cell is safe (explored and no pit/wumpus)
-                    if (adj_cell.is_explored() and 
-                        not adj_cell.exist_Entity(1) and  # No pit
-                        not adj_cell.exist_Entity(2)):    # No wumpus
-                        
-                        # Calculate Manhattan distance to target
-                        distance = abs(adj_cell.map_pos[0] - target_pos[0]) + abs(adj_cell.map_pos[1] - target_pos[1])
-                        if distance < min_distance:
-                            min_distance = distance
-                            best_cell = adj_cell
-                
-                if best_cell:
-                    self.move_to(best_cell)
-                    # Continue in the loop (not recursive call)
-                else:
-                    # No safe path found, break to avoid infinite loop
-                    break
-        
-        # Final check: if not at target after all attempts, try direct move if target is explored
-        if self.agent_cell.map_pos != target_pos:
-            target_cell = self.cell_matrix[target_pos[0]][target_pos[1]]
-            if target_cell.is_explored():
-                self.move_to(target_cell)
+    def navigate_to_exit(self) -> bool:
+        """
+        Walk to the exit door along the planned route, if it only crosses explored cells
+
+        The route comes from the incremental (D* Lite) planner or, for the other planner modes
+        (see PathPlanner.exit_mode), from PathPlanner.plan_exit_path. Explored cells were stood on, so they hold no
+        pit or wumpus; the exit door itself is safe by the rules of the map. A route through
+        unexplored cells is not taken.
+
+        Returns:
+            True when the agent reached the exit (the game is over), False if it did not move
+        """
+        target_pos = self.exit_pos  # Exit door (row, col)
+        current_pos = self.agent_cell.matrix_pos
+        if current_pos == target_pos:
+            return True
+
+        if self.planner.exit_mode() == 'incremental':
+            # Incremental planner keeps its search tree between calls and only repairs
+            # the cells whose knowledge changed since the last query
+            if self.exit_planner is None:
+                self.exit_planner = IncrementalExitPlanner(self.planner, target_pos)
+            optimal_path = self.exit_planner.plan(current_pos)
+        else:
+            optimal_path = self.planner.plan_exit_path(current_pos, self.facing)
+        if not optimal_path or any(not self.cell_matrix[row][col].is_explored() for row, col in optimal_path[1:-1]):
+            return False
+
+        for row, col in optimal_path[1:]:  # Skip current position
+            self.move_to(self.cell_matrix[row][col])
+            self.append_event_to_output_file('Return to exit: ' + str(self.agent_cell.map_pos))
+        self.game_ended = True
+        return True
 
     def solve(self):
         # rest file
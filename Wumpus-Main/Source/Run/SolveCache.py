@@ -0,0 +1,126 @@
+"""
+Solve result cache - action lists memoized by map content, agent, configuration and solver code version
+Kept in memory and optionally as JSON files under Output/solveCache/, so replaying a map skips solving
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Callable, List, Optional
+
+from constants import ROOT_OUTPUT
+from Run.Action import Action
+
+SOLVE_CACHE_DIR = ROOT_OUTPUT + "solveCache/"
+MAX_ENTRIES = 256  # Results kept in memory, least recently used dropped first
+
+RUN_DIR = os.path.dirname(os.path.abspath(__file__))
+_code_version = None
+
+
+def code_version() -> str:
+    """Digest of the solver sources (every Run/*.py), so editing the solver invalidates cached results"""
+    global _code_version
+    if _code_version is None:
+        digest = hashlib.sha256()
+        for name in sorted(os.listdir(RUN_DIR)):
+            if name.endswith('.py'):
+                digest.update(name.encode())
+                with open(os.path.join(RUN_DIR, name), 'rb') as file:
+                    digest.update(file.read())
+        _code_version = digest.hexdigest()[:16]
+    return _code_version
+
+
+def map_digest(wumpus_map) -> str:
+    """Content hash of a WumpusMap: its cells and exit, whatever file (if any) it came from"""
+    return hashlib.sha256(f"{wumpus_map.exit}\n{wumpus_map.to_text()}".encode()).hexdigest()
+
+
+def solve_key(wumpus_map, agent: str, config: dict = None) -> str:
+    """Cache key of solving wumpus_map with the named agent under config (JSON-serializable settings)"""
+    payload = json.dumps([map_digest(wumpus_map), agent, config or {}, code_version()], sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class SolveCache:
+    """
+    Solve results by solve_key: the action list plus whatever was measured with it
+
+    Only deterministic agents belong here; a cached result stands for every later solve of
+    the same map. With a directory, results are also written there as <key>.json and survive
+    the process.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_entries: int = MAX_ENTRIES):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.entries = OrderedDict()  # key -> entry dict, actions as a tuple of Action
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".json")
+
+    def get(self, key: str) -> Optional[dict]:
+        """Cached entry (actions is a fresh list) or None"""
+        entry = self.entries.get(key)
+        if entry is None and self.directory is not None:
+            entry = self.read(key)
+            if entry is not None:
+                self.remember(key, entry)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return {**entry, 'actions': list(entry['actions'])}
+
+    def put(self, key: str, actions: List[Action], **measured):
+        """Store an action list and extra JSON-serializable fields (solve time, KB counters, ...)"""
+        entry = {**measured, 'actions': tuple(actions)}
+        self.remember(key, entry)
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+            temp_path = f"{self.path(key)}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump({**measured, 'actions': [action.name for action in actions]}, file)
+            os.replace(temp_path, self.path(key))  # Readers never see a half-written file
+
+    def read(self, key: str) -> Optional[dict]:
+        try:
+            with open(self.path(key), 'r', encoding='utf-8') as file:
+                entry = json.load(file)
+            entry['actions'] = tuple(Action[name] for name in entry['actions'])
+            return entry
+        except (OSError, ValueError, KeyError, TypeError):
+            return None  # Missing, or left unreadable by another version
+
+    def remember(self, key: str, entry: dict):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def solve(self, wumpus_map, agent: str, solver: Callable[[], List[Action]], config: dict = None) -> List[Action]:
+        """Cached action list for (map, agent, config), running solver() and storing its result on a miss"""
+        key = solve_key(wumpus_map, agent, config)
+        entry = self.get(key)
+        if entry is not None:
+            return entry['actions']
+        start_time = time.perf_counter()
+        actions = solver()
+        self.put(key, actions, time=time.perf_counter() - start_time)
+        return list(actions)
+
+
+_caches = {}
+
+
+def solve_cache(directory: Optional[str] = SOLVE_CACHE_DIR) -> SolveCache:
+    """The process-wide SolveCache for directory (None = memory only), created on first use"""
+    if directory not in _caches:
+        _caches[directory] = SolveCache(directory)
+    return _caches[directory]
@@ -0,0 +1,144 @@
+"""
+Vectorized random map generation - whole batches of same-size maps built as NumPy layers
+Placements are drawn over allowed-cell masks, breeze and stench come from a 4-neighbour convolution,
+and maps are turned into WumpusMap cell strings only at the end
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from constants import PIT, BREEZE, WUMPUS, STENCH, GOLD, AGENT
+from Run.WumpusMap import CELL_BITS, WumpusMap, default_exit
+
+# Layer name -> cell letter
+LAYER_LETTERS = {'agent': AGENT, 'wumpus': WUMPUS, 'stench': STENCH, 'pit': PIT, 'breeze': BREEZE, 'gold': GOLD}
+
+BATCH_CELLS = 1 << 22  # Cells per sampled batch in random_wumpus_maps
+
+
+def neighbors(layers: np.ndarray) -> np.ndarray:
+    """
+    Cells 4-adjacent to a True cell, for (M, N, N) bool layers
+
+    Same result as convolving with the cross kernel [[0,1,0],[1,0,1],[0,1,0]] and testing > 0,
+    done with shifted ORs so no SciPy is needed.
+    """
+    out = np.zeros_like(layers)
+    out[:, 1:, :] |= layers[:, :-1, :]
+    out[:, :-1, :] |= layers[:, 1:, :]
+    out[:, :, 1:] |= layers[:, :, :-1]
+    out[:, :, :-1] |= layers[:, :, 1:]
+    return out
+
+
+def choose_cells(allowed: np.ndarray, count: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Per map, pick min(count, allowed cells) distinct cells uniformly among its allowed ones
+
+    Every cell gets a uniform random key and disallowed cells get +inf, so the count smallest
+    keys are a uniform sample without replacement - Generator.choice(np.flatnonzero(mask),
+    count, replace=False) for all maps at once, in linear time with argpartition.
+
+    Returns:
+        (M, N, N) bool layer of the chosen cells
+    """
+    M = allowed.shape[0]
+    flat = allowed.reshape(M, -1)
+    chosen = np.zeros_like(flat)
+    count = min(count, flat.shape[1])
+    if count > 0:
+        keys = np.where(flat, rng.random(flat.shape, dtype=np.float32), np.inf)
+        picks = np.argpartition(keys, count - 1, axis=1)[:, :count]
+        rows = np.arange(M)[:, None]
+        chosen[rows, picks] = np.isfinite(keys[rows, picks])
+    return chosen.reshape(allowed.shape)
+
+
+def safe_path_layers(starts: np.ndarray, N: int, exit_pos: Tuple[int, int]) -> np.ndarray:
+    """
+    L-shaped path from each agent start to the exit (along the start row, then the exit column),
+    as (M, N, N) bool layers - RandMap.create_simple_path for all maps at once
+    """
+    rows = np.arange(N)[None, :, None]
+    cols = np.arange(N)[None, None, :]
+    start_r = starts[:, 0, None, None]
+    start_c = starts[:, 1, None, None]
+    exit_r, exit_c = exit_pos
+    horizontal = (rows == start_r) & (cols >= np.minimum(start_c, exit_c)) & (cols <= np.maximum(start_c, exit_c))
+    vertical = (cols == exit_c) & (rows >= np.minimum(start_r, exit_r)) & (rows <= np.maximum(start_r, exit_r))
+    return horizontal | vertical
+
+
+def sample_map_layers(count: int, N: int = 8, K: int = 2, p: float = 0.2, rng: np.random.Generator = None,
+                      exit_pos: Optional[Tuple[int, int]] = None) -> dict:
+    """
+    Draw count maps with RandMap.random_wumpus_map's rules, as layers
+
+    Agent anywhere but the exit (default default_exit(N)); K wumpus and int((N*N - 2) * p) pits
+    outside the safe path and its neighbours (fewer when there is not enough room); one gold on
+    a cell without pit or wumpus other than the exit; stench and breeze next to wumpus and pits
+    except on the path itself. The path is the same L-shaped one random_wumpus_map uses.
+
+    Returns:
+        dict of (count, N, N) bool layers agent, wumpus, stench, pit, breeze, gold and (count, 2) starts
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    exit_pos = exit_pos if exit_pos is not None else default_exit(N)
+    cells = np.arange(N * N)
+    exit_cell = exit_pos[0] * N + exit_pos[1]
+    spawn = cells[cells != exit_cell]
+    start_cells = spawn[rng.integers(0, len(spawn), count)]
+    starts = np.stack([start_cells // N, start_cells % N], axis=1)
+
+    agent = np.zeros((count, N, N), dtype=bool)
+    agent[np.arange(count), starts[:, 0], starts[:, 1]] = True
+    path = safe_path_layers(starts, N, exit_pos)
+    protected = path | neighbors(path)
+
+    wumpus = choose_cells(~protected, K, rng)
+    pit = choose_cells(~protected & ~wumpus & ~agent, int((N * N - 2) * p), rng)
+    exit_layer = np.zeros((1, N, N), dtype=bool)
+    exit_layer[0, exit_pos[0], exit_pos[1]] = True
+    gold = choose_cells(~pit & ~wumpus & ~exit_layer, 1, rng)
+    return {
+        'agent': agent,
+        'wumpus': wumpus,
+        'stench': neighbors(wumpus) & ~path,
+        'pit': pit,
+        'breeze': neighbors(pit) & ~path,
+        'gold': gold,
+        'starts': starts
+    }
+
+
+def layer_codes(layers: dict) -> np.ndarray:
+    """(M, N, N) uint8 cell codes (see WumpusMap.CELL_BITS) of sampled layers"""
+    codes = np.zeros(layers['agent'].shape, dtype=np.uint8)
+    for name, letter in LAYER_LETTERS.items():
+        codes |= layers[name].astype(np.uint8) * np.uint8(CELL_BITS[letter])
+    return codes
+
+
+def layers_to_maps(layers: dict, exit_pos: Optional[Tuple[int, int]] = None) -> List[WumpusMap]:
+    """Turn sampled layers into WumpusMap objects (one table lookup per cell)"""
+    return [WumpusMap.from_codes(code, exit_pos, (int(row), int(col)))
+            for code, (row, col) in zip(layer_codes(layers), layers['starts'])]
+
+
+def random_wumpus_maps(count: int, N: int = 8, K: int = 2, p: float = 0.2, seed: int = None,
+                       exit_pos: Optional[Tuple[int, int]] = None) -> List[WumpusMap]:
+    """
+    count random maps (see sample_map_layers); the same seed always gives the same maps
+
+    Much faster than calling RandMap.random_wumpus_map count times, but the maps come from a
+    NumPy Generator, so a seed does not reproduce random_wumpus_map's map for that seed.
+    Layers are sampled in batches of about BATCH_CELLS cells to bound memory.
+    """
+    rng = np.random.default_rng(seed)
+    batch = max(1, BATCH_CELLS // (N * N))
+    maps = []
+    for first in range(0, count, batch):
+        layers = sample_map_layers(min(batch, count - first), N, K, p, rng, exit_pos)
+        maps += layers_to_maps(layers, exit_pos)
+    return maps
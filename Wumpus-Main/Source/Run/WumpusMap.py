@@ -0,0 +1,113 @@
+"""
+In-memory Wumpus World map - the grid of cell strings plus agent, exit and entity positions
+Generators return it, Base.read_map, utils.readMapInFile and Simulator accept it in place of a map file
+(map files themselves are parsed into one through Run.MapCache)
+"""
+
+import os
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from constants import PIT, BREEZE, WUMPUS, STENCH, GOLD, AGENT, EXIT_DOOR_COL
+
+# Cell letter -> bit of the one-byte cell code (batch generator layers, binary map files)
+CELL_BITS = {AGENT: 1, WUMPUS: 2, STENCH: 4, PIT: 8, BREEZE: 16, GOLD: 32}
+
+# Cell code -> cell string, letters in CELL_BITS order, '-' for an empty cell
+CELL_STRINGS = np.array([''.join(letter for letter, bit in CELL_BITS.items() if code & bit) or '-'
+                         for code in range(64)], dtype=object)
+
+
+# Cell string -> code, for the strings generators write; anything else goes through cell_code
+STRING_CODES = {string: code for code, string in enumerate(CELL_STRINGS)}
+
+
+def default_exit(N: int) -> Tuple[int, int]:
+    """Exit door of an N x N map: the bottom-left corner, where EXIT_DOOR_ROW/COL put it on the 8 x 8 board"""
+    return N - 1, EXIT_DOOR_COL
+
+
+def cell_code(cell: str) -> int:
+    """One-byte code of a cell string ('-' and unknown letters add nothing)"""
+    code = STRING_CODES.get(cell)
+    if code is None:
+        code = sum(bit for letter, bit in CELL_BITS.items() if letter in cell)
+    return code
+
+
+class WumpusMap:
+    """
+    An N x N map in the Input/ file layout: cells[row][col] is the cell's string ('-' when empty,
+    otherwise letters from constants: A, W, P, G, S, B); exit_pos None means default_exit(N)
+    """
+
+    def __init__(self, cells: List[List[str]], exit_pos: Optional[Tuple[int, int]] = None,
+                 agent: Tuple[int, int] = None):
+        self.N = len(cells)
+        self.cells = cells
+        self.exit = tuple(exit_pos) if exit_pos is not None else default_exit(self.N)
+        # Generators that already know the agent cell pass it, otherwise it is looked up
+        self.agent = agent if agent is not None else next(
+            ((row, col) for row in range(self.N) for col in range(self.N) if AGENT in cells[row][col]), None)
+        # Facts computed alongside the map (random_wumpus_map stores MapAnalysis.analyze_map's here);
+        # not part of the map itself, so equality and the file formats ignore it
+        self.metadata = {}
+
+    @classmethod
+    def from_text(cls, text: str, exit_pos: Optional[Tuple[int, int]] = None) -> 'WumpusMap':
+        """Parse the Input/ format: N on the first line, then N rows of '.'-separated cells"""
+        lines = text.splitlines()
+        N = int(lines[0].split()[0])
+        return cls([line.split('.')[:N] for line in lines[1:N + 1]], exit_pos)
+
+    @classmethod
+    def from_codes(cls, codes: np.ndarray, exit_pos: Optional[Tuple[int, int]] = None,
+                   agent: Tuple[int, int] = None) -> 'WumpusMap':
+        """Build from an (N, N) array of cell codes (see CELL_BITS)"""
+        return cls(CELL_STRINGS[codes].tolist(), exit_pos, agent)
+
+    @classmethod
+    def from_file(cls, path: str, exit_pos: Optional[Tuple[int, int]] = None) -> 'WumpusMap':
+        with open(path, 'r') as file:
+            return cls.from_text(file.read(), exit_pos)
+
+    def positions(self, entity: str) -> List[Tuple[int, int]]:
+        """Cells containing entity (one of the constants letters), row by row"""
+        return [(row, col) for row in range(self.N) for col in range(self.N) if entity in self.cells[row][col]]
+
+    @property
+    def pits(self) -> List[Tuple[int, int]]:
+        return self.positions(PIT)
+
+    @property
+    def wumpus(self) -> List[Tuple[int, int]]:
+        return self.positions(WUMPUS)
+
+    @property
+    def golds(self) -> List[Tuple[int, int]]:
+        return self.positions(GOLD)
+
+    def codes(self) -> np.ndarray:
+        """(N, N) uint8 array of cell codes (see CELL_BITS)"""
+        codes = [list(map(STRING_CODES.get, row)) for row in self.cells]
+        if any(None in row for row in codes):
+            codes = [[cell_code(cell) for cell in row] for row in self.cells]
+        return np.array(codes, dtype=np.uint8)
+
+    def to_text(self) -> str:
+        """The map in the Input/ format, without a trailing newline (like RandMap has always written it)"""
+        return f'{self.N}\n' + '\n'.join('.'.join(row) for row in self.cells)
+
+    def write(self, path: str):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w') as file:
+            file.write(self.to_text())
+
+    def __eq__(self, other) -> bool:
+        # Rows may be lists or tuples (Run.MapCache stores tuples)
+        return (isinstance(other, WumpusMap) and self.exit == other.exit and self.N == other.N
+                and all(tuple(mine) == tuple(theirs) for mine, theirs in zip(self.cells, other.cells)))
+
+    def __repr__(self) -> str:
+        return f"WumpusMap(N={self.N}, agent={self.agent}, exit={self.exit})"
@@ -0,0 +1,39 @@
+"""
+Convert maps between the text format and the binary format / corpus files
+Run from the Source folder:
+	python convert_maps.py ../Input/advance.txt -o advance.wmb    (text -> binary map)
+	python convert_maps.py advance.wmb -o advance.txt             (binary map -> text)
+	python convert_maps.py ../Input/*.txt -o maps.wmc             (text maps -> corpus, ids in argument order)
+	python convert_maps.py maps.wmc -o ../Input/corpus            (corpus -> map0.txt, map1.txt, ...)
+"""
+
+import argparse
+import os
+
+from Run.MapBinary import binary_to_text, pack_text_maps, text_to_binary, unpack_corpus
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Wumpus World map format converter")
+	parser.add_argument('inputs', nargs='+', help=".txt maps, one .wmb map or one .wmc corpus")
+	parser.add_argument('-o', '--output', required=True, help=".wmb, .txt, .wmc or a directory (corpus input)")
+	parser.add_argument('--prefix', default='map', help="file name prefix when unpacking a corpus")
+	args = parser.parse_args()
+
+	source = args.inputs[0]
+	if source.endswith('.wmc'):
+		paths = unpack_corpus(source, args.output, args.prefix)
+		print(f"Unpacked {len(paths)} maps to {args.output}")
+	elif source.endswith('.wmb'):
+		binary_to_text(source, args.output)
+		print(f"Wrote {args.output}")
+	elif args.output.endswith('.wmc'):
+		pack_text_maps(args.inputs, args.output)
+		print(f"Packed {len(args.inputs)} maps into {args.output} ({os.path.getsize(args.output)} bytes)")
+	else:
+		text_to_binary(source, args.output)
+		print(f"Wrote {args.output}")
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,69 @@
+"""
+Benchmark every agent and inference backend over the seeded map corpus
+Run from the Source folder: python run_benchmark.py --sizes 4 8 16 --baseline ../Output/baseline.json
+"""
+
+import argparse
+import json
+import sys
+
+from Experiment.Benchmark import DEFAULT_CORPUS, MIN_TIME_DELTA, MIN_TIME_GAMES, compare, run_benchmark
+from Experiment.Runner import AGENTS, BACKENDS
+from Run.PathPlanner import DEFAULT_PLANNER_MODE, PLANNER_MODES
+from Run.SolveCache import SOLVE_CACHE_DIR
+from constants import ROOT_OUTPUT
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Wumpus World agent benchmark suite")
+	parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_CORPUS['sizes'])
+	parser.add_argument('--num-wumpus', type=int, nargs='+', default=DEFAULT_CORPUS['num_wumpus'])
+	parser.add_argument('--pit-densities', type=float, nargs='+', default=DEFAULT_CORPUS['pit_densities'])
+	parser.add_argument('--maps-per-config', type=int, default=DEFAULT_CORPUS['maps_per_config'])
+	parser.add_argument('--seed', type=int, default=DEFAULT_CORPUS['seed'])
+	parser.add_argument('--agents', nargs='+', choices=sorted(AGENTS), default=sorted(AGENTS))
+	parser.add_argument('--backends', nargs='+', choices=sorted(BACKENDS), default=sorted(BACKENDS))
+	parser.add_argument('--planner-modes', nargs='+', choices=PLANNER_MODES, default=[DEFAULT_PLANNER_MODE],
+						help="exit planners to run the agents with, non-default ones report as agent/backend/mode")
+	parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+	parser.add_argument('--timeout', type=float, default=30.0, help="wall-clock limit per game in seconds")
+	parser.add_argument('--max-rss-mb', type=float, default=None, help="memory limit per worker process in MB")
+	parser.add_argument('--output', default=ROOT_OUTPUT + "benchmark.json")
+	parser.add_argument('--baseline', default=None, help="baseline report to check for regressions")
+	parser.add_argument('--tolerance', type=float, default=0.1, help="allowed relative change before flagging")
+	parser.add_argument('--time-tolerance', type=float, default=0.5, help="allowed relative change in solve time")
+	parser.add_argument('--min-time-delta', type=float, default=MIN_TIME_DELTA,
+						help="solve time growth in seconds below which it is treated as noise")
+	parser.add_argument('--min-time-games', type=int, default=MIN_TIME_GAMES,
+						help="games a group needs before its solve time is compared")
+	parser.add_argument('--solve-cache', action='store_true',
+						help=f"reuse deterministic agents' solves (and measured times) from {SOLVE_CACHE_DIR}")
+	args = parser.parse_args()
+
+	corpus = {
+		'sizes': args.sizes,
+		'num_wumpus': args.num_wumpus,
+		'pit_densities': args.pit_densities,
+		'maps_per_config': args.maps_per_config,
+		'seed': args.seed
+	}
+	report = run_benchmark(corpus, args.agents, args.backends, args.workers, args.timeout, args.max_rss_mb,
+						   args.output, SOLVE_CACHE_DIR if args.solve_cache else None, args.planner_modes)
+
+	if args.baseline:
+		with open(args.baseline, 'r', encoding='utf-8') as file:
+			baseline = json.load(file)
+		try:
+			regressions = compare(report, baseline, args.tolerance, args.time_tolerance,
+								  args.min_time_delta, args.min_time_games)
+		except ValueError as error:
+			sys.exit(f"Baseline rejected: {error}")
+		for regression in regressions:
+			print(f"REGRESSION: {regression}")
+		if regressions:
+			sys.exit(1)
+		print("No regressions against baseline")
+
+
+if __name__ == '__main__':
+	main()
@@ -1,85 +1,67 @@
-import os
-from Source.Game import Game
-from Source.Entity.Board import Board
-from Source.Run.HybridAgent import HybridAgent
-from Source.Run.RandomAgentSimple import RandomAgentSimple
+"""
+Compare the smart (Hybrid) agent against the random baseline, headless and in parallel
+Run from the Source folder: python run_comparison.py --tests 30 --workers 4
+"""
+
+import argparse
+
+from Experiment.Runner import DEFAULT_CONFIG, AGENTS, run_comparison
+from Run.PathPlanner import PLANNER_MODES
+from Run.SolveCache import SOLVE_CACHE_DIR
+from constants import ROOT_OUTPUT
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Headless Wumpus World agent comparison")
+	parser.add_argument('--grid-size', type=int, default=DEFAULT_CONFIG['grid_size'])
+	parser.add_argument('--num-wumpus', type=int, default=DEFAULT_CONFIG['num_wumpus'])
+	parser.add_argument('--pit-density', type=float, default=DEFAULT_CONFIG['pit_density'])
+	parser.add_argument('--tests', type=int, default=DEFAULT_CONFIG['num_tests'])
+	parser.add_argument('--seed', type=int, default=DEFAULT_CONFIG['seed'])
+	parser.add_argument('--smart-agent', choices=sorted(AGENTS), default=DEFAULT_CONFIG['smart_agent'])
+	parser.add_argument('--random-agent', choices=sorted(AGENTS), default=DEFAULT_CONFIG['random_agent'])
+	parser.add_argument('--planner-mode', choices=PLANNER_MODES, default=DEFAULT_CONFIG['planner_mode'],
+						help="how the smart agent plans its walk to the exit")
+	parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+	parser.add_argument('--chunksize', type=int, default=1, help="games handed to a worker at once")
+	parser.add_argument('--timeout', type=float, default=DEFAULT_CONFIG['time_limit'],
+						help="wall-clock limit per game in seconds")
+	parser.add_argument('--max-rss-mb', type=float, default=DEFAULT_CONFIG['memory_limit'],
+						help="memory limit per worker process in MB")
+	parser.add_argument('--results-file', default=ROOT_OUTPUT + "resultComparison.csv",
+						help="per-game results, .csv or .jsonl")
+	parser.add_argument('--resume', action='store_true', help="skip games already in the results file")
+	parser.add_argument('--early-stop', action='store_true',
+						help="stop once the smart-vs-random difference is statistically resolved")
+	parser.add_argument('--min-games', type=int, default=20, help="games per agent before early stopping")
+	parser.add_argument('--progress', type=int, default=0, help="print live progress every N games")
+	parser.add_argument('--profile', action='store_true',
+						help="profile every game, write Output/profile.txt, .collapsed (flame graph) and .prof")
+	parser.add_argument('--solve-cache', action='store_true',
+						help=f"reuse deterministic agents' solves (and measured times) from {SOLVE_CACHE_DIR}")
+	parser.add_argument('--no-analyze', action='store_true',
+						help="skip the per-map difficulty analysis (slow on large grids) and its report section")
+	args = parser.parse_args()
 
-def run_comparison():
 	config = {
-		'grid_size': 8,
-		'num_wumpus': 2,
-		'pit_density': 0.2,
-		'num_tests': 30,
-		'mode': 'random'
+		'grid_size': args.grid_size,
+		'num_wumpus': args.num_wumpus,
+		'pit_density': args.pit_density,
+		'num_tests': args.tests,
+		'mode': 'random',
+		'seed': args.seed,
+		'smart_agent': args.smart_agent,
+		'random_agent': args.random_agent,
+		'planner_mode': args.planner_mode,
+		'time_limit': args.timeout,
+		'memory_limit': args.max_rss_mb,
+		'profile': args.profile,
+		'solve_cache': SOLVE_CACHE_DIR if args.solve_cache else None,
+		'analyze': not args.no_analyze
 	}
-	smart_results = []
-	random_results = []
-	for test_num in range(1, config['num_tests'] + 1):
-		# Smart Agent
-		game = Game(grid_size=config['grid_size'], num_wumpus=config['num_wumpus'], pit_density=config['pit_density'])
-		board = Board(config['grid_size'], config['grid_size'])
-		agent = HybridAgent()
-		result = game.run(agent)
-		smart_results.append({
-			'test': test_num,
-			'won': result['win'],
-			'score': result['score'],
-			'moves': result['moves']
-		})
-		# Random Agent
-		game = Game(grid_size=config['grid_size'], num_wumpus=config['num_wumpus'], pit_density=config['pit_density'])
-		board = Board(config['grid_size'], config['grid_size'])
-		agent = RandomAgentSimple()
-		result = game.run(agent)
-		random_results.append({
-			'test': test_num,
-			'won': result['win'],
-			'score': result['score'],
-			'moves': result['moves']
-		})
-	# Statistics
-	smart_wins = sum(1 for r in smart_results if r['won'])
-	smart_avg_score = sum(r['score'] for r in smart_results) / config['num_tests']
-	smart_avg_moves = sum(r['moves'] for r in smart_results) / config['num_tests']
-	random_wins = sum(1 for r in random_results if r['won'])
-	random_avg_score = sum(r['score'] for r in random_results) / config['num_tests']
-	random_avg_moves = sum(r['moves'] for r in random_results) / config['num_tests']
-	# Output
-	lines = []
-	lines.append("WUMPUS WORLD AGENT COMPARISON RESULTS")
-	lines.append("EXPERIMENT CONFIGURATION:")
-	lines.append(f"Grid Size: {config['grid_size']}x{config['grid_size']}")
-	lines.append(f"Number of Wumpus: {config['num_wumpus']}")
-	lines.append(f"Pit Density: {config['pit_density']}")
-	lines.append(f"Number of Tests: {config['num_tests']}")
-	lines.append(f"Test Mode: {config['mode']}")
-	lines.append("")
-	lines.append("DETAILED RESULTS BY TEST:")
-	for i in range(config['num_tests']):
-		lines.append(f"Test {i+1}:")
-		lines.append(f"Smart Agent: {'WIN' if smart_results[i]['won'] else 'LOSE'} | Score: {smart_results[i]['score']} | Moves: {smart_results[i]['moves']}")
-		lines.append(f"Random Agent: {'WIN' if random_results[i]['won'] else 'LOSE'} | Score: {random_results[i]['score']} | Moves: {random_results[i]['moves']}")
-		lines.append("")
-	lines.append("SUMMARY STATISTICS:")
-	lines.append("Smart Agent (Hybrid):")
-	lines.append(f"Total Tests: {config['num_tests']}")
-	lines.append(f"Wins: {smart_wins}")
-	lines.append(f"Win Rate: {smart_wins/config['num_tests']*100:.1f}%")
-	lines.append(f"Average Score: {smart_avg_score:.2f}")
-	lines.append(f"Average Moves: {smart_avg_moves:.2f}")
-	lines.append("")
-	lines.append("Random Agent (Baseline):")
-	lines.append(f"Total Tests: {config['num_tests']}")
-	lines.append(f"Wins: {random_wins}")
-	lines.append(f"Win Rate: {random_wins/config['num_tests']*100:.1f}%")
-	lines.append(f"Average Score: {random_avg_score:.2f}")
-	lines.append(f"Average Moves: {random_avg_moves:.2f}")
-	lines.append("")
-	lines.append("CONCLUSION:")
-	lines.append(f"Smart Agent outperforms Random Agent by {(smart_wins-random_wins)/config['num_tests']*100:.1f} percentage points.")
-	output_dir = "Output"
-	os.makedirs(output_dir, exist_ok=True)
-	output_file = os.path.join(output_dir, "resultComparison.txt")
-	with open(output_file, 'w', encoding='utf-8') as f:
-		f.write("\n".join(lines))
-	print(f"✅ Results saved to: {output_file}")
+	run_comparison(config, workers=args.workers, chunksize=args.chunksize, results_file=args.results_file,
+				   resume=args.resume, early_stop=args.early_stop, min_games=args.min_games, progress=args.progress)
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,36 @@
+"""
+Map generator quality over a grid of sizes, wumpus counts and pit densities
+Run from the Source folder: python run_generator_stats.py --sizes 8 16 --pit-densities 0.2 0.4 --maps 500
+"""
+
+import argparse
+
+from Experiment.GeneratorStats import DEFAULT_GRID, format_table, generation_sweep
+from constants import ROOT_OUTPUT
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Wumpus World map generator quality stats")
+	parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_GRID['sizes'])
+	parser.add_argument('--num-wumpus', type=int, nargs='+', default=DEFAULT_GRID['num_wumpus'])
+	parser.add_argument('--pit-densities', type=float, nargs='+', default=DEFAULT_GRID['pit_densities'])
+	parser.add_argument('--maps', type=int, default=DEFAULT_GRID['maps_per_config'], help="maps per (N, K, p)")
+	parser.add_argument('--seed', type=int, default=DEFAULT_GRID['seed'])
+	parser.add_argument('--workers', type=int, default=1, help="worker processes (default: 1, 0 = CPU count)")
+	parser.add_argument('--no-analyze', action='store_true', help="skip the difficulty analysis of every map")
+	parser.add_argument('--output', default=ROOT_OUTPUT + "generatorStats.json")
+	args = parser.parse_args()
+
+	grid = {
+		'sizes': args.sizes,
+		'num_wumpus': args.num_wumpus,
+		'pit_densities': args.pit_densities,
+		'maps_per_config': args.maps,
+		'seed': args.seed
+	}
+	rows = generation_sweep(grid, args.workers or None, not args.no_analyze, args.output)
+	print("\n".join(format_table(rows)))
+
+
+if __name__ == '__main__':
+	main()
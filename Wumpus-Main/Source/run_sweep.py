@@ -0,0 +1,67 @@
+"""
+Sweep grid size x wumpus count x pit density and report how agents scale with N
+Run from the Source folder: python run_sweep.py --sizes 4:64:x2 --num-wumpus 1,2 --pit-densities 0.1:0.3:0.1
+"""
+
+import argparse
+
+from Experiment.Runner import AGENTS, BACKENDS
+from Experiment.Sweep import DEFAULT_SWEEP, parse_range, run_sweep
+from Run.PathPlanner import PLANNER_MODES
+from constants import ROOT_OUTPUT
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Wumpus World parameter sweep")
+	parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SWEEP['sizes'])),
+						help="grid sizes: list (4,8,16) or range (4:64:x2)")
+	parser.add_argument('--num-wumpus', default=','.join(map(str, DEFAULT_SWEEP['num_wumpus'])))
+	parser.add_argument('--pit-densities', default=','.join(map(str, DEFAULT_SWEEP['pit_densities'])))
+	parser.add_argument('--replications', type=int, default=DEFAULT_SWEEP['replications'])
+	parser.add_argument('--agents', nargs='+', choices=sorted(AGENTS), default=DEFAULT_SWEEP['agents'])
+	parser.add_argument('--backend', choices=sorted(BACKENDS), default=DEFAULT_SWEEP['backend'])
+	parser.add_argument('--planner-mode', choices=PLANNER_MODES, default=DEFAULT_SWEEP['planner_mode'],
+						help="how agents with a path planner plan their walk to the exit")
+	parser.add_argument('--seed', type=int, default=DEFAULT_SWEEP['seed'])
+	parser.add_argument('--workers', type=int, default=None,
+						help="worker processes on this machine (default: CPU count; 0 with --listen = remote only)")
+	parser.add_argument('--timeout', type=float, default=DEFAULT_SWEEP['time_limit'],
+						help="wall-clock limit per game in seconds")
+	parser.add_argument('--max-rss-mb', type=float, default=DEFAULT_SWEEP['memory_limit'],
+						help="memory limit per worker process in MB")
+	parser.add_argument('--results-file', default=ROOT_OUTPUT + "sweep.csv", help="per-game results, .csv or .jsonl")
+	parser.add_argument('--resume', action='store_true', help="skip games already in the results file")
+	parser.add_argument('--vectorized-random', action='store_true',
+						help="play the random agent with the NumPy batch simulator")
+	parser.add_argument('--profile', action='store_true',
+						help="profile every game, write Output/profile.txt, .collapsed (flame graph) and .prof")
+	parser.add_argument('--listen', default=None, metavar='HOST:PORT',
+						help="serve games to run_worker.py nodes on this address (or a Unix socket path)")
+	parser.add_argument('--authkey', default=None,
+						help="shared key for remote workers (default: fixed key on loopback, else a printed random key)")
+	args = parser.parse_args()
+
+	try:
+		axes = parse_range(args.sizes), parse_range(args.num_wumpus), parse_range(args.pit_densities, float)
+	except ValueError as error:
+		parser.error(str(error))
+	sweep = {
+		'sizes': axes[0],
+		'num_wumpus': axes[1],
+		'pit_densities': axes[2],
+		'replications': args.replications,
+		'agents': args.agents,
+		'backend': args.backend,
+		'planner_mode': args.planner_mode,
+		'seed': args.seed,
+		'time_limit': args.timeout,
+		'memory_limit': args.max_rss_mb,
+		'vectorized_random': args.vectorized_random,
+		'profile': args.profile
+	}
+	run_sweep(sweep, workers=args.workers, results_file=args.results_file, resume=args.resume,
+			  listen=args.listen, authkey=args.authkey.encode() if args.authkey else None)
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,34 @@
+"""
+Worker node for distributed sweeps - connects to a coordinator started with run_sweep.py --listen
+Run from the Source folder on each machine: python run_worker.py --connect coordinator-host:6000 --processes 8
+"""
+
+import argparse
+import multiprocessing
+
+from Experiment.Distributed import DEFAULT_AUTHKEY, parse_address, worker_main
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Wumpus World distributed worker")
+	parser.add_argument('--connect', required=True, metavar='HOST:PORT',
+						help="coordinator address (or a Unix socket path)")
+	parser.add_argument('--authkey', default=DEFAULT_AUTHKEY.decode(), help="shared key set (or printed) by the coordinator")
+	parser.add_argument('--processes', type=int, default=multiprocessing.cpu_count(),
+						help="games played in parallel on this machine (default: CPU count)")
+	parser.add_argument('--wait', type=float, default=60.0,
+						help="seconds to keep retrying while the coordinator is not up yet")
+	args = parser.parse_args()
+
+	address = parse_address(args.connect)
+	processes = [multiprocessing.Process(target=worker_main, args=(address, args.authkey.encode()),
+										  kwargs={'wait': args.wait})
+				 for _ in range(args.processes)]
+	for process in processes:
+		process.start()
+	for process in processes:
+		process.join()
+
+
+if __name__ == '__main__':
+	main()
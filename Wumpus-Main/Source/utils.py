@@ -1,5 +1,3 @@
-import pygame
-
 from constants import CELL_SIZE, ROOT_INPUT, MARGIN, HEIGHT
 
 
@@ -7,8 +5,11 @@ class Utils:
     def __init__(self):
         pass
 
+    # pygame is imported lazily so the solver (Run/*) can be used headless without a display
+
     @staticmethod
     def load_image_alpha(path: str, rotate: int = 0, size: int = CELL_SIZE):
+        import pygame
         image = pygame.image.load(path).convert_alpha()
         image = pygame.transform.scale(image, (size, size))
         image = pygame.transform.rotate(image, rotate)
@@ -16,25 +17,19 @@ class Utils:
 
     @staticmethod
     def load_image(path: str, rotate: int = 0, size: int = CELL_SIZE):
+        import pygame
         image = pygame.image.load(path).convert()
         image = pygame.transform.scale(image, (size, size))
         image = pygame.transform.rotate(image, rotate)
         return image
 
     @staticmethod
-    def readMapInFile(filename: str, cell_size, spacing_cell):
-        f = open(ROOT_INPUT + filename, "r")
-        # read N
-        x = f.readline().split()
-        N = int(x[0])
-        # end read N
-
-        # read info map
-        _map: list[list[str]] = []
-        for _ in range(N):
-            line = f.readline().split(".")
-            _map.append([x.replace('\n', '') for x in line])
-        f.close()
+    def readMapInFile(filename, cell_size, spacing_cell):
+        from Run.MapCache import load_map
+        from Run.WumpusMap import WumpusMap
+        # In-memory map, nothing to read; a map file comes parsed from the cache Base.read_map also uses
+        wumpus_map = filename if isinstance(filename, WumpusMap) else load_map(ROOT_INPUT + filename)
+        N, _map = wumpus_map.N, wumpus_map.cells
         MARGIN['TOP'] = (HEIGHT - N * cell_size - spacing_cell * (N + 1)) // 2
         MARGIN['LEFT'] = MARGIN['TOP']
         return N, _map